@@ -0,0 +1,102 @@
+"""Admin routes exposing runtime diagnostics."""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import get_db
+from app.repositories.lock_repo import LockRepository
+from app.schemas.admin import (
+    CacheStatsResponse,
+    ChangeListenerStatsResponse,
+    CircuitBreakerResponse,
+    EventBusStatsResponse,
+    HttpCacheStatsResponse,
+    HttpPoolStatsResponse,
+    JobStatusResponse,
+    LoopLagResponse,
+    PartitionStatsResponse,
+    RateBudgetResponse,
+    SchedulerLeaderResponse,
+)
+from app.services.change_listener import change_listener
+from app.services.event_bus import event_bus
+from app.services.http_client import circuit_breakers, http_pool, validator_cache
+from app.services.loop_monitor import loop_monitor
+from app.services.partition_service import PartitionService
+from app.services.rate_budget import rate_budget
+from app.tasks.scheduler import job_statuses, leader
+from app.utils.cache import cache_registry
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/http-pool", response_model=HttpPoolStatsResponse)
+async def http_pool_stats() -> HttpPoolStatsResponse:
+    """Get shared HTTP pool statistics (requests vs. new connections per host)."""
+    return HttpPoolStatsResponse(**http_pool.stats())
+
+
+@router.get("/http-cache", response_model=HttpCacheStatsResponse)
+async def http_cache_stats() -> HttpCacheStatsResponse:
+    """Get conditional GET hit/miss counters."""
+    return HttpCacheStatsResponse(**validator_cache.stats())
+
+
+@router.get("/circuit-breakers", response_model=list[CircuitBreakerResponse])
+async def circuit_breaker_stats() -> list[CircuitBreakerResponse]:
+    """Get the circuit breaker state of every upstream host contacted so far."""
+    return [CircuitBreakerResponse(**stats) for stats in circuit_breakers.stats()]
+
+
+@router.get("/rate-budget", response_model=list[RateBudgetResponse])
+async def rate_budget_stats() -> list[RateBudgetResponse]:
+    """Get quota usage per upstream API key (keys masked)."""
+    return [RateBudgetResponse(**stats) for stats in rate_budget.stats()]
+
+
+@router.get("/loop-lag", response_model=LoopLagResponse)
+async def loop_lag() -> LoopLagResponse:
+    """Get how long the event loop was recently blocked between wake-ups."""
+    return LoopLagResponse(**loop_monitor.stats())
+
+
+@router.get("/caches", response_model=list[CacheStatsResponse])
+async def cache_stats() -> list[CacheStatsResponse]:
+    """Get hit-rate metrics of all in-process response caches."""
+    return [CacheStatsResponse(**cache.stats()) for cache in cache_registry.values()]
+
+
+@router.get("/events", response_model=EventBusStatsResponse)
+async def event_bus_stats() -> EventBusStatsResponse:
+    """Get SSE subscriber and published event counters."""
+    return EventBusStatsResponse(**event_bus.stats())
+
+
+@router.get("/change-listener", response_model=ChangeListenerStatsResponse)
+async def change_listener_stats() -> ChangeListenerStatsResponse:
+    """Get the status of this worker's LISTEN connection for cross-worker changes."""
+    return ChangeListenerStatsResponse(**change_listener.stats())
+
+
+@router.get("/partitions", response_model=list[PartitionStatsResponse])
+async def partition_stats(db: AsyncSession = Depends(get_db)) -> list[PartitionStatsResponse]:
+    """List daily partitions of iss_fetch_log and space_cache with their sizes."""
+    return await PartitionService(db).get_stats()
+
+
+@router.get("/scheduler/leader", response_model=SchedulerLeaderResponse)
+async def scheduler_leader(db: AsyncSession = Depends(get_db)) -> SchedulerLeaderResponse:
+    """Get which worker currently runs the scheduled jobs."""
+    holder = await LockRepository(db).get_advisory_holder(settings.scheduler_lock_key)
+    return SchedulerLeaderResponse(
+        election_enabled=settings.scheduler_leader_election,
+        leader=holder,
+        **leader.stats(),
+    )
+
+
+@router.get("/jobs", response_model=list[JobStatusResponse])
+async def jobs() -> list[JobStatusResponse]:
+    """Get each background job's next run, last duration and failure streak."""
+    return [JobStatusResponse(**status) for status in job_statuses()]
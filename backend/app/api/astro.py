@@ -3,9 +3,10 @@
 from typing import Annotated, Any
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
 
 from app.services.astro_service import AstroService
+from app.services.http_client import CircuitOpenError
+from app.utils.fast_json import ORJSONResponse
 
 router = APIRouter(prefix="/astro", tags=["Astronomy"])
 
@@ -34,8 +35,14 @@ async def astro_events(
             days=days,
         )
         # Return raw response as passthrough
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Astronomy API unavailable: {e}",
+            headers={"Retry-After": str(int(e.retry_after) + 1)},
+        ) from e
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Astronomy API error: {e}") from e
@@ -0,0 +1,46 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.services.event_bus import TOPICS, event_bus
+
+router = APIRouter(tags=["Events"])
+
+
+@router.get("/events")
+async def events(
+    topics: Annotated[
+        str, Query(description="Comma-separated topics: iss, space, osdr")
+    ] = ",".join(TOPICS),
+    last_event_id: Annotated[
+        str | None, Query(description="Resume after this event id")
+    ] = None,
+    last_event_id_header: Annotated[str | None, Header(alias="Last-Event-ID")] = None,
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of data updates.
+
+    - **iss**: a new ISS sample was stored (same shape as ``/last``)
+    - **space**: a new ``space_cache`` row was written (``source``, ``at``)
+    - **osdr**: an OSDR sync wrote items (counts)
+    - **resync**: missed events could not be replayed; reload all data
+
+    Reconnecting clients resume from ``Last-Event-ID`` (sent automatically by
+    ``EventSource``) or the ``last_event_id`` query parameter. Ids are only
+    valid on the worker that issued them; elsewhere the client gets ``resync``.
+    """
+    selected = {topic.strip().lower() for topic in topics.split(",") if topic.strip()}
+    unknown = selected - set(TOPICS)
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown topics: {', '.join(sorted(unknown))}" if unknown else "No topics",
+        )
+
+    resume_from = last_event_id_header if last_event_id_header is not None else last_event_id
+    return StreamingResponse(
+        event_bus.stream(selected, resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,26 +1,42 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime, timedelta, timezone
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_db
-from app.schemas.iss import ISSResponse, TrendResponse
+from app.schemas.iss import (
+    ISSHistoryResponse,
+    ISSPositionResponse,
+    ISSResponse,
+    ISSStatsResponse,
+    TrendResponse,
+)
 from app.services.iss_service import ISSService
 
 router = APIRouter()
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive query datetimes as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
 @router.get("/last", response_model=ISSResponse)
-async def last_iss(db: AsyncSession = Depends(get_db)) -> ISSResponse:
+async def last_iss(db: AsyncSession = Depends(get_db)) -> Response:
     """Get the most recent ISS position data."""
     service = ISSService(db)
-    return await service.get_latest()
+    return Response(await service.render_latest(), media_type="application/json")
 
 
 @router.get("/fetch", response_model=ISSResponse)
-async def fetch_iss(db: AsyncSession = Depends(get_db)) -> ISSResponse:
-    """Trigger immediate ISS data fetch and return result."""
-    service = ISSService(db)
-    await service.fetch_and_store()
-    return await service.get_latest()
+async def fetch_iss() -> ISSResponse:
+    """Trigger immediate ISS data fetch and return result.
+
+    Concurrent requests share a single upstream call.
+    """
+    return await ISSService.fetch_now()
 
 
 @router.get("/iss/trend", response_model=TrendResponse)
@@ -28,3 +44,101 @@ async def iss_trend(db: AsyncSession = Depends(get_db)) -> TrendResponse:
     """Calculate ISS movement trend from last two records."""
     service = ISSService(db)
     return await service.get_trend()
+
+
+@router.get("/iss/history", response_model=ISSHistoryResponse)
+async def iss_history(
+    from_: Annotated[
+        datetime | None, Query(alias="from", description="Range start (default: 24h before 'to')")
+    ] = None,
+    to: Annotated[datetime | None, Query(description="Range end (default: now)")] = None,
+    max_points: Annotated[
+        int, Query(ge=2, le=5000, description="Maximum number of points returned")
+    ] = 500,
+    db: AsyncSession = Depends(get_db),
+) -> ISSHistoryResponse:
+    """
+    Get the ISS ground track for a time range, downsampled on the server.
+
+    - **from** / **to**: ISO 8601 range (default: last 24 hours)
+    - **max_points**: Upper bound on returned points (2-5000, default 500)
+    """
+    end = _as_utc(to) if to else datetime.now(timezone.utc)
+    start = _as_utc(from_) if from_ else end - timedelta(hours=24)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="'from' must be earlier than 'to'")
+
+    service = ISSService(db)
+    return await service.get_history(start, end, max_points)
+
+
+@router.get("/iss/stats", response_model=ISSStatsResponse)
+async def iss_stats(
+    from_: Annotated[
+        datetime | None, Query(alias="from", description="Range start (default: 24h before 'to')")
+    ] = None,
+    to: Annotated[datetime | None, Query(description="Range end (default: now)")] = None,
+    db: AsyncSession = Depends(get_db),
+) -> ISSStatsResponse:
+    """
+    Get ISS track statistics for a time range: ground distance, segment speeds,
+    reported velocity, outliers and data gaps.
+
+    - **from** / **to**: ISO 8601 range (default: last 24 hours)
+    """
+    end = _as_utc(to) if to else datetime.now(timezone.utc)
+    start = _as_utc(from_) if from_ else end - timedelta(hours=24)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="'from' must be earlier than 'to'")
+
+    service = ISSService(db)
+    return await service.get_stats(start, end)
+
+
+@router.get("/iss/position", response_model=ISSPositionResponse)
+async def iss_position(
+    at: Annotated[
+        list[datetime] | None, Query(description="Timestamps to estimate (repeatable)")
+    ] = None,
+    from_: Annotated[datetime | None, Query(alias="from", description="Series start")] = None,
+    to: Annotated[datetime | None, Query(description="Series end")] = None,
+    step: Annotated[
+        float, Query(gt=0, le=3600, description="Series step in seconds")
+    ] = 5.0,
+    db: AsyncSession = Depends(get_db),
+) -> ISSPositionResponse:
+    """
+    Estimate the ISS position between and shortly after stored samples,
+    without calling the upstream API.
+
+    - **at**: One or more ISO 8601 timestamps (default: now)
+    - **from** / **to** / **step**: Alternatively, a series of timestamps
+    """
+    if at and (from_ or to):
+        raise HTTPException(status_code=400, detail="Use either 'at' or 'from'/'to'")
+
+    if from_ or to:
+        if not (from_ and to):
+            raise HTTPException(status_code=400, detail="'from' and 'to' are both required")
+        start, end = _as_utc(from_), _as_utc(to)
+        if start > end:
+            raise HTTPException(status_code=400, detail="'from' must not be later than 'to'")
+        count = int((end - start).total_seconds() // step) + 1
+        if count > settings.iss_position_max_points:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Series exceeds {settings.iss_position_max_points} points",
+            )
+        timestamps = [start + timedelta(seconds=step * i) for i in range(count)]
+    elif at:
+        if len(at) > settings.iss_position_max_points:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {settings.iss_position_max_points} timestamps allowed",
+            )
+        timestamps = [_as_utc(value) for value in at]
+    else:
+        timestamps = [datetime.now(timezone.utc)]
+
+    service = ISSService(db)
+    return await service.get_positions(timestamps)
@@ -5,11 +5,21 @@ from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query
 
+from app.config import settings
 from app.schemas.jwst import JWSTFeedResponse
+from app.services.http_client import CircuitOpenError, circuit_breakers
 from app.services.jwst_service import JWSTService
+from app.utils.cache import SWRCache
 
 router = APIRouter(prefix="/jwst", tags=["JWST"])
 
+feed_cache = SWRCache(
+    "jwst_feed",
+    max_size=settings.jwst_cache_max_size,
+    ttl=settings.jwst_cache_ttl,
+    stale_ttl=settings.jwst_cache_stale_ttl,
+)
+
 
 class JWSTSource(str, Enum):
     """Valid JWST feed source types."""
@@ -38,6 +48,9 @@ async def jwst_feed(
         JWSTInstrument | None, Query(description="Instrument filter")
     ] = None,
     perPage: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 24,
+    cursor: Annotated[
+        str | None, Query(description="Cursor from a previous response's next_cursor")
+    ] = None,
 ) -> JWSTFeedResponse:
     """
     Get JWST image feed.
@@ -47,6 +60,12 @@ async def jwst_feed(
     - **program**: Required when source='program', specifies the program ID
     - **instrument**: Optional filter by JWST instrument
     - **perPage**: Number of items to return (1-100, default 24)
+    - **cursor**: Continue from a previous response's `next_cursor`
+
+    Responses are cached per parameter set; stale entries are served
+    immediately while being refreshed in the background. While the JWST API's
+    circuit breaker is open, stale entries are served without a refresh and
+    misses fail fast with 503.
     """
     # Validate suffix/program requirements
     if source == JWSTSource.SUFFIX and not suffix:
@@ -60,20 +79,36 @@ async def jwst_feed(
             detail="Parameter 'program' is required when source='program'",
         )
 
-    service = JWSTService()
+    instrument_value = instrument.value if instrument else None
 
-    try:
-        result = await service.get_feed(
+    async def load() -> JWSTFeedResponse:
+        result = await JWSTService().get_feed(
             source=source.value,
             suffix=suffix,
             program=program,
-            instrument=instrument.value if instrument else None,
+            instrument=instrument_value,
             per_page=perPage,
+            cursor=cursor,
         )
         return JWSTFeedResponse(
             source=result["source"],
             count=result["count"],
             items=result["items"],
+            next_cursor=result["next_cursor"],
         )
+
+    key = (source.value, suffix, program, instrument_value, perPage, cursor)
+    if circuit_breakers.is_open(settings.jwst_url):
+        cached = feed_cache.get(key, allow_stale=True)
+        if cached is not None:
+            return cached
+    try:
+        return await feed_cache.get_or_load(key, load)
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"JWST API unavailable: {e}",
+            headers={"Retry-After": str(int(e.retry_after) + 1)},
+        ) from e
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"JWST API error: {e}") from e
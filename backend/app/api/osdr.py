@@ -1,19 +1,26 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.database import get_db
 from app.schemas.osdr import OSDRListResponse, OSDRSyncResponse
 from app.services.osdr_service import OSDRService
+from app.services.rate_budget import RateBudgetExceeded
 
 router = APIRouter(prefix="/osdr", tags=["OSDR"])
 
 
 @router.get("/sync", response_model=OSDRSyncResponse)
-async def osdr_sync(db: AsyncSession = Depends(get_db)) -> OSDRSyncResponse:
+async def osdr_sync() -> OSDRSyncResponse:
     """Trigger OSDR data sync and return count of written items."""
-    service = OSDRService(db)
-    return await service.sync()
+    try:
+        return await OSDRService.sync()
+    except RateBudgetExceeded as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(int(e.retry_after) + 1)},
+        ) from e
 
 
 @router.get("/list", response_model=OSDRListResponse)
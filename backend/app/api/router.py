@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
+from app.api.admin import router as admin_router
 from app.api.astro import router as astro_router
+from app.api.events import router as events_router
 from app.api.health import router as health_router
 from app.api.iss import router as iss_router
 from app.api.jwst import router as jwst_router
@@ -16,3 +18,5 @@ router.include_router(osdr_router)
 router.include_router(space_router)
 router.include_router(jwst_router)
 router.include_router(astro_router)
+router.include_router(events_router)
+router.include_router(admin_router)
@@ -1,49 +1,67 @@
-from fastapi import APIRouter, Depends, Query
+import asyncio
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import async_session, get_db
 from app.repositories.iss_repo import ISSRepository
+from app.repositories.space_cache_repo import SpaceCacheRepository
 from app.schemas.space import SpaceLatestResponse, SpaceRefreshResponse, SpaceSummaryResponse
 from app.services.osdr_service import OSDRService
-from app.services.space_service import SpaceService
+from app.services.space_service import SUMMARY_SOURCES, SpaceService
+from app.utils.raw_json import RawJSON, render_object
 
 router = APIRouter(prefix="/space", tags=["Space Cache"])
 
 
 @router.get("/{src}/latest", response_model=SpaceLatestResponse)
-async def space_latest(
-    src: str, db: AsyncSession = Depends(get_db)
-) -> SpaceLatestResponse:
-    """Get latest cached data for a specific source (apod, neo, flr, cme, spacex)."""
+async def space_latest(src: str, db: AsyncSession = Depends(get_db)) -> Response:
+    """Get latest cached data for a specific source (apod, neo, flr, cme, spacex).
+
+    The payload is passed through from JSONB without being decoded.
+    """
     service = SpaceService(db)
-    return await service.get_latest(src)
+    return Response(await service.render_latest(src), media_type="application/json")
 
 
 @router.get("/refresh", response_model=SpaceRefreshResponse)
 async def space_refresh(
     src: str = Query(default="apod,neo,flr,cme,spacex"),
-    db: AsyncSession = Depends(get_db),
 ) -> SpaceRefreshResponse:
-    """Refresh specified data sources. Query param: src=apod,neo,flr,cme,spacex"""
-    service = SpaceService(db)
+    """Refresh specified data sources concurrently. Query param: src=apod,neo,flr,cme,spacex"""
     sources = [s.strip() for s in src.split(",") if s.strip()]
-    return await service.refresh(sources)
+    return await SpaceService.refresh(sources)
+
+
+async def _load_iss() -> dict[str, Any]:
+    async with async_session() as session:
+        row = await ISSRepository(session).get_latest_raw()
+    if row:
+        return {"at": row.fetched_at, "payload": RawJSON(row.payload)}
+    return {}
+
+
+async def _load_osdr_count() -> int:
+    async with async_session() as session:
+        return await OSDRService(session).get_count()
+
+
+async def _load_space_latest() -> dict[str, dict[str, Any]]:
+    async with async_session() as session:
+        return await SpaceCacheRepository(session).get_latest_many_raw(SUMMARY_SOURCES)
 
 
 @router.get("/summary", response_model=SpaceSummaryResponse)
-async def space_summary(db: AsyncSession = Depends(get_db)) -> SpaceSummaryResponse:
-    """Get summary of all cached data sources plus ISS and OSDR count."""
-    space_service = SpaceService(db)
-    osdr_service = OSDRService(db)
-    iss_repo = ISSRepository(db)
-
-    # Get ISS data
-    iss_log = await iss_repo.get_latest()
-    iss_data = {}
-    if iss_log:
-        iss_data = {"at": iss_log.fetched_at, "payload": iss_log.payload}
-
-    # Get OSDR count
-    osdr_count = await osdr_service.get_count()
-
-    return await space_service.get_summary(iss_data, osdr_count)
+async def space_summary() -> Response:
+    """Get summary of all cached data sources plus ISS and OSDR count.
+
+    The three reads (ISS, OSDR count, latest row per source) are independent,
+    so each runs concurrently on its own pooled connection. Payloads are
+    passed through from JSONB without being decoded.
+    """
+    latest, iss_data, osdr_count = await asyncio.gather(
+        _load_space_latest(), _load_iss(), _load_osdr_count()
+    )
+    body = render_object({**latest, "iss": iss_data, "osdr_count": osdr_count})
+    return Response(body, media_type="application/json")
@@ -1,6 +1,16 @@
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class JobPolicy(BaseModel):
+    """Per-job overrides of the ``job_*`` scheduling defaults (None = default)."""
+
+    jitter: float | None = None
+    retry_base: float | None = None
+    backoff_factor: float | None = None
+    backoff_max: float | None = None
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -14,6 +24,13 @@ class Settings(BaseSettings):
 
     # NASA APIs (APOD, NeoWs, DONKI, OSDR)
     nasa_api_key: str = ""
+    # Hourly quota per key (DEMO_KEY is used when no key is set). Manual calls
+    # (/space/refresh, /osdr/sync) leave reserve_ratio of it to scheduled
+    # fetches, waiting up to max_wait seconds for tokens before giving up
+    nasa_rate_limit_per_hour: int = 1000
+    nasa_demo_rate_limit_per_hour: int = 30
+    nasa_rate_reserve_ratio: float = 0.2
+    nasa_rate_max_wait: float = 5.0
 
     # JWST API
     jwst_api_key: str = ""
@@ -31,6 +48,77 @@ class Settings(BaseSettings):
     spacex_fetch_interval: int = 3600 # 1h
     osdr_fetch_interval: int = 600    # 10min
 
+    # On-demand fetches (/fetch, /osdr/sync, /space/refresh) reuse a result
+    # younger than this many seconds instead of calling upstream again (0 = off)
+    fetch_min_interval: float = 0.0
+
+    # /space/refresh fan-out
+    space_refresh_concurrency: int = 3
+    space_refresh_timeout: float = 45.0
+
+    # /jwst/feed upstream paging: pages per request, and concurrent pages per batch
+    jwst_max_pages: int = 6
+    jwst_concurrent_pages: int = 3
+
+    # /jwst/feed response cache (seconds)
+    jwst_cache_ttl: float = 300.0
+    jwst_cache_stale_ttl: float = 3600.0
+    jwst_cache_max_size: int = 256
+
+    # /astro/events cache: coordinates snap to a grid of this many degrees
+    astro_grid_deg: float = 0.05
+    astro_cache_prefetch_days: int = 7
+    astro_cache_max_size: int = 512
+    # Expired /astro/events entries are kept this long to answer while the
+    # Astronomy API is unavailable
+    astro_cache_stale_ttl: float = 86400.0
+
+    # Recent ISS samples kept in memory for /last and /iss/trend (720 = 1 day at 120s)
+    iss_buffer_size: int = 720
+
+    # /iss/stats: intervals longer than this are gaps, faster segments are outliers
+    iss_gap_seconds: float = 600.0
+    iss_outlier_speed_kmh: float = 40000.0
+
+    # /iss/position: how far past the newest sample to extrapolate, and series size
+    iss_max_extrapolation_sec: float = 600.0
+    iss_position_max_points: int = 500
+
+    # Daily partitions of iss_fetch_log/space_cache: created ahead of time and
+    # dropped once older than the retention window (0 = keep forever)
+    partition_premake_days: int = 3
+    partition_maintenance_interval: int = 3600
+    iss_retention_days: int = 30
+    space_cache_retention_days: int = 90
+    # Keep hourly ISS aggregates in iss_hourly when raw partitions are dropped
+    iss_rollup_enabled: bool = True
+
+    # /events SSE stream: replayable history, per-client backlog, keep-alive
+    events_replay_size: int = 500
+    events_max_queue: int = 100
+    events_heartbeat_interval: float = 15.0
+    events_retry_ms: int = 3000
+
+    # Cross-worker change notifications (Postgres LISTEN/NOTIFY)
+    change_channel: str = "data_changes"
+    change_listener_ping_interval: float = 30.0
+
+    # Only the worker holding this Postgres advisory lock runs scheduled jobs
+    scheduler_leader_election: bool = True
+    scheduler_lock_key: int = 310_001
+    scheduler_leader_poll_interval: float = 5.0
+
+    # Scheduled job policy. Runs are spread by up to jitter_ratio * interval;
+    # after a failure the next run is a recovery probe retry_base seconds later,
+    # growing by backoff_factor per consecutive failure up to backoff_max
+    # (or later if upstream sent Retry-After). Per-job overrides, e.g.
+    # JOB_POLICIES='{"fetch_osdr": {"jitter": 60, "backoff_max": 7200}}'
+    job_jitter_ratio: float = 0.05
+    job_retry_base: float = 60.0
+    job_backoff_factor: float = 2.0
+    job_backoff_max: float = 1800.0
+    job_policies: dict[str, JobPolicy] = {}
+
     # API URLs
     iss_url: str = "https://api.wheretheiss.at/v1/satellites/25544"
     osdr_url: str = "https://visualization.osdr.nasa.gov/biodata/api/v2/datasets/?format=json"
@@ -44,6 +132,33 @@ class Settings(BaseSettings):
 
     # OSDR list limit
     osdr_list_limit: int = 20
+    # Rows per multi-row INSERT ... ON CONFLICT statement during OSDR sync
+    osdr_upsert_chunk_size: int = 500
+
+    # Shared HTTP connection pool
+    http_max_connections: int = 50
+    http_max_keepalive_connections: int = 20
+    http_max_connections_per_host: int = 10
+    http_keepalive_expiry: float = 30.0
+    http2_enabled: bool = True
+
+    # Upstream GET retries (transport errors, 502/503/504, short Retry-After)
+    # with full-jitter exponential backoff: up to min(max, backoff * 2^attempt)
+    http_retries: int = 2
+    http_retry_backoff: float = 0.5
+    http_retry_backoff_max: float = 10.0
+    # Per-host circuit breaker: opens after this many consecutive failures and
+    # lets one probe request through after reset_timeout seconds
+    http_breaker_threshold: int = 5
+    http_breaker_reset_timeout: float = 30.0
+
+    # OSDR catalogs with at least this many items run change detection in a
+    # worker thread, so the event loop keeps serving requests in between
+    osdr_offload_min_items: int = 200
+
+    # Event loop lag sampling (/admin/loop-lag); lags above warn_ms are logged
+    loop_lag_interval: float = 0.5
+    loop_lag_warn_ms: float = 100.0
 
 
 settings = Settings()
@@ -1,5 +1,8 @@
-from typing import AsyncGenerator
+import json
+from typing import Any, AsyncGenerator
 
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import settings
@@ -11,6 +14,29 @@ engine = create_async_engine(
     max_overflow=10,
 )
 
+# Additive changes for tables created by earlier versions (create_all never alters)
+SCHEMA_UPGRADES = [
+    "ALTER TABLE osdr_items ADD COLUMN IF NOT EXISTS content_hash TEXT",
+    "ALTER TABLE iss_fetch_log"
+    " ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION,"
+    " ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION,"
+    " ADD COLUMN IF NOT EXISTS altitude DOUBLE PRECISION,"
+    " ADD COLUMN IF NOT EXISTS velocity DOUBLE PRECISION,"
+    " ADD COLUMN IF NOT EXISTS visibility TEXT,"
+    " ADD COLUMN IF NOT EXISTS telemetry_extracted BOOLEAN",
+    # Separate from ADD COLUMN so existing rows stay NULL, i.e. not yet scanned
+    "ALTER TABLE iss_fetch_log ALTER COLUMN telemetry_extracted SET DEFAULT true",
+    "CREATE INDEX IF NOT EXISTS ix_iss_fetch_log_unextracted ON iss_fetch_log (id)"
+    " WHERE latitude IS NULL AND telemetry_extracted IS NOT TRUE",
+    "CREATE INDEX IF NOT EXISTS ix_iss_fetch_log_fetched_at"
+    " ON iss_fetch_log USING brin (fetched_at)",
+    "ALTER TABLE space_cache"
+    " ADD COLUMN IF NOT EXISTS checked_at TIMESTAMP WITH TIME ZONE,"
+    " ADD COLUMN IF NOT EXISTS payload_hash TEXT,"
+    " ALTER COLUMN payload DROP NOT NULL",
+    "CREATE INDEX IF NOT EXISTS ix_space_cache_payload_hash ON space_cache (payload_hash)",
+]
+
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -18,14 +44,48 @@ async_session = async_sessionmaker(
 )
 
 
+def asyncpg_dsn() -> str:
+    """Plain asyncpg DSN for dedicated connections outside the SQLAlchemy pool."""
+    url = make_url(settings.database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+# NOTIFY payloads must stay below 8000 bytes
+_NOTIFY_MAX_BYTES = 7900
+
+
+async def notify_change(session: AsyncSession, topic: str, data: dict[str, Any]) -> None:
+    """Queue a change notification on ``settings.change_channel``.
+
+    Postgres delivers it to every listening worker only when the surrounding
+    transaction commits, so call this before ``commit()``. Oversized data is
+    replaced by ``{"truncated": true}``; listeners then reload from the table.
+    """
+    message = json.dumps({"topic": topic, "data": data}, default=str)
+    if len(message.encode()) > _NOTIFY_MAX_BYTES:
+        message = json.dumps({"topic": topic, "data": {"truncated": True}})
+    await session.execute(select(func.pg_notify(settings.change_channel, message)))
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
 
 
 async def init_db() -> None:
-    """Initialize database tables."""
+    """Initialize database tables.
+
+    Plain ``iss_fetch_log``/``space_cache`` tables from earlier versions are
+    renamed before ``create_all`` builds the partitioned parents, then
+    attached back as their oldest partition.
+    """
     from app.models.base import Base
+    from app.services.partition_service import PartitionService
 
+    await PartitionService.rename_legacy_tables()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        for statement in SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
+    await PartitionService.attach_legacy_tables()
+    await PartitionService.run_maintenance()
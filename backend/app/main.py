@@ -6,6 +6,10 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import router
 from app.database import init_db
+from app.services.change_listener import change_listener
+from app.services.http_client import http_pool
+from app.services.iss_service import ISSService
+from app.services.loop_monitor import loop_monitor
 from app.tasks import shutdown_scheduler, start_scheduler
 
 # Configure logging
@@ -21,8 +25,14 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
     logger.info("Starting application...")
+    loop_monitor.start()
     await init_db()
     logger.info("Database initialized")
+    # Every worker serves ISS reads from its own buffer, leader or not
+    warmed = await ISSService.warm_buffer()
+    logger.info(f"ISS buffer warmed with {warmed} samples")
+    change_listener.start()
+    http_pool.open()
     start_scheduler()
     logger.info("Scheduler started")
 
@@ -30,8 +40,11 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down application...")
-    shutdown_scheduler()
+    await shutdown_scheduler()
     logger.info("Scheduler stopped")
+    await change_listener.stop()
+    await http_pool.close()
+    await loop_monitor.stop()
 
 
 app = FastAPI(
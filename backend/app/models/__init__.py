@@ -1,6 +1,6 @@
 from app.models.base import Base
-from app.models.iss import ISSFetchLog
+from app.models.iss import ISSFetchLog, ISSHourly
 from app.models.osdr import OSDRItem
-from app.models.space_cache import SpaceCache
+from app.models.space_cache import SpaceCache, SpacePayload
 
-__all__ = ["Base", "ISSFetchLog", "OSDRItem", "SpaceCache"]
+__all__ = ["Base", "ISSFetchLog", "ISSHourly", "OSDRItem", "SpaceCache", "SpacePayload"]
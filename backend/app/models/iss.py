@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import BigInteger, DateTime, Text, func
+from sqlalchemy import BigInteger, Boolean, DateTime, Float, Index, Integer, Text, func, true
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,9 +10,55 @@ from app.models.base import Base
 class ISSFetchLog(Base):
     __tablename__ = "iss_fetch_log"
 
+    # Partitioned by day on fetched_at, so the partition key is part of the PK
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     fetched_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
     )
     source_url: Mapped[str] = mapped_column(Text, nullable=False)
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    # Telemetry extracted from payload at insert time, so range and aggregate
+    # queries do not need to decode JSONB
+    latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    altitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    velocity: Mapped[float | None] = mapped_column(Float, nullable=True)
+    visibility: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # NULL on rows stored before the telemetry columns existed, until the
+    # backfill has looked at them (even if their payload had no telemetry)
+    telemetry_extracted: Mapped[bool | None] = mapped_column(
+        Boolean, nullable=True, server_default=true()
+    )
+
+    __table_args__ = (
+        # Rows are appended in time order, so a BRIN index stays tiny
+        Index("ix_iss_fetch_log_fetched_at", "fetched_at", postgresql_using="brin"),
+        # Only rows still waiting for the backfill, empty once it has run
+        Index(
+            "ix_iss_fetch_log_unextracted",
+            "id",
+            postgresql_where=latitude.is_(None) & telemetry_extracted.is_not(True),
+        ),
+        {"postgresql_partition_by": "RANGE (fetched_at)"},
+    )
+
+
+class ISSHourly(Base):
+    """Hourly ISS aggregates, kept after raw partitions expire."""
+
+    __tablename__ = "iss_hourly"
+
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    samples: Mapped[int] = mapped_column(Integer, nullable=False)
+    first_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    first_latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    first_longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    last_latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    last_longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    avg_altitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    min_altitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    max_altitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    avg_velocity: Mapped[float | None] = mapped_column(Float, nullable=True)
+    max_velocity: Mapped[float | None] = mapped_column(Float, nullable=True)
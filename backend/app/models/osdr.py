@@ -21,6 +21,7 @@ class OSDRItem(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     raw: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     __table_args__ = (
         Index(
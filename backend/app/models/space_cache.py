@@ -2,21 +2,56 @@ from datetime import datetime
 
 from sqlalchemy import BigInteger, DateTime, Index, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
 
 
+class SpacePayload(Base):
+    """A distinct upstream payload, stored once and keyed by its content hash."""
+
+    __tablename__ = "space_payloads"
+
+    hash: Mapped[str] = mapped_column(Text, primary_key=True)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Bumped whenever a new cache row references the payload; guards GC races
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
 class SpaceCache(Base):
     __tablename__ = "space_cache"
 
+    # Partitioned by day on fetched_at, so the partition key is part of the PK
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     source: Mapped[str] = mapped_column(Text, nullable=False)
     fetched_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
+    )
+    # Last time upstream returned this same payload again (no new row written)
+    checked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    payload_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Inline payload of rows written before payloads were deduplicated
+    inline_payload: Mapped[dict | None] = mapped_column("payload", JSONB, nullable=True)
+
+    blob: Mapped[SpacePayload | None] = relationship(
+        primaryjoin="foreign(SpaceCache.payload_hash) == SpacePayload.hash",
+        lazy="joined",
+        viewonly=True,
     )
-    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
     __table_args__ = (
         Index("ix_space_cache_source", "source", fetched_at.desc()),
+        Index("ix_space_cache_payload_hash", "payload_hash"),
+        {"postgresql_partition_by": "RANGE (fetched_at)"},
     )
+
+    @property
+    def payload(self) -> dict | None:
+        return self.blob.payload if self.blob is not None else self.inline_payload
+
+    @property
+    def last_checked_at(self) -> datetime:
+        """When upstream last returned this payload."""
+        return self.checked_at or self.fetched_at
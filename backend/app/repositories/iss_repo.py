@@ -1,10 +1,32 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Float, Row, Text, cast, func, select, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import notify_change
 from app.models.iss import ISSFetchLog
+from app.utils.json_extract import extract_number, extract_string
+
+# Numeric payload field -> double precision, NULL when missing or not numeric
+_NUMERIC_FIELD_SQL = (
+    "CASE WHEN payload->>'{key}' ~ '^\\s*-?[0-9]+(\\.[0-9]+)?([eE][-+]?[0-9]+)?\\s*$'"
+    " THEN (payload->>'{key}')::double precision END"
+)
+
+_BACKFILL_SQL = text(
+    f"""
+    UPDATE iss_fetch_log SET
+        latitude = {_NUMERIC_FIELD_SQL.format(key="latitude")},
+        longitude = {_NUMERIC_FIELD_SQL.format(key="longitude")},
+        altitude = {_NUMERIC_FIELD_SQL.format(key="altitude")},
+        velocity = {_NUMERIC_FIELD_SQL.format(key="velocity")},
+        visibility = payload->>'visibility',
+        telemetry_extracted = true
+    WHERE id >= :lo AND id < :hi AND latitude IS NULL AND telemetry_extracted IS NOT TRUE
+    """
+)
 
 
 class ISSRepository:
@@ -12,11 +34,33 @@ class ISSRepository:
         self.session = session
 
     async def insert(self, source_url: str, payload: dict[str, Any]) -> ISSFetchLog:
-        """Insert new ISS fetch log entry."""
-        log = ISSFetchLog(source_url=source_url, payload=payload)
+        """Insert new ISS fetch log entry with telemetry columns extracted."""
+        log = ISSFetchLog(
+            source_url=source_url,
+            payload=payload,
+            latitude=extract_number(payload, "latitude"),
+            longitude=extract_number(payload, "longitude"),
+            altitude=extract_number(payload, "altitude"),
+            velocity=extract_number(payload, "velocity"),
+            visibility=extract_string(payload, ["visibility"]),
+        )
         self.session.add(log)
+        await self.session.flush()
+        await notify_change(
+            self.session,
+            "iss",
+            {
+                "id": log.id,
+                "fetched_at": log.fetched_at,
+                "source_url": log.source_url,
+                "payload": log.payload,
+                "latitude": log.latitude,
+                "longitude": log.longitude,
+                "altitude": log.altitude,
+                "velocity": log.velocity,
+            },
+        )
         await self.session.commit()
-        await self.session.refresh(log)
         return log
 
     async def get_latest(self) -> ISSFetchLog | None:
@@ -25,8 +69,93 @@ class ISSRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_last_two(self) -> list[ISSFetchLog]:
-        """Get the two most recent ISS fetch log entries for trend calculation."""
-        stmt = select(ISSFetchLog).order_by(ISSFetchLog.id.desc()).limit(2)
+    async def get_latest_raw(self) -> Row | None:
+        """Get id, fetched_at, source_url and the payload as JSON text of the newest entry."""
+        stmt = (
+            select(
+                ISSFetchLog.id,
+                ISSFetchLog.fetched_at,
+                ISSFetchLog.source_url,
+                cast(ISSFetchLog.payload, Text).label("payload"),
+            )
+            .order_by(ISSFetchLog.id.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.first()
+
+    async def get_recent(self, limit: int) -> list[ISSFetchLog]:
+        """Get up to ``limit`` most recent entries, newest first."""
+        stmt = select(ISSFetchLog).order_by(ISSFetchLog.id.desc()).limit(limit)
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def get_last_two_samples(self) -> list[Row]:
+        """Get telemetry of the two most recent entries, newest first, without payloads."""
+        stmt = (
+            select(
+                ISSFetchLog.fetched_at,
+                ISSFetchLog.latitude,
+                ISSFetchLog.longitude,
+                ISSFetchLog.velocity,
+            )
+            .order_by(ISSFetchLog.id.desc())
+            .limit(2)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_sample_arrays(
+        self, start: datetime, end: datetime
+    ) -> tuple[list[float], list[float], list[float], list[float | None], list[float | None]]:
+        """Get (epochs, latitudes, longitudes, altitudes, velocities) for a time range.
+
+        Samples are ordered oldest first. Each column comes back as one Postgres array in a single row, which
+        decodes far faster than one Python row per sample.
+        """
+        order = ISSFetchLog.fetched_at
+        stmt = select(
+            func.array_agg(
+                aggregate_order_by(cast(func.extract("epoch", ISSFetchLog.fetched_at), Float), order)
+            ),
+            func.array_agg(aggregate_order_by(ISSFetchLog.latitude, order)),
+            func.array_agg(aggregate_order_by(ISSFetchLog.longitude, order)),
+            func.array_agg(aggregate_order_by(ISSFetchLog.altitude, order)),
+            func.array_agg(aggregate_order_by(ISSFetchLog.velocity, order)),
+        ).where(
+            ISSFetchLog.fetched_at >= start,
+            ISSFetchLog.fetched_at <= end,
+            ISSFetchLog.latitude.isnot(None),
+            ISSFetchLog.longitude.isnot(None),
+        )
+        epochs, lats, lons, alts, vels = (await self.session.execute(stmt)).one()
+        return epochs or [], lats or [], lons or [], alts or [], vels or []
+
+    async def backfill_telemetry(self, batch_size: int = 5000) -> int:
+        """Fill telemetry columns of rows written before they existed.
+
+        Walks the id range in batches, committing after each one. Every
+        scanned row is flagged ``telemetry_extracted``, including those whose
+        payload has no telemetry, so later runs do not scan them again. When
+        rows were updated, all workers are told to reload their ISS buffer.
+
+        Returns:
+            Number of rows updated
+        """
+        stmt = select(func.min(ISSFetchLog.id), func.max(ISSFetchLog.id)).where(
+            ISSFetchLog.latitude.is_(None), ISSFetchLog.telemetry_extracted.is_not(True)
+        )
+        lo, hi = (await self.session.execute(stmt)).one()
+        if lo is None:
+            return 0
+
+        updated = 0
+        for start in range(lo, hi + 1, batch_size):
+            result = await self.session.execute(
+                _BACKFILL_SQL, {"lo": start, "hi": start + batch_size}
+            )
+            await self.session.commit()
+            updated += result.rowcount
+        await notify_change(self.session, "iss", {"reload": True})
+        await self.session.commit()
+        return updated
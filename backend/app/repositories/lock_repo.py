@@ -0,0 +1,28 @@
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class LockRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_advisory_holder(self, key: int) -> dict[str, Any] | None:
+        """Get the backend currently holding a session-level advisory lock on ``key``.
+
+        A bigint key is stored as (classid = high 32 bits, objid = low 32 bits,
+        objsubid = 1) in ``pg_locks``.
+        """
+        result = await self.session.execute(
+            text(
+                "SELECT a.pid, a.application_name, host(a.client_addr) AS client_addr,"
+                " a.backend_start"
+                " FROM pg_locks l JOIN pg_stat_activity a ON a.pid = l.pid"
+                " WHERE l.locktype = 'advisory' AND l.granted"
+                " AND l.classid = :classid AND l.objid = :objid AND l.objsubid = 1"
+            ),
+            {"classid": (key >> 32) & 0xFFFFFFFF, "objid": key & 0xFFFFFFFF},
+        )
+        row = result.first()
+        return dict(row._mapping) if row else None
@@ -1,10 +1,11 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select, text
+from sqlalchemy import func, literal_column, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import notify_change
 from app.models.osdr import OSDRItem
 
 
@@ -12,46 +13,89 @@ class OSDRRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def upsert(
-        self,
-        dataset_id: str | None,
-        title: str | None,
-        status: str | None,
-        updated_at: datetime | None,
-        raw: dict[str, Any],
-    ) -> None:
-        """Upsert OSDR item by dataset_id."""
-        if dataset_id:
-            # Use PostgreSQL ON CONFLICT DO UPDATE
-            stmt = insert(OSDRItem).values(
-                dataset_id=dataset_id,
-                title=title,
-                status=status,
-                updated_at=updated_at,
-                raw=raw,
-            )
+    async def upsert_many(
+        self, rows: list[dict[str, Any]], chunk_size: int = 500
+    ) -> tuple[int, int, int]:
+        """Bulk upsert OSDR items with multi-row INSERT ... ON CONFLICT statements.
+
+        Each row is a dict with dataset_id, title, status, updated_at, raw and
+        content_hash keys.
+        Rows sharing a dataset_id are collapsed (last one wins) since a single
+        statement cannot update the same row twice. Everything is committed once.
+
+        Returns:
+            Tuple of (inserted, updated, unchanged) counts
+        """
+        keyed: dict[str, dict[str, Any]] = {}
+        unkeyed: list[dict[str, Any]] = []
+        for row in rows:
+            if row["dataset_id"]:
+                keyed[row["dataset_id"]] = row
+            else:
+                unkeyed.append(row)
+
+        inserted = updated = 0
+        keyed_rows = list(keyed.values())
+        for start in range(0, len(keyed_rows), chunk_size):
+            stmt = insert(OSDRItem).values(keyed_rows[start : start + chunk_size])
             stmt = stmt.on_conflict_do_update(
                 index_elements=["dataset_id"],
+                index_where=OSDRItem.dataset_id.isnot(None),
                 set_={
                     "title": stmt.excluded.title,
                     "status": stmt.excluded.status,
                     "updated_at": stmt.excluded.updated_at,
                     "raw": stmt.excluded.raw,
+                    "content_hash": stmt.excluded.content_hash,
                 },
+                # Skip the write entirely when the content did not change
+                where=OSDRItem.content_hash.is_distinct_from(stmt.excluded.content_hash),
+            ).returning(literal_column("xmax = 0").label("inserted"))
+            result = await self.session.execute(stmt)
+            for (was_inserted,) in result.all():
+                if was_inserted:
+                    inserted += 1
+                else:
+                    updated += 1
+
+        unchanged = len(keyed_rows) - inserted - updated
+
+        # No dataset_id - nothing to conflict on, insert in bulk
+        for start in range(0, len(unkeyed), chunk_size):
+            await self.session.execute(
+                insert(OSDRItem).values(unkeyed[start : start + chunk_size])
             )
-            await self.session.execute(stmt)
-        else:
-            # No dataset_id - just insert
-            item = OSDRItem(
-                dataset_id=None,
-                title=title,
-                status=status,
-                updated_at=updated_at,
-                raw=raw,
-            )
-            self.session.add(item)
+        inserted += len(unkeyed)
 
+        if inserted or updated:
+            await notify_change(
+                self.session,
+                "osdr",
+                {"written": inserted + updated, "inserted": inserted, "updated": updated},
+            )
         await self.session.commit()
+        return inserted, updated, unchanged
+
+    async def get_sync_index(
+        self,
+    ) -> tuple[dict[str, tuple[str | None, datetime | None]], set[str]]:
+        """Load what a sync needs to detect changes, without the raw payloads.
+
+        Returns:
+            Tuple of ({dataset_id: (content_hash, updated_at)}, hashes of rows
+            without dataset_id)
+        """
+        stmt = select(OSDRItem.dataset_id, OSDRItem.content_hash, OSDRItem.updated_at)
+        result = await self.session.execute(stmt)
+
+        keyed: dict[str, tuple[str | None, datetime | None]] = {}
+        unkeyed: set[str] = set()
+        for dataset_id, row_hash, updated_at in result.all():
+            if dataset_id is not None:
+                keyed[dataset_id] = (row_hash, updated_at)
+            elif row_hash is not None:
+                unkeyed.add(row_hash)
+        return keyed, unkeyed
 
     async def get_list(self, limit: int = 20) -> list[OSDRItem]:
         """Get list of OSDR items ordered by inserted_at desc."""
@@ -0,0 +1,300 @@
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple
+
+from sqlalchemy import Table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_BOUND_RE = re.compile(r"FROM \((MINVALUE|'[^']*')\) TO \((MAXVALUE|'[^']*')\)")
+
+_ROLLUP_SQL = """
+    INSERT INTO iss_hourly AS h (
+        hour, samples, first_at, last_at,
+        first_latitude, first_longitude, last_latitude, last_longitude,
+        avg_altitude, min_altitude, max_altitude, avg_velocity, max_velocity
+    )
+    SELECT
+        date_trunc('hour', fetched_at),
+        count(*),
+        min(fetched_at),
+        max(fetched_at),
+        (array_agg(latitude ORDER BY fetched_at))[1],
+        (array_agg(longitude ORDER BY fetched_at))[1],
+        (array_agg(latitude ORDER BY fetched_at DESC))[1],
+        (array_agg(longitude ORDER BY fetched_at DESC))[1],
+        avg(altitude),
+        min(altitude),
+        max(altitude),
+        avg(velocity),
+        max(velocity)
+    FROM {source}
+    {where}
+    GROUP BY 1
+    ON CONFLICT (hour) DO UPDATE SET
+        samples = h.samples + excluded.samples,
+        first_latitude = CASE WHEN excluded.first_at < h.first_at
+            THEN excluded.first_latitude ELSE h.first_latitude END,
+        first_longitude = CASE WHEN excluded.first_at < h.first_at
+            THEN excluded.first_longitude ELSE h.first_longitude END,
+        last_latitude = CASE WHEN excluded.last_at > h.last_at
+            THEN excluded.last_latitude ELSE h.last_latitude END,
+        last_longitude = CASE WHEN excluded.last_at > h.last_at
+            THEN excluded.last_longitude ELSE h.last_longitude END,
+        first_at = LEAST(h.first_at, excluded.first_at),
+        last_at = GREATEST(h.last_at, excluded.last_at),
+        avg_altitude = (h.avg_altitude * h.samples + excluded.avg_altitude * excluded.samples)
+            / (h.samples + excluded.samples),
+        min_altitude = LEAST(h.min_altitude, excluded.min_altitude),
+        max_altitude = GREATEST(h.max_altitude, excluded.max_altitude),
+        avg_velocity = (h.avg_velocity * h.samples + excluded.avg_velocity * excluded.samples)
+            / (h.samples + excluded.samples),
+        max_velocity = GREATEST(h.max_velocity, excluded.max_velocity)
+"""
+
+
+class Partition(NamedTuple):
+    """A partition of a range-partitioned table; bounds are None for MIN/MAXVALUE."""
+
+    name: str
+    lower: datetime | None
+    upper: datetime | None
+    is_default: bool
+
+    def overlaps(self, lower: datetime, upper: datetime) -> bool:
+        if self.is_default:
+            return False
+        return (self.lower is None or self.lower < upper) and (
+            self.upper is None or self.upper > lower
+        )
+
+
+def _parse_bound(value: str) -> datetime | None:
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(value.strip("'")).astimezone(timezone.utc)
+
+
+def _literal(value: datetime) -> str:
+    return f"'{value.astimezone(timezone.utc).isoformat()}'"
+
+
+def day_partition_name(table: str, day: datetime) -> str:
+    return f"{table}_p{day:%Y%m%d}"
+
+
+class PartitionRepository:
+    """DDL and bookkeeping for daily range partitions on ``fetched_at``.
+
+    Table names are never user input; they come from the managed table list in
+    ``PartitionService``. Nothing here commits, the caller owns the transaction.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def lock(self) -> None:
+        """Serialize partition maintenance across workers for this transaction."""
+        await self.session.execute(text("SELECT pg_advisory_xact_lock(hashtext('partitions'))"))
+
+    async def table_kind(self, table: str) -> tuple[str, bool] | None:
+        """Get (relkind, relispartition) of a table, or None if it does not exist."""
+        result = await self.session.execute(
+            text(
+                "SELECT relkind, relispartition FROM pg_class"
+                " WHERE oid = to_regclass(:table)"
+            ),
+            {"table": table},
+        )
+        row = result.first()
+        return (row.relkind, row.relispartition) if row else None
+
+    async def rename_legacy(self, table: str) -> str:
+        """Move a plain table, its indexes and id sequence out of the way.
+
+        Index and sequence names are global to the schema, so they are renamed
+        as well to let ``create_all`` build the partitioned parent.
+        """
+        legacy = f"{table}_legacy"
+        sequence = (
+            await self.session.execute(
+                text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": table}
+            )
+        ).scalar()
+
+        await self.session.execute(text(f"ALTER TABLE {table} RENAME TO {legacy}"))
+        indexes = await self.session.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = :table"),
+            {"table": legacy},
+        )
+        for (index,) in indexes.all():
+            renamed = index.replace(table, legacy, 1) if table in index else f"{index}_legacy"
+            await self.session.execute(text(f'ALTER INDEX "{index}" RENAME TO "{renamed}"'))
+        if sequence:
+            await self.session.execute(
+                text(f"ALTER SEQUENCE {sequence} RENAME TO {legacy}_id_seq")
+            )
+        return legacy
+
+    async def attach_legacy(self, parent: Table, legacy: str) -> datetime | None:
+        """Attach a renamed plain table to its partitioned parent.
+
+        Missing columns are added first and NOT NULL constraints the parent
+        does not have are dropped. Then the parent's id sequence is moved past
+        the legacy ids, and the table becomes the partition for everything up
+        to the end of the day of its newest row. An empty legacy table is
+        dropped instead.
+
+        Returns:
+            Upper bound of the attached partition, or None if it was dropped
+        """
+        existing = await self.session.execute(
+            text(
+                "SELECT column_name, is_nullable FROM information_schema.columns"
+                " WHERE table_name = :table"
+            ),
+            {"table": legacy},
+        )
+        nullable = {name: is_nullable == "YES" for name, is_nullable in existing.all()}
+        dialect = self.session.bind.dialect
+        for column in parent.columns:
+            if column.name not in nullable:
+                await self.session.execute(
+                    text(
+                        f"ALTER TABLE {legacy} ADD COLUMN IF NOT EXISTS"
+                        f" {column.name} {column.type.compile(dialect=dialect)}"
+                    )
+                )
+            elif column.nullable and not nullable[column.name]:
+                # A partition may be stricter than its parent; rows the parent
+                # accepts (e.g. deduplicated space_cache rows) must fit here too
+                await self.session.execute(
+                    text(f"ALTER TABLE {legacy} ALTER COLUMN {column.name} DROP NOT NULL")
+                )
+
+        bounds = (
+            await self.session.execute(text(f"SELECT max(id), max(fetched_at) FROM {legacy}"))
+        ).one()
+        max_id, newest = bounds
+        if newest is None:
+            await self.session.execute(text(f"DROP TABLE {legacy}"))
+            return None
+
+        await self.session.execute(
+            text(f"SELECT setval(pg_get_serial_sequence('{parent.name}', 'id'), :max_id)"),
+            {"max_id": max_id},
+        )
+        newest = newest.astimezone(timezone.utc)
+        upper = newest.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        await self.session.execute(
+            text(
+                f"ALTER TABLE {parent.name} ATTACH PARTITION {legacy}"
+                f" FOR VALUES FROM (MINVALUE) TO ({_literal(upper)})"
+            )
+        )
+        return upper
+
+    async def list_partitions(self, table: str) -> list[Partition]:
+        """Get the partitions of a table, oldest first, default partition last."""
+        result = await self.session.execute(
+            text(
+                "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) AS bound"
+                " FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid"
+                " WHERE i.inhparent = to_regclass(:table)"
+            ),
+            {"table": table},
+        )
+        partitions = []
+        for name, bound in result.all():
+            match = _BOUND_RE.search(bound or "")
+            if match is None:
+                partitions.append(Partition(name, None, None, True))
+            else:
+                lower, upper = match.groups()
+                partitions.append(Partition(name, _parse_bound(lower), _parse_bound(upper), False))
+
+        epoch = datetime.min.replace(tzinfo=timezone.utc)
+        return sorted(partitions, key=lambda p: (p.is_default, p.lower or epoch))
+
+    async def create_default(self, table: str) -> None:
+        """Create the catch-all partition for rows outside any daily partition."""
+        await self.session.execute(
+            text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+        )
+
+    async def create_day(self, table: str, day: datetime) -> str:
+        """Create the partition holding ``[day, day + 1 day)``."""
+        name = day_partition_name(table, day)
+        await self.session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table}"
+                f" FOR VALUES FROM ({_literal(day)}) TO ({_literal(day + timedelta(days=1))})"
+            )
+        )
+        return name
+
+    async def default_has_rows(self, table: str, lower: datetime, upper: datetime) -> bool:
+        """Check if the default partition holds rows that a new partition would cover."""
+        result = await self.session.execute(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {table}_default"
+                " WHERE fetched_at >= :lower AND fetched_at < :upper)"
+            ),
+            {"lower": lower, "upper": upper},
+        )
+        return bool(result.scalar())
+
+    async def drop(self, name: str) -> None:
+        await self.session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+
+    async def delete_default_before(self, table: str, cutoff: datetime, keep_latest: bool) -> int:
+        """Delete expired stragglers from the default partition.
+
+        With ``keep_latest`` the newest row of each ``source`` survives.
+        """
+        where = "fetched_at < :cutoff"
+        if keep_latest:
+            where += (
+                " AND (source, fetched_at) NOT IN"
+                f" (SELECT source, max(fetched_at) FROM {table} GROUP BY source)"
+            )
+        result = await self.session.execute(
+            text(f"DELETE FROM {table}_default WHERE {where}"), {"cutoff": cutoff}
+        )
+        return result.rowcount or 0
+
+    async def latest_per_source(self, table: str) -> list[datetime]:
+        """Get the newest ``fetched_at`` of every source in a table."""
+        result = await self.session.execute(
+            text(f"SELECT max(fetched_at) FROM {table} GROUP BY source")
+        )
+        return [value for (value,) in result.all()]
+
+    async def rollup_iss(self, source: str, before: datetime | None = None) -> int:
+        """Aggregate ISS rows of one partition into ``iss_hourly``.
+
+        Args:
+            source: Partition table name
+            before: Only aggregate rows older than this (for the default partition)
+
+        Returns:
+            Number of hourly rows written
+        """
+        where = "WHERE fetched_at < :before" if before is not None else ""
+        params = {"before": before} if before is not None else {}
+        result = await self.session.execute(
+            text(_ROLLUP_SQL.format(source=source, where=where)), params
+        )
+        return result.rowcount or 0
+
+    async def sizes(self, table: str) -> list[dict[str, Any]]:
+        """Get estimated row counts and on-disk sizes of a table's partitions."""
+        result = await self.session.execute(
+            text(
+                "SELECT c.relname AS name, c.reltuples::bigint AS rows_estimate,"
+                " pg_total_relation_size(c.oid) AS total_bytes"
+                " FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid"
+                " WHERE i.inhparent = to_regclass(:table)"
+            ),
+            {"table": table},
+        )
+        return [dict(row._mapping) for row in result.all()]
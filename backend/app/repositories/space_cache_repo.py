@@ -1,38 +1,144 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, Text, cast, delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
-from app.models.space_cache import SpaceCache
+from app.database import notify_change
+from app.models.space_cache import SpaceCache, SpacePayload
+from app.utils.content_hash import content_hash
+from app.utils.raw_json import RawJSON
+
+
+def _select_raw() -> Select:
+    """Select cache rows with their payload as JSON text, never decoded."""
+    return select(
+        SpaceCache.source,
+        func.coalesce(SpaceCache.checked_at, SpaceCache.fetched_at).label("at"),
+        SpaceCache.fetched_at,
+        cast(func.coalesce(SpacePayload.payload, SpaceCache.inline_payload), Text).label(
+            "payload"
+        ),
+    ).outerjoin(SpacePayload, SpacePayload.hash == SpaceCache.payload_hash)
 
 
 class SpaceCacheRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def insert(self, source: str, payload: dict[str, Any]) -> SpaceCache:
-        """Insert new cache entry."""
-        cache = SpaceCache(source=source, payload=payload)
+    async def store(self, source: str, payload: dict[str, Any]) -> bool:
+        """Store a fetched payload for a source, deduplicated by content hash.
+
+        If the payload equals the source's latest one, only that row's
+        ``checked_at`` is bumped. Otherwise the payload is written once to
+        ``space_payloads`` (shared by every row with the same hash) and a new
+        cache row pointing at it is inserted.
+
+        Returns:
+            True if a new cache row was written
+        """
+        digest = content_hash(payload)
+        latest = await self.get_latest(source, with_payload=False)
+        if latest is not None:
+            latest_hash = latest.payload_hash or content_hash(latest.inline_payload)
+            if latest_hash == digest:
+                await self.touch(latest)
+                return False
+
+        stmt = pg_insert(SpacePayload).values(hash=digest, payload=payload)
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[SpacePayload.hash],
+                set_={"last_used_at": func.now()},
+            )
+        )
+        cache = SpaceCache(source=source, payload_hash=digest)
         self.session.add(cache)
+        await self.session.flush()
+        await notify_change(self.session, "space", {"source": source, "at": cache.fetched_at})
         await self.session.commit()
-        await self.session.refresh(cache)
-        return cache
+        return True
+
+    async def touch(self, cache: SpaceCache) -> None:
+        """Record that upstream returned the row's payload again."""
+        await self.session.execute(
+            update(SpaceCache)
+            .where(SpaceCache.id == cache.id, SpaceCache.fetched_at == cache.fetched_at)
+            .values(checked_at=func.now())
+        )
+        await self.session.commit()
+
+    async def touch_latest(self, source: str) -> None:
+        """Bump ``checked_at`` of a source's latest row, e.g. after a 304."""
+        cache = await self.get_latest(source, with_payload=False)
+        if cache is not None:
+            await self.touch(cache)
+
+    async def delete_unreferenced_payloads(self, min_age: timedelta) -> int:
+        """Delete payload blobs no cache row points at any more.
+
+        Blobs used within ``min_age`` are kept, so a row being written
+        concurrently never loses its payload.
+        """
+        stmt = delete(SpacePayload).where(
+            SpacePayload.last_used_at < func.now() - min_age,
+            ~exists().where(SpaceCache.payload_hash == SpacePayload.hash),
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
+
+    async def get_latest(self, source: str, with_payload: bool = True) -> SpaceCache | None:
+        """Get the most recent cache entry for a specific source.
 
-    async def get_latest(self, source: str) -> SpaceCache | None:
-        """Get the most recent cache entry for a specific source."""
+        With ``with_payload=False`` the shared payload blob is not loaded.
+        """
         stmt = (
             select(SpaceCache)
             .where(SpaceCache.source == source)
-            .order_by(SpaceCache.id.desc())
+            .order_by(SpaceCache.fetched_at.desc(), SpaceCache.id.desc())
             .limit(1)
         )
+        if not with_payload:
+            stmt = stmt.options(noload(SpaceCache.blob))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_latest_dict(self, source: str) -> dict[str, Any]:
-        """Get latest cache as dict with 'at' and 'payload' keys."""
-        cache = await self.get_latest(source)
-        if cache:
-            return {"at": cache.fetched_at, "payload": cache.payload}
-        return {}
+    async def get_latest_raw(self, source: str) -> Row | None:
+        """Get (source, at, fetched_at, payload) of a source's newest row.
+
+        ``at`` is the last-checked time and ``payload`` is JSON text.
+        """
+        stmt = (
+            _select_raw()
+            .where(SpaceCache.source == source)
+            .order_by(SpaceCache.fetched_at.desc(), SpaceCache.id.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.first()
+
+    async def get_latest_many_raw(self, sources: list[str]) -> dict[str, dict[str, Any]]:
+        """Get latest cache dicts for several sources in a single query.
+
+        Uses ``DISTINCT ON (source)`` so Postgres walks ``ix_space_cache_source``
+        once instead of one round trip per source. Each dict has ``at`` (last
+        checked) and ``payload`` as ``RawJSON``; missing sources map to ``{}``.
+        """
+        stmt = (
+            _select_raw()
+            .where(SpaceCache.source.in_(sources))
+            .distinct(SpaceCache.source)
+            .order_by(SpaceCache.source, SpaceCache.fetched_at.desc(), SpaceCache.id.desc())
+        )
+        result = await self.session.execute(stmt)
+        latest = {row.source: row for row in result.all()}
+        return {
+            source: (
+                {"at": latest[source].at, "payload": RawJSON(latest[source].payload)}
+                if source in latest
+                else {}
+            )
+            for source in sources
+        }
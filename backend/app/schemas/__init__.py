@@ -1,25 +1,68 @@
+from app.schemas.admin import (
+    CacheStatsResponse,
+    ChangeListenerStatsResponse,
+    CircuitBreakerResponse,
+    EventBusStatsResponse,
+    HttpCacheStatsResponse,
+    HttpPoolStatsResponse,
+    JobStatusResponse,
+    LoopLagResponse,
+    PartitionMaintenanceResponse,
+    PartitionStatsResponse,
+    RateBudgetResponse,
+    SchedulerLeaderResponse,
+)
 from app.schemas.astro import AstroEventsResponse
 from app.schemas.health import HealthResponse
-from app.schemas.iss import ISSResponse, TrendResponse
+from app.schemas.iss import (
+    ISSGap,
+    ISSHistoryResponse,
+    ISSPositionEstimate,
+    ISSPositionResponse,
+    ISSResponse,
+    ISSStatsResponse,
+    ISSTrackPoint,
+    TrendResponse,
+)
 from app.schemas.jwst import JWSTFeedResponse, JWSTImageItem
 from app.schemas.osdr import OSDRItemResponse, OSDRListResponse, OSDRSyncResponse
 from app.schemas.space import (
     SpaceLatestResponse,
     SpaceRefreshResponse,
+    SpaceRefreshResult,
     SpaceSummaryResponse,
 )
 
 __all__ = [
     "AstroEventsResponse",
+    "CacheStatsResponse",
+    "ChangeListenerStatsResponse",
+    "CircuitBreakerResponse",
+    "EventBusStatsResponse",
     "HealthResponse",
+    "HttpCacheStatsResponse",
+    "HttpPoolStatsResponse",
+    "ISSGap",
+    "ISSHistoryResponse",
+    "ISSPositionEstimate",
+    "ISSPositionResponse",
     "ISSResponse",
+    "ISSStatsResponse",
+    "ISSTrackPoint",
+    "JobStatusResponse",
     "JWSTFeedResponse",
     "JWSTImageItem",
+    "LoopLagResponse",
     "OSDRItemResponse",
     "OSDRListResponse",
     "OSDRSyncResponse",
+    "PartitionMaintenanceResponse",
+    "PartitionStatsResponse",
+    "RateBudgetResponse",
+    "SchedulerLeaderResponse",
     "SpaceLatestResponse",
     "SpaceRefreshResponse",
+    "SpaceRefreshResult",
     "SpaceSummaryResponse",
     "TrendResponse",
 ]
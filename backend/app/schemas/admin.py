@@ -0,0 +1,181 @@
+"""Schemas for admin/diagnostics endpoints."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class HttpHostStats(BaseModel):
+    """Request and connection counters for a single upstream host."""
+
+    requests: int
+    connections_opened: int
+    reused: int
+
+
+class HttpPoolStatsResponse(BaseModel):
+    """Shared HTTP connection pool statistics."""
+
+    open: bool
+    http2: bool
+    max_connections: int
+    max_keepalive_connections: int
+    max_connections_per_host: int
+    requests: int
+    connections_opened: int
+    reuse_ratio: float = Field(description="Share of requests served over a reused connection")
+    hosts: dict[str, HttpHostStats] = Field(default_factory=dict)
+
+
+class HttpCacheStatsResponse(BaseModel):
+    """Conditional GET (ETag/Last-Modified) validator cache statistics."""
+
+    entries: int
+    hits: int = Field(description="Requests answered with 304 Not Modified")
+    misses: int = Field(description="Conditional requests that returned a full body")
+    hit_ratio: float
+
+
+class CacheStatsResponse(BaseModel):
+    """In-process response cache statistics."""
+
+    name: str
+    size: int
+    max_size: int
+    ttl: float
+    stale_ttl: float
+    hits: int
+    stale_hits: int = Field(description="Stale entries served while revalidating")
+    misses: int
+    evictions: int
+    refresh_errors: int
+    hit_rate: float
+
+
+class PartitionStatsResponse(BaseModel):
+    """A daily partition of a time-partitioned table."""
+
+    table: str
+    name: str
+    lower: datetime | None = Field(default=None, description="Inclusive bound, null for MINVALUE")
+    upper: datetime | None = Field(default=None, description="Exclusive bound, null for MAXVALUE")
+    is_default: bool
+    rows_estimate: int
+    total_bytes: int
+
+
+class PartitionMaintenanceResponse(BaseModel):
+    """Result of one partition maintenance run."""
+
+    created: list[str] = Field(default_factory=list)
+    dropped: list[str] = Field(default_factory=list)
+    rolled_up_hours: int = 0
+    default_rows_deleted: int = 0
+    payloads_deleted: int = Field(default=0, description="Unreferenced space payload blobs removed")
+
+
+class EventBusStatsResponse(BaseModel):
+    """SSE event bus statistics."""
+
+    subscribers: int
+    published: int
+    last_event_id: str = Field(description="<epoch>-<seq>, the epoch is per worker process")
+    replay_size: int = Field(description="Events currently available for Last-Event-ID replay")
+
+
+class ChangeListenerStatsResponse(BaseModel):
+    """Cross-worker LISTEN/NOTIFY listener status."""
+
+    channel: str
+    connected: bool
+    received: int = Field(description="Notifications received by this worker")
+    reconnects: int
+
+
+class LeaderHolder(BaseModel):
+    """Postgres backend holding the scheduler leader lock."""
+
+    pid: int
+    application_name: str | None = None
+    client_addr: str | None = None
+    backend_start: datetime | None = None
+
+
+class SchedulerLeaderResponse(BaseModel):
+    """Scheduler leader election state as seen by the answering worker."""
+
+    election_enabled: bool
+    worker_id: str = Field(description="hostname:pid of the worker answering this request")
+    is_leader: bool
+    leader_since: datetime | None = None
+    elections: int = Field(description="Times this worker has become leader")
+    leader: LeaderHolder | None = Field(
+        default=None, description="Current lock holder (application_name names the worker)"
+    )
+
+
+class JobStatusResponse(BaseModel):
+    """Schedule and run history of a background job on the answering worker."""
+
+    id: str
+    name: str
+    interval_sec: float | None = None
+    next_run_time: datetime | None = Field(
+        default=None, description="Null for one-off jobs that already ran"
+    )
+    running: bool
+    runs: int
+    failures: int
+    failure_streak: int = Field(description="Consecutive failed runs")
+    last_started_at: datetime | None = None
+    last_duration_ms: float | None = None
+    last_success_at: datetime | None = None
+    last_error: str | None = None
+    retry_delay_sec: float | None = Field(
+        default=None, description="Backoff applied after the last failure"
+    )
+
+
+class RateBudgetResponse(BaseModel):
+    """Usage of an upstream credential's rate budget on the answering worker."""
+
+    key: str = Field(description="Masked credential")
+    capacity: float = Field(description="Hourly quota")
+    tokens: float = Field(description="Calls left in the bucket")
+    reserve: float = Field(description="Tokens only scheduled fetches may spend")
+    upstream_limit: int | None = Field(default=None, description="Last X-RateLimit-Limit")
+    upstream_remaining: int | None = Field(
+        default=None, description="Last X-RateLimit-Remaining"
+    )
+    scheduled_requests: int
+    manual_requests: int
+    deferred: int = Field(description="Manual calls that waited for tokens")
+    refused: int
+    throttled: int = Field(description="429 responses from upstream")
+
+
+class CircuitBreakerResponse(BaseModel):
+    """Circuit breaker of an upstream host on the answering worker."""
+
+    host: str
+    state: str = Field(description="closed, open or half_open")
+    consecutive_failures: int
+    opened_since: datetime | None = None
+    retry_in_sec: float | None = Field(
+        default=None, description="Time until a probe request is let through"
+    )
+    times_opened: int
+    rejected: int = Field(description="Requests refused while open")
+
+
+class LoopLagResponse(BaseModel):
+    """Event loop responsiveness of the answering worker."""
+
+    running: bool
+    interval_sec: float
+    samples: int = Field(description="Samples in the recent window")
+    mean_ms: float
+    p99_ms: float
+    window_max_ms: float
+    max_ms: float = Field(description="Worst lag since startup")
+    stalls: int = Field(description="Lags above loop_lag_warn_ms since startup")
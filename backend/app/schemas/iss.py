@@ -23,3 +23,61 @@ class TrendResponse(BaseModel):
     from_lon: float | None = None
     to_lat: float | None = None
     to_lon: float | None = None
+
+
+class ISSTrackPoint(BaseModel):
+    at: datetime
+    latitude: float
+    longitude: float
+    altitude: float | None = None
+    velocity: float | None = None
+
+
+class ISSHistoryResponse(BaseModel):
+    from_time: datetime
+    to_time: datetime
+    total_samples: int
+    count: int
+    points: list[ISSTrackPoint]
+
+
+class ISSGap(BaseModel):
+    start: datetime
+    end: datetime
+    seconds: float
+
+
+class ISSStatsResponse(BaseModel):
+    from_time: datetime
+    to_time: datetime
+    samples: int
+    segments: int
+    duration_sec: float
+    covered_sec: float
+    total_distance_km: float
+    mean_segment_speed_kmh: float | None = None
+    max_segment_speed_kmh: float | None = None
+    mean_velocity_kmh: float | None = None
+    max_velocity_kmh: float | None = None
+    outlier_count: int
+    gap_count: int
+    gaps: list[ISSGap]
+
+
+class ISSPositionEstimate(BaseModel):
+    at: datetime
+    method: str
+    latitude: float | None = None
+    longitude: float | None = None
+    altitude: float | None = None
+    horizon_sec: float | None = None
+
+
+class ISSPositionResponse(BaseModel):
+    count: int
+    points: list[ISSPositionEstimate]
+    latest_sample_at: datetime | None = None
+    backtest_samples: int
+    backtest_mean_horizon_sec: float | None = None
+    backtest_mean_error_km: float | None = None
+    backtest_max_error_km: float | None = None
@@ -19,3 +19,6 @@ class JWSTFeedResponse(BaseModel):
     source: str = Field(description="Query source type: jpg, suffix, or program")
     count: int = Field(description="Number of items returned")
     items: list[JWSTImageItem] = Field(default_factory=list, description="List of JWST images")
+    next_cursor: str | None = Field(
+        default=None, description="Pass as 'cursor' to continue; null when exhausted"
+    )
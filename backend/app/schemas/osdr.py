@@ -20,3 +20,7 @@ class OSDRListResponse(BaseModel):
 
 class OSDRSyncResponse(BaseModel):
     written: int
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    not_modified: bool = False
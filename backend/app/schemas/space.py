@@ -12,12 +12,23 @@ class SpaceCacheData(BaseModel):
 class SpaceLatestResponse(BaseModel):
     source: str
     fetched_at: datetime | None = None
+    changed_at: datetime | None = None
     payload: dict[str, Any] | None = None
     message: str | None = None
 
 
+class SpaceRefreshResult(BaseModel):
+    source: str
+    ok: bool
+    not_modified: bool = False
+    error: str | None = None
+    retry_after: float | None = None
+    duration_ms: float | None = None
+
+
 class SpaceRefreshResponse(BaseModel):
     refreshed: list[str]
+    results: list[SpaceRefreshResult] = []
 
 
 class SpaceSummaryResponse(BaseModel):
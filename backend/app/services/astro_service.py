@@ -1,14 +1,82 @@
 """Astronomy API service for fetching astronomical events."""
 
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 from app.config import settings
 from app.services.http_client import HttpClient
+from app.utils.cache import SWRCache
+from app.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# (cell_lat, cell_lon, from_date) -> (days, response); entries expire at UTC midnight
+events_cache = SWRCache(
+    "astro_events",
+    max_size=settings.astro_cache_max_size,
+    ttl=86400.0,
+    stale_ttl=settings.astro_cache_stale_ttl,
+)
+_fetch_flight = SingleFlight()
+
+
+def _snap(value: float, step: float) -> float:
+    """Snap a coordinate to the centre of its grid cell."""
+    return round(round(value / step) * step, 6)
+
+
+def _event_date(event: Any) -> str | None:
+    """Get the earliest YYYY-MM-DD date mentioned by an event, if any."""
+    if not isinstance(event, dict):
+        return None
+    dates: list[str] = []
+    highlights = event.get("eventHighlights")
+    if isinstance(highlights, dict):
+        for highlight in highlights.values():
+            if isinstance(highlight, dict) and isinstance(highlight.get("date"), str):
+                dates.append(highlight["date"][:10])
+    for key in ("date", "rise", "set"):
+        if isinstance(event.get(key), str):
+            dates.append(event[key][:10])
+    return min(dates) if dates else None
+
+
+def _trim_to_window(result: dict[str, Any], to_date: str) -> dict[str, Any]:
+    """Copy a cached response keeping only events dated on or before ``to_date``."""
+    data = result.get("data")
+    if not isinstance(data, dict):
+        return result
+
+    data = dict(data)
+    if isinstance(data.get("dates"), dict):
+        data["dates"] = {**data["dates"], "to": to_date}
+
+    container = data
+    if isinstance(data.get("table"), dict):
+        container = data["table"] = dict(data["table"])
+
+    rows = container.get("rows")
+    if isinstance(rows, list):
+        trimmed_rows = []
+        for row in rows:
+            if not isinstance(row, dict):
+                trimmed_rows.append(row)
+                continue
+            row = dict(row)
+            for events_key in ("events", "cells"):
+                events = row.get(events_key)
+                if isinstance(events, list):
+                    row[events_key] = [
+                        event
+                        for event in events
+                        if (date := _event_date(event)) is None or date <= to_date
+                    ]
+            trimmed_rows.append(row)
+        container["rows"] = trimmed_rows
+
+    return {**result, "data": data}
+
 
 class AstroService:
     """Service for interacting with Astronomy API."""
@@ -40,6 +108,11 @@ class AstroService:
 
         Returns:
             Raw JSON response from Astronomy API
+
+        Results are cached per grid cell (``astro_grid_deg``) and start date until
+        the next UTC midnight. A cached longer window answers shorter ones, so
+        cached requests never reach the upstream. While the upstream fails or
+        its circuit breaker is open, yesterday's window is served if cached.
         """
         self._validate_credentials()
 
@@ -51,11 +124,60 @@ class AstroService:
         from_date = now.strftime("%Y-%m-%d")
         to_date = (now + timedelta(days=days)).strftime("%Y-%m-%d")
 
+        step = settings.astro_grid_deg
+        key = (_snap(latitude, step), _snap(longitude, step), from_date)
+
+        cached = events_cache.get(key, accept=lambda value: value[0] >= days)
+        if cached is not None:
+            cached_days, result = cached
+            return result if cached_days == days else _trim_to_window(result, to_date)
+
+        # Fetch at least the prefetch window so later shorter requests are hits
+        fetch_days = max(days, settings.astro_cache_prefetch_days)
+        midnight = datetime.combine(
+            now.date() + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc
+        )
+
+        async def load() -> tuple[int, dict[str, Any]]:
+            result = await self._fetch(key[0], key[1], now, fetch_days)
+            events_cache.set(key, (fetch_days, result), ttl=(midnight - now).total_seconds())
+            return fetch_days, result
+
+        try:
+            fetched_days, result = await _fetch_flight.do((*key, fetch_days), load)
+        except Exception:
+            stale = self._get_stale(key, days, to_date)
+            if stale is None:
+                raise
+            logger.warning("Astronomy API unavailable, serving yesterday's cached events")
+            return stale
+        return result if fetched_days == days else _trim_to_window(result, to_date)
+
+    @staticmethod
+    def _get_stale(
+        key: tuple[float, float, str], days: int, to_date: str
+    ) -> dict[str, Any] | None:
+        """Get an expired cached window from the previous day covering ``to_date``."""
+        cell_lat, cell_lon, from_date = key
+        yesterday = str(date.fromisoformat(from_date) - timedelta(days=1))
+        cached = events_cache.get(
+            (cell_lat, cell_lon, yesterday),
+            allow_stale=True,
+            accept=lambda value: value[0] >= days + 1,
+        )
+        if cached is None:
+            return None
+        return _trim_to_window(cached[1], to_date)
+
+    async def _fetch(
+        self, latitude: float, longitude: float, now: datetime, days: int
+    ) -> dict[str, Any]:
+        """Query the Astronomy API events endpoint for a date window."""
         params = {
             "latitude": latitude,
             "longitude": longitude,
-            "from": from_date,
-            "to": to_date,
+            "from": now.strftime("%Y-%m-%d"),
+            "to": (now + timedelta(days=days)).strftime("%Y-%m-%d"),
         }
 
         try:
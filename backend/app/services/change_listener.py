@@ -0,0 +1,119 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+import asyncpg
+
+from app.config import settings
+from app.database import asyncpg_dsn
+from app.services.event_bus import event_bus
+from app.services.iss_service import ISSService
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeListener:
+    """Keeps a dedicated asyncpg connection LISTENing on ``change_channel``.
+
+    Repositories send NOTIFY on every write, so each worker learns about
+    changes made by any worker (including itself): it updates its local ISS
+    buffer and forwards the change to its SSE subscribers. The connection is
+    pinged periodically and re-established with backoff when lost; after a
+    reconnect local state is reloaded and SSE clients are told to resync,
+    since notifications sent in between are gone.
+    """
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self.connected = False
+        self.received = 0
+        self.reconnects = 0
+        self._task: asyncio.Task | None = None
+        self._pending: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        delay = 1.0
+        first = True
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(asyncpg_dsn())
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _: lost.set())
+                await conn.add_listener(self.channel, self._on_notify)
+                self.connected = True
+                delay = 1.0
+                logger.info(f"Listening for changes on '{self.channel}'")
+                if not first:
+                    self.reconnects += 1
+                    await self._resync()
+                first = False
+
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(
+                            lost.wait(), timeout=settings.change_listener_ping_interval
+                        )
+                    except asyncio.TimeoutError:
+                        await conn.execute("SELECT 1")
+                logger.warning("Change listener connection lost")
+            except Exception as e:
+                logger.warning(f"Change listener error: {e}")
+            finally:
+                self.connected = False
+                if conn is not None and not conn.is_closed():
+                    conn.terminate()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    async def _resync(self) -> None:
+        await ISSService.warm_buffer()
+        event_bus.resync()
+
+    def _on_notify(self, conn: Any, pid: int, channel: str, payload: str) -> None:
+        self.received += 1
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed change notification: {payload[:200]}")
+            return
+        task = asyncio.create_task(self._apply(message.get("topic"), message.get("data") or {}))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _apply(self, topic: str | None, data: dict[str, Any]) -> None:
+        try:
+            if topic == "iss":
+                response = await ISSService.apply_change(data)
+                if response is not None:
+                    event_bus.publish("iss", response)
+            elif topic in ("space", "osdr"):
+                event_bus.publish(topic, data)
+        except Exception as e:
+            logger.error(f"Failed to apply {topic} change: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "channel": self.channel,
+            "connected": self.connected,
+            "received": self.received,
+            "reconnects": self.reconnects,
+        }
+
+
+change_listener = ChangeListener(settings.change_channel)
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import secrets
+from collections import deque
+from typing import Any, AsyncIterator, NamedTuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.config import settings
+
+TOPICS = ("iss", "space", "osdr")
+
+
+class Event(NamedTuple):
+    id: str  # "<epoch>-<seq>"
+    seq: int
+    topic: str
+    data: str  # JSON, encoded once for all subscribers
+
+    def encode(self) -> str:
+        """Format as a Server-Sent Events message."""
+        return f"id: {self.id}\nevent: {self.topic}\ndata: {self.data}\n\n"
+
+
+class Subscription:
+    """A subscriber's bounded queue of pending events for a set of topics."""
+
+    def __init__(self, topics: set[str], max_queue: int) -> None:
+        self.topics = topics
+        self.queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=max_queue)
+        # Set when events had to be dropped; the client must refetch
+        self.lagged = False
+
+    def offer(self, event: Event) -> None:
+        if event.topic not in self.topics:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.lagged = True
+
+
+class EventBus:
+    """In-process publish/subscribe hub behind the ``/events`` SSE stream.
+
+    Event ids are ``<epoch>-<seq>``: a random epoch per process and a
+    sequence number that is monotonic within it. The most recent events are
+    kept in a replay ring, so a reconnecting client sending ``Last-Event-ID``
+    receives what it missed. If that is not possible (too old, or the id comes
+    from another worker or a previous process), a ``resync`` event tells it
+    to reload its data instead.
+    """
+
+    def __init__(self, replay_size: int, max_queue: int) -> None:
+        self.max_queue = max_queue
+        self.epoch = secrets.token_hex(4)
+        self._last_id = 0
+        self._replay: deque[Event] = deque(maxlen=replay_size)
+        self._subscribers: set[Subscription] = set()
+        self.published = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _event(self, topic: str, data: str) -> Event:
+        return Event(f"{self.epoch}-{self._last_id}", self._last_id, topic, data)
+
+    def publish(self, topic: str, data: Any) -> Event:
+        """Send an event to all current subscribers of ``topic``."""
+        self._last_id += 1
+        event = self._event(topic, json.dumps(jsonable_encoder(data)))
+        self._replay.append(event)
+        self.published += 1
+        for subscription in self._subscribers:
+            subscription.offer(event)
+        return event
+
+    def resync(self) -> None:
+        """Tell every subscriber to reload, e.g. after updates may have been lost."""
+        event = self._event("resync", "{}")
+        for subscription in self._subscribers:
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                subscription.lagged = True
+
+    def _missed(self, topics: set[str], last_event_id: str) -> list[Event] | None:
+        """Get events after ``last_event_id``, or None if they are not all retained."""
+        epoch, _, seq = last_event_id.rpartition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        last_seq = int(seq)
+        if last_seq > self._last_id:
+            return None
+        if last_seq < self._last_id and (
+            not self._replay or self._replay[0].seq > last_seq + 1
+        ):
+            return None
+        return [e for e in self._replay if e.seq > last_seq and e.topic in topics]
+
+    async def stream(
+        self, topics: set[str], last_event_id: str | None = None
+    ) -> AsyncIterator[str]:
+        """Yield SSE messages for ``topics`` until the client disconnects.
+
+        Sends a comment line every ``events_heartbeat_interval`` seconds so
+        proxies keep the connection open and dead clients are noticed.
+        """
+        subscription = Subscription(topics, self.max_queue)
+        self._subscribers.add(subscription)
+        # Taken together with subscribing, so no event is both replayed and queued
+        missed = [] if last_event_id is None else self._missed(topics, last_event_id)
+        try:
+            yield f"retry: {settings.events_retry_ms}\n\n"
+
+            if missed is None:
+                yield self._event("resync", "{}").encode()
+            else:
+                for event in missed:
+                    yield event.encode()
+
+            while True:
+                if subscription.lagged:
+                    # Drop what is queued; the client reloads everything anyway
+                    subscription.queue = asyncio.Queue(maxsize=self.max_queue)
+                    subscription.lagged = False
+                    yield self._event("resync", "{}").encode()
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(), timeout=settings.events_heartbeat_interval
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield event.encode()
+        finally:
+            self._subscribers.discard(subscription)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "subscribers": self.subscriber_count,
+            "published": self.published,
+            "last_event_id": f"{self.epoch}-{self._last_id}",
+            "replay_size": len(self._replay),
+        }
+
+
+event_bus = EventBus(settings.events_replay_size, settings.events_max_queue)
@@ -1,23 +1,466 @@
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
 import httpx
 
+from app.config import settings
+from app.services.rate_budget import RateBudgetExceeded, rate_budget
+from app.utils.fast_json import loads
+
+logger = logging.getLogger(__name__)
+
+
+class HttpPool:
+    """Process-wide pooled ``httpx.AsyncClient`` shared by all services.
+
+    Keeps connections alive between requests, caps in-flight requests per
+    host and counts new TCP connections so connection reuse can be observed.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self.http2 = False
+        self.requests: dict[str, int] = defaultdict(int)
+        self.connections_opened: dict[str, int] = defaultdict(int)
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None and not self._client.is_closed
+
+    def open(self) -> httpx.AsyncClient:
+        """Create the underlying client if it does not exist yet."""
+        if self.is_open:
+            return self._client
+
+        http2 = settings.http2_enabled
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+                http2 = False
+
+        self.http2 = http2
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+        )
+        logger.info(
+            "HTTP pool opened (max_connections=%s, keepalive=%s, http2=%s)",
+            settings.http_max_connections,
+            settings.http_max_keepalive_connections,
+            http2,
+        )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the underlying client and all pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("HTTP pool closed")
+
+    def host_limit(self, host: str) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent requests to a host."""
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = asyncio.Semaphore(settings.http_max_connections_per_host)
+            self._host_limits[host] = limit
+        return limit
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the pool, honouring the per-host limit."""
+        client = self.open()
+        host = urlsplit(url).netloc
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                self.connections_opened[host] += 1
+
+        async with self.host_limit(host):
+            self.requests[host] += 1
+            return await client.request(method, url, extensions={"trace": trace}, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        """Get request and connection counters per host."""
+        hosts = {}
+        for host in sorted(set(self.requests) | set(self.connections_opened)):
+            requests = self.requests[host]
+            opened = self.connections_opened[host]
+            hosts[host] = {
+                "requests": requests,
+                "connections_opened": opened,
+                "reused": max(requests - opened, 0),
+            }
+
+        total_requests = sum(self.requests.values())
+        total_opened = sum(self.connections_opened.values())
+        return {
+            "open": self.is_open,
+            "http2": self.http2,
+            "max_connections": settings.http_max_connections,
+            "max_keepalive_connections": settings.http_max_keepalive_connections,
+            "max_connections_per_host": settings.http_max_connections_per_host,
+            "requests": total_requests,
+            "connections_opened": total_opened,
+            "reuse_ratio": (
+                round(1 - total_opened / total_requests, 4) if total_requests else 0.0
+            ),
+            "hosts": hosts,
+        }
+
+
+http_pool = HttpPool()
+
+
+def _retry_after_header(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class CircuitOpenError(Exception):
+    """A request was not sent because the host's circuit breaker is open."""
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(f"circuit open for {host}, retry in {retry_after:.0f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Get the delay requested by a 429/503 response's Retry-After header, if any.
+
+    Calls refused locally (rate budget, open circuit) carry their own delay.
+    """
+    if isinstance(exc, (RateBudgetExceeded, CircuitOpenError)):
+        return exc.retry_after
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    if exc.response.status_code not in (429, 503):
+        return None
+    return _retry_after_header(exc.response)
+
+
+class CircuitBreaker:
+    """Fails fast for a host after repeated failures.
+
+    ``closed``: requests pass; transport errors and 5xx responses count as
+    failures, any other response resets the count. ``http_breaker_threshold``
+    consecutive failures open the breaker. ``open``: requests are refused with
+    ``CircuitOpenError`` for ``http_breaker_reset_timeout`` seconds, then the
+    breaker goes ``half_open`` and lets a single probe through, which closes it
+    on success or opens it again on failure.
+    """
+
+    def __init__(self, host: str) -> None:
+        self.host = host
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.opened_since: datetime | None = None
+        self.times_opened = 0
+        self.rejected = 0
+        self._probing = False
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        if self.opened_at is None:
+            return 0.0
+        return max(self.opened_at + settings.http_breaker_reset_timeout - time.monotonic(), 0.0)
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests would be refused outright."""
+        if self.state == "open":
+            return self.retry_in() > 0
+        return self.state == "half_open" and self._probing
+
+    def allow(self) -> None:
+        """Admit a request or raise ``CircuitOpenError``."""
+        if self.state == "closed":
+            return
+        if self.state == "open" and self.retry_in() <= 0:
+            self.state = "half_open"
+        if self.state == "half_open" and not self._probing:
+            self._probing = True
+            return
+        self.rejected += 1
+        raise CircuitOpenError(self.host, self.retry_in())
+
+    def record(self, ok: bool) -> None:
+        """Record the outcome of an admitted request."""
+        self._probing = False
+        if ok:
+            if self.state != "closed":
+                logger.info(f"Circuit for {self.host} closed")
+            self.state = "closed"
+            self.failures = 0
+            self.opened_at = None
+            self.opened_since = None
+            return
+
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= settings.http_breaker_threshold:
+            if self.state == "closed":
+                self.times_opened += 1
+                self.opened_since = datetime.now(timezone.utc)
+                logger.warning(f"Circuit for {self.host} opened after {self.failures} failures")
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Forget an admitted request that ended without an outcome (e.g. cancelled)."""
+        self._probing = False
+
+    def stats(self) -> dict[str, Any]:
+        state = self.state
+        if state == "open" and self.retry_in() <= 0:
+            state = "half_open"  # the next request will be the probe
+        return {
+            "host": self.host,
+            "state": state,
+            "consecutive_failures": self.failures,
+            "opened_since": self.opened_since,
+            "retry_in_sec": round(self.retry_in(), 1) if self.state != "closed" else None,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+class CircuitBreakers:
+    """Circuit breakers by host, created on first use."""
+
+    def __init__(self) -> None:
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host)
+            self._breakers[host] = breaker
+        return breaker
+
+    def is_open(self, url: str) -> bool:
+        """Check if requests to the host of ``url`` currently fail fast."""
+        breaker = self._breakers.get(urlsplit(url).netloc)
+        return breaker is not None and breaker.is_open
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [breaker.stats() for _, breaker in sorted(self._breakers.items())]
+
+
+circuit_breakers = CircuitBreakers()
+
+# Responses worth another attempt; 429/503 only when Retry-After is short
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff before retry number ``attempt + 1``."""
+    ceiling = min(settings.http_retry_backoff * 2**attempt, settings.http_retry_backoff_max)
+    return random.uniform(0, ceiling)
+
+
+def _response_retry_delay(response: httpx.Response, attempt: int) -> float | None:
+    """Delay before retrying a response, or None if it should not be retried."""
+    if response.status_code in (429, 503):
+        retry_after = _retry_after_header(response)
+        if retry_after is not None:
+            return retry_after if retry_after <= settings.http_retry_backoff_max else None
+        if response.status_code == 429:
+            return None
+    return _backoff_delay(attempt)
+
+
+class _NotModified:
+    """Sentinel returned by conditional GETs when upstream answers 304."""
+
+    def __repr__(self) -> str:
+        return "NOT_MODIFIED"
+
+
+NOT_MODIFIED = _NotModified()
+
+
+class ValidatorCache:
+    """Remembers ETag/Last-Modified validators per URL+params.
+
+    Bounded in size; the least recently used entries are dropped first.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str | None, str | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(url: str, params: dict | None) -> str:
+        if not params:
+            return url
+        query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        return f"{url}?{query}"
+
+    def request_headers(self, key: str) -> dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached key."""
+        validators = self._entries.get(key)
+        if validators is None:
+            return {}
+        self._entries.move_to_end(key)
+        etag, last_modified = validators
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def store(self, key: str, response: httpx.Response) -> None:
+        """Remember validators from a 200 response, if it sent any."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (etag, last_modified)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def forget(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+validator_cache = ValidatorCache()
+
 
 class HttpClient:
-    """Shared HTTP client with configurable timeout."""
+    """Thin per-service wrapper over the shared pool with its own timeout.
 
-    def __init__(self, timeout: float = 30.0):
+    GETs are retried ``retries`` times (default ``http_retries``) on transport
+    errors and 502/503/504, and on 429/503 with a short Retry-After, with
+    jittered exponential backoff. Every attempt goes through the host's
+    circuit breaker.
+    """
+
+    def __init__(self, timeout: float = 30.0, retries: int | None = None):
         self.timeout = timeout
+        self.retries = settings.http_retries if retries is None else retries
+
+    async def _send(
+        self, method: str, url: str, rate_key: str | None = None, **kwargs: Any
+    ) -> httpx.Response:
+        """Send an idempotent request with retries and the host's circuit breaker."""
+        breaker = circuit_breakers.get(url)
+        attempt = 0
+        while True:
+            breaker.allow()
+            try:
+                if rate_key is not None:
+                    await rate_budget.acquire(rate_key)
+                response = await http_pool.request(method, url, timeout=self.timeout, **kwargs)
+            except httpx.TransportError as e:
+                breaker.record(ok=False)
+                if attempt >= self.retries:
+                    raise
+                delay = _backoff_delay(attempt)
+                reason = str(e) or type(e).__name__
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                if rate_key is not None:
+                    rate_budget.observe(rate_key, response)
+                breaker.record(ok=response.status_code < 500)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                    return response
+                delay = _response_retry_delay(response, attempt)
+                if delay is None:
+                    return response
+                reason = f"HTTP {response.status_code}"
+
+            attempt += 1
+            logger.warning(
+                f"GET {breaker.host} failed ({reason}), retry {attempt}/{self.retries} "
+                f"in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
 
     async def get(
         self,
         url: str,
         params: dict | None = None,
         headers: dict | None = None,
-    ) -> dict:
-        """Perform GET request and return JSON response."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        conditional: bool = False,
+        rate_key: str | None = None,
+    ) -> Any:
+        """Perform GET request and return JSON response.
+
+        With ``conditional=True`` the validators from the previous response for
+        the same URL+params are sent, and ``NOT_MODIFIED`` is returned on 304.
+        With ``rate_key`` every attempt is charged to that credential's rate
+        budget and may be deferred or refused with ``RateBudgetExceeded``.
+        """
+        key = ValidatorCache.key(url, params) if conditional else None
+        if key is not None:
+            headers = {**(headers or {}), **validator_cache.request_headers(key)}
+
+        response = await self._send(
+            "GET", url, rate_key=rate_key, params=params, headers=headers
+        )
+
+        if key is not None:
+            if response.status_code == 304:
+                validator_cache.hits += 1
+                return NOT_MODIFIED
+            # Errors say nothing about the validators, keep them out of the hit rate
+            if response.status_code == 200:
+                validator_cache.misses += 1
+
+        response.raise_for_status()
+        data = loads(response.content)
+        if key is not None:
+            validator_cache.store(key, response)
+        return data
+
+    def forget(self, url: str, params: dict | None = None) -> None:
+        """Drop stored validators, e.g. when the fetched body could not be persisted."""
+        validator_cache.forget(ValidatorCache.key(url, params))
 
     async def get_with_basic_auth(
         self,
@@ -27,11 +470,6 @@ class HttpClient:
         params: dict | None = None,
     ) -> dict:
         """Perform GET request with Basic Auth."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                url,
-                params=params,
-                auth=(username, password),
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._send("GET", url, params=params, auth=(username, password))
+        response.raise_for_status()
+        return loads(response.content)
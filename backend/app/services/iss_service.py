@@ -1,18 +1,88 @@
 import logging
+from bisect import bisect_left
+from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.database import async_session
 from app.models.iss import ISSFetchLog
 from app.repositories.iss_repo import ISSRepository
-from app.schemas.iss import ISSResponse, TrendResponse
+from app.schemas.iss import (
+    ISSHistoryResponse,
+    ISSPositionEstimate,
+    ISSPositionResponse,
+    ISSResponse,
+    ISSStatsResponse,
+    ISSTrackPoint,
+    TrendResponse,
+)
 from app.services.http_client import HttpClient
 from app.utils.haversine import haversine_km
-from app.utils.json_extract import extract_number
+from app.utils.lttb import lttb
+from app.utils.orbit import propagate
+from app.utils.raw_json import RawJSON, render_object
+from app.utils.ring_buffer import RingBuffer
+from app.utils.single_flight import SingleFlight
+from app.utils.track_stats import track_stats
 
 logger = logging.getLogger(__name__)
 
+# Coalesces concurrent fetches triggered by /fetch and the scheduler
+_fetch_flight = SingleFlight(min_interval=settings.fetch_min_interval)
+
+
+class ISSSample:
+    """Compact in-memory copy of an ``iss_fetch_log`` row."""
+
+    __slots__ = (
+        "id",
+        "fetched_at",
+        "source_url",
+        "payload",
+        "latitude",
+        "longitude",
+        "altitude",
+        "velocity",
+        "rendered",
+    )
+
+    def __init__(self, log: ISSFetchLog) -> None:
+        self.id = log.id
+        self.fetched_at = log.fetched_at
+        self.source_url = log.source_url
+        self.payload = log.payload
+        self.latitude = log.latitude
+        self.longitude = log.longitude
+        self.altitude = log.altitude
+        self.velocity = log.velocity
+        # /last response body, rendered on first use
+        self.rendered: bytes | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ISSSample":
+        """Build a sample from an ``iss`` change notification."""
+        sample = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(sample, name, data.get(name))
+        sample.rendered = None
+        if isinstance(sample.fetched_at, str):
+            sample.fetched_at = datetime.fromisoformat(sample.fetched_at)
+        return sample
+
+
+# Most recent samples, filled on every store and warmed from the DB at startup
+iss_buffer: RingBuffer[ISSSample] = RingBuffer(settings.iss_buffer_size)
+
+
+def remember_sample(log: ISSFetchLog | ISSSample) -> None:
+    """Append a stored row to the buffer unless it is older than the newest one."""
+    latest = iss_buffer.latest()
+    if latest is None or log.id > latest.id:
+        iss_buffer.append(log if isinstance(log, ISSSample) else ISSSample(log))
+
 
 class ISSService:
     def __init__(self, session: AsyncSession):
@@ -23,23 +93,122 @@ class ISSService:
         """Fetch ISS data from API and store in database."""
         url = settings.iss_url
         payload = await self.client.get(url)
-        return await self.repo.insert(source_url=url, payload=payload)
+        log = await self.repo.insert(source_url=url, payload=payload)
+        remember_sample(log)
+        return log
+
+    @classmethod
+    async def fetch_now(cls) -> ISSResponse:
+        """Fetch and store ISS data once for all concurrent callers.
+
+        Returns the just-written row; callers arriving while a fetch is in
+        flight (or within ``fetch_min_interval`` of it) share its result.
+        """
+
+        async def fetch() -> ISSResponse:
+            async with async_session() as session:
+                log = await cls(session).fetch_and_store()
+            return cls._to_response(log)
+
+        return await _fetch_flight.do("iss", fetch)
+
+    @staticmethod
+    def _to_response(log: ISSFetchLog | ISSSample) -> ISSResponse:
+        return ISSResponse(
+            id=log.id,
+            fetched_at=log.fetched_at,
+            source_url=log.source_url,
+            payload=log.payload,
+        )
+
+    @classmethod
+    async def apply_change(cls, data: dict[str, Any]) -> ISSResponse | None:
+        """Apply an ``iss`` change notification from any worker to the buffer.
+
+        Returns the new sample as an ``/last`` response, or None if it is not
+        newer than what the buffer already has.
+        """
+        if data.get("reload"):
+            # Stored rows changed in place, buffered copies of them are stale
+            iss_buffer.clear()
+            await cls.warm_buffer()
+            return None
+
+        if data.get("truncated"):
+            # The notification carried no row; catch up from the table
+            before = iss_buffer.latest()
+            await cls.warm_buffer()
+            latest = iss_buffer.latest()
+            return cls._to_response(latest) if latest is not before else None
+
+        sample = ISSSample.from_dict(data)
+        latest = iss_buffer.latest()
+        if latest is not None and sample.id < latest.id:
+            return None
+        remember_sample(sample)
+        return cls._to_response(sample)
+
+    @classmethod
+    async def backfill_telemetry(cls) -> int:
+        """Populate typed telemetry columns for rows stored before they existed.
+
+        Runs on the scheduler leader only; every worker (this one included)
+        reloads its buffer from the ``reload`` notification that follows.
+        """
+        async with async_session() as session:
+            return await cls(session).repo.backfill_telemetry()
+
+    @classmethod
+    async def warm_buffer(cls) -> int:
+        """Load the most recent rows into the in-memory buffer."""
+        async with async_session() as session:
+            logs = await cls(session).repo.get_recent(iss_buffer.capacity)
+        for log in reversed(logs):
+            remember_sample(log)
+        return len(logs)
 
     async def get_latest(self) -> ISSResponse:
-        """Get the most recent ISS data."""
+        """Get the most recent ISS data, from memory when the buffer is warm."""
+        sample = iss_buffer.latest()
+        if sample is not None:
+            return self._to_response(sample)
+
         log = await self.repo.get_latest()
         if log:
-            return ISSResponse(
-                id=log.id,
-                fetched_at=log.fetched_at,
-                source_url=log.source_url,
-                payload=log.payload,
-            )
+            return self._to_response(log)
         return ISSResponse(message="no data")
 
+    async def render_latest(self) -> bytes:
+        """Render ``get_latest`` as JSON.
+
+        A buffered sample is rendered once and reused until the next one
+        arrives; the database fallback passes the JSONB payload through.
+        """
+        sample = iss_buffer.latest()
+        if sample is not None:
+            if sample.rendered is None:
+                sample.rendered = self._to_response(sample).model_dump_json().encode()
+            return sample.rendered
+
+        row = await self.repo.get_latest_raw()
+        if row is None:
+            return ISSResponse(message="no data").model_dump_json().encode()
+        return render_object(
+            {
+                "id": row.id,
+                "fetched_at": row.fetched_at,
+                "source_url": row.source_url,
+                "payload": RawJSON(row.payload),
+                "message": None,
+            }
+        )
+
     async def get_trend(self) -> TrendResponse:
         """Calculate ISS movement trend from last two records."""
-        logs = await self.repo.get_last_two()
+        if len(iss_buffer) >= 2:
+            logs = [iss_buffer.latest(), iss_buffer.latest(1)]
+        else:
+            logs = await self.repo.get_last_two_samples()
 
         if len(logs) < 2:
             return TrendResponse(
@@ -51,11 +220,9 @@ class ISSService:
         # logs[0] is newer, logs[1] is older
         newer, older = logs[0], logs[1]
 
-        lat1 = extract_number(older.payload, "latitude")
-        lon1 = extract_number(older.payload, "longitude")
-        lat2 = extract_number(newer.payload, "latitude")
-        lon2 = extract_number(newer.payload, "longitude")
-        velocity = extract_number(newer.payload, "velocity")
+        lat1, lon1 = older.latitude, older.longitude
+        lat2, lon2 = newer.latitude, newer.longitude
+        velocity = newer.velocity
 
         delta_km = 0.0
         movement = False
@@ -78,3 +245,179 @@ class ISSService:
             to_lat=lat2,
             to_lon=lon2,
         )
+
+    async def get_history(
+        self, start: datetime, end: datetime, max_points: int
+    ) -> ISSHistoryResponse:
+        """Get the ground track for a time range, downsampled to ``max_points``.
+
+        Samples are loaded as one array per column into numpy, about 8 bytes
+        per value, and reduced with LTTB on (time, latitude), which keeps the
+        orbit's turning points so the drawn track keeps its shape.
+        """
+        epochs, lats, lons, alts, vels = (
+            np.asarray(column, dtype=float)
+            for column in await self.repo.get_sample_arrays(start, end)
+        )
+
+        indices = lttb(epochs, lats, max_points)
+        return ISSHistoryResponse(
+            from_time=start,
+            to_time=end,
+            total_samples=len(epochs),
+            count=len(indices),
+            points=[
+                ISSTrackPoint(
+                    at=datetime.fromtimestamp(epochs[i], tz=timezone.utc),
+                    latitude=lats[i],
+                    longitude=lons[i],
+                    # NULL columns became NaN in the float arrays
+                    altitude=None if np.isnan(alts[i]) else alts[i],
+                    velocity=None if np.isnan(vels[i]) else vels[i],
+                )
+                for i in indices
+            ],
+        )
+
+    async def get_stats(self, start: datetime, end: datetime) -> ISSStatsResponse:
+        """Compute distance, speed, outlier and gap statistics for a time range."""
+        epochs, lats, lons, _, vels = await self.repo.get_sample_arrays(start, end)
+
+        stats = track_stats(
+            np.asarray(epochs, dtype=float),
+            np.asarray(lats, dtype=float),
+            np.asarray(lons, dtype=float),
+            np.asarray(vels, dtype=float),
+            gap_seconds=settings.iss_gap_seconds,
+            max_speed_kmh=settings.iss_outlier_speed_kmh,
+        )
+        stats["gaps"] = [
+            {
+                "start": datetime.fromtimestamp(gap["start"], tz=timezone.utc),
+                "end": datetime.fromtimestamp(gap["end"], tz=timezone.utc),
+                "seconds": gap["seconds"],
+            }
+            for gap in stats["gaps"]
+        ]
+        return ISSStatsResponse(from_time=start, to_time=end, **stats)
+
+    async def _position_samples(self) -> list[ISSSample]:
+        """Recent samples with coordinates, oldest first."""
+        samples = list(iss_buffer)
+        if not samples:
+            logs = await self.repo.get_recent(settings.iss_buffer_size)
+            samples = [ISSSample(log) for log in reversed(logs)]
+        return [s for s in samples if s.latitude is not None and s.longitude is not None]
+
+    @staticmethod
+    def _predict(older: ISSSample, newer: ISSSample, t: float) -> tuple[float, float] | None:
+        return propagate(
+            older.fetched_at.timestamp(),
+            older.latitude,
+            older.longitude,
+            newer.fetched_at.timestamp(),
+            newer.latitude,
+            newer.longitude,
+            t,
+            velocity_kmh=newer.velocity,
+            altitude_km=newer.altitude,
+        )
+
+    @classmethod
+    def _estimate(
+        cls, samples: list[ISSSample], epochs: list[float], at: datetime
+    ) -> ISSPositionEstimate:
+        t = at.timestamp()
+        i = bisect_left(epochs, t)
+
+        if i < len(epochs) and epochs[i] == t:
+            s = samples[i]
+            return ISSPositionEstimate(
+                at=at,
+                method="sample",
+                latitude=s.latitude,
+                longitude=s.longitude,
+                altitude=s.altitude,
+                horizon_sec=0.0,
+            )
+
+        if i == 0 or len(samples) < 2:
+            return ISSPositionEstimate(at=at, method="unavailable")
+
+        if i < len(samples):
+            older, newer = samples[i - 1], samples[i]
+            if epochs[i] - epochs[i - 1] > settings.iss_gap_seconds:
+                return ISSPositionEstimate(at=at, method="unavailable")
+            method = "interpolated"
+            horizon = min(t - epochs[i - 1], epochs[i] - t)
+            altitude = None
+            if older.altitude is not None and newer.altitude is not None:
+                f = (t - epochs[i - 1]) / (epochs[i] - epochs[i - 1])
+                altitude = older.altitude + (newer.altitude - older.altitude) * f
+        else:
+            older, newer = samples[-2], samples[-1]
+            horizon = t - epochs[-1]
+            if (
+                horizon > settings.iss_max_extrapolation_sec
+                or epochs[-1] - epochs[-2] > settings.iss_gap_seconds
+            ):
+                return ISSPositionEstimate(at=at, method="unavailable")
+            method = "extrapolated"
+            altitude = newer.altitude
+
+        point = cls._predict(older, newer, t)
+        if point is None:
+            return ISSPositionEstimate(at=at, method="unavailable")
+        return ISSPositionEstimate(
+            at=at,
+            method=method,
+            latitude=point[0],
+            longitude=point[1],
+            altitude=altitude,
+            horizon_sec=horizon,
+        )
+
+    @classmethod
+    def _backtest(cls, samples: list[ISSSample]) -> dict[str, Any]:
+        """Predict each sample from the two before it and compare with reality."""
+        errors: list[float] = []
+        horizons: list[float] = []
+        for older, newer, actual in zip(samples, samples[1:], samples[2:]):
+            t = actual.fetched_at.timestamp()
+            horizon = t - newer.fetched_at.timestamp()
+            span = newer.fetched_at.timestamp() - older.fetched_at.timestamp()
+            if horizon > settings.iss_max_extrapolation_sec or span > settings.iss_gap_seconds:
+                continue
+            point = cls._predict(older, newer, t)
+            if point is None:
+                continue
+            errors.append(haversine_km(point[0], point[1], actual.latitude, actual.longitude))
+            horizons.append(horizon)
+
+        if not errors:
+            return {"backtest_samples": 0}
+        return {
+            "backtest_samples": len(errors),
+            "backtest_mean_horizon_sec": sum(horizons) / len(horizons),
+            "backtest_mean_error_km": sum(errors) / len(errors),
+            "backtest_max_error_km": max(errors),
+        }
+
+    async def get_positions(self, timestamps: list[datetime]) -> ISSPositionResponse:
+        """Estimate ISS positions at the given times from recent samples.
+
+        Times between two samples are interpolated along the great circle
+        through them; times after the newest sample are extrapolated using its
+        reported velocity, up to ``iss_max_extrapolation_sec``. The response
+        also carries the extrapolation error measured against the buffered
+        samples, each predicted from the two before it.
+        """
+        samples = await self._position_samples()
+        epochs = [s.fetched_at.timestamp() for s in samples]
+        points = [self._estimate(samples, epochs, at) for at in timestamps]
+        return ISSPositionResponse(
+            count=len(points),
+            points=points,
+            latest_sample_at=samples[-1].fetched_at if samples else None,
+            **self._backtest(samples),
+        )
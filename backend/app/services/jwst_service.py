@@ -1,5 +1,6 @@
 """JWST API service for fetching James Webb Space Telescope images."""
 
+import asyncio
 import logging
 import re
 from typing import Any
@@ -9,6 +10,9 @@ from app.services.http_client import HttpClient
 
 logger = logging.getLogger(__name__)
 
+_IMAGE_URL_RE = re.compile(r"^https?://.*\.(jpg|jpeg|png)$", re.IGNORECASE)
+_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
 
 class JWSTService:
     """Service for interacting with JWST API."""
@@ -32,27 +36,28 @@ class JWSTService:
         return headers
 
     @staticmethod
-    def _pick_image_url(data: Any) -> str | None:
+    def _pick_image_url(data: Any, max_depth: int = 8) -> str | None:
         """
-        Recursively search for image URL in arbitrary data structure.
+        Search for image URL in arbitrary data structure (depth-first, in order).
         Based on PHP JwstHelper::pickImageUrl pattern.
-        """
-        if isinstance(data, str):
-            if re.match(r"^https?://.*\.(jpg|jpeg|png)$", data, re.IGNORECASE):
-                return data
-            return None
 
-        if isinstance(data, dict):
-            for value in data.values():
-                result = JWSTService._pick_image_url(value)
-                if result:
-                    return result
-
-        if isinstance(data, list):
-            for item in data:
-                result = JWSTService._pick_image_url(item)
-                if result:
-                    return result
+        Iterative and bounded by ``max_depth``; the regex only runs on strings
+        that already end with an image extension.
+        """
+        stack: list[tuple[Any, int]] = [(data, 0)]
+        while stack:
+            value, depth = stack.pop()
+            if isinstance(value, str):
+                if value[-5:].lower().endswith(_IMAGE_EXTENSIONS) and _IMAGE_URL_RE.match(value):
+                    return value
+            elif depth < max_depth:
+                if isinstance(value, dict):
+                    children = reversed(value.values())
+                elif isinstance(value, list):
+                    children = reversed(value)
+                else:
+                    continue
+                stack.extend((child, depth + 1) for child in children)
 
         return None
 
@@ -87,6 +92,18 @@ class JWSTService:
             logger.error(f"JWST API error for {path}: {e}")
             raise
 
+    @staticmethod
+    def _parse_cursor(cursor: str | None, default_page_size: int) -> tuple[int, int, int]:
+        """Parse a 'page_size:page:offset' cursor; invalid cursors start over."""
+        if cursor:
+            try:
+                page_size, page, offset = (int(part) for part in cursor.split(":"))
+                if page_size > 0 and page > 0 and offset >= 0:
+                    return page_size, page, offset
+            except ValueError:
+                pass
+        return default_page_size, 1, 0
+
     async def get_feed(
         self,
         source: str = "jpg",
@@ -94,19 +111,25 @@ class JWSTService:
         program: str | None = None,
         instrument: str | None = None,
         per_page: int = 24,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """
         Get JWST image feed.
 
+        Upstream pages are fetched until ``per_page`` items survive the
+        instrument filter or the source is exhausted. After the first page,
+        further pages are requested concurrently in small batches.
+
         Args:
             source: Type of query - 'jpg', 'suffix', or 'program'
             suffix: Suffix filter (when source='suffix')
             program: Program ID (when source='program')
             instrument: Optional instrument filter (NIRCam, MIRI, NIRISS, NIRSpec, FGS)
             per_page: Number of items to return
+            cursor: Opaque cursor from a previous response to continue from
 
         Returns:
-            Dict with source, count, and items list
+            Dict with source, count, items list and next_cursor (None when exhausted)
         """
         # Build API path based on source type
         if source == "suffix" and suffix:
@@ -117,27 +140,65 @@ class JWSTService:
             path = "all/type/jpg"
             source = "jpg"
 
-        # Fetch raw data
-        raw_items = await self._fetch(path, params={"perPage": min(per_page * 2, 100)})
+        page_size, page, offset = self._parse_cursor(cursor, min(per_page * 2, 100))
+        instrument_filter = (
+            instrument.upper() if instrument and instrument in self.VALID_INSTRUMENTS else None
+        )
+        first_page = page
+        last_page = page + settings.jwst_max_pages - 1
 
-        # Extract image items
         items: list[dict[str, Any]] = []
-        for raw_item in raw_items:
-            if not isinstance(raw_item, dict):
-                continue
-            item = self._extract_image_item(raw_item)
-            if item:
-                # Apply instrument filter if specified
-                if instrument and instrument in self.VALID_INSTRUMENTS:
-                    item_instrument = item.get("instrument", "").upper()
-                    if instrument.upper() not in item_instrument:
+        next_cursor: str | None = None
+        batch = 1  # the first page alone often suffices
+
+        while page <= last_page:
+            pages = list(range(page, min(page + batch, last_page + 1)))
+            results = await asyncio.gather(
+                *(self._fetch(path, params={"page": p, "perPage": page_size}) for p in pages),
+                return_exceptions=True,
+            )
+
+            for current, raw_items in zip(pages, results):
+                if isinstance(raw_items, BaseException):
+                    if current == first_page:
+                        raise raw_items
+                    # Later page failed - return what we have, resume from it
+                    return self._feed(source, items, f"{page_size}:{current}:0")
+
+                start = offset if current == first_page else 0
+                for index in range(start, len(raw_items)):
+                    raw_item = raw_items[index]
+                    if not isinstance(raw_item, dict):
+                        continue
+                    item = self._extract_image_item(raw_item)
+                    if not item:
                         continue
-                items.append(item)
-                if len(items) >= per_page:
-                    break
+                    # Apply instrument filter if specified
+                    if instrument_filter and instrument_filter not in item["instrument"].upper():
+                        continue
+                    items.append(item)
+                    if len(items) >= per_page:
+                        if index + 1 < len(raw_items):
+                            next_cursor = f"{page_size}:{current}:{index + 1}"
+                        elif len(raw_items) >= page_size:
+                            next_cursor = f"{page_size}:{current + 1}:0"
+                        return self._feed(source, items, next_cursor)
+
+                if len(raw_items) < page_size:
+                    # Short page - the source is exhausted
+                    return self._feed(source, items, None)
 
+            page = pages[-1] + 1
+            batch = settings.jwst_concurrent_pages
+
+        # Page budget used up without filling per_page
+        return self._feed(source, items, f"{page_size}:{page}:0")
+
+    @staticmethod
+    def _feed(source: str, items: list[dict[str, Any]], next_cursor: str | None) -> dict[str, Any]:
         return {
             "source": source,
             "count": len(items),
             "items": items,
+            "next_cursor": next_cursor,
         }
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up a periodic sleeper.
+
+    Every ``loop_lag_interval`` seconds the monitor sleeps and records by how
+    much the wake-up overshot, i.e. how long some callback kept the loop busy.
+    Lags above ``loop_lag_warn_ms`` are counted and logged.
+    """
+
+    def __init__(self, interval: float, window: int = 600) -> None:
+        self.interval = interval
+        self._samples: deque[float] = deque(maxlen=window)
+        self.max_ms = 0.0
+        self.stalls = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def record(self, lag_ms: float) -> None:
+        self._samples.append(lag_ms)
+        self.max_ms = max(self.max_ms, lag_ms)
+        if lag_ms >= settings.loop_lag_warn_ms:
+            self.stalls += 1
+            logger.warning(f"Event loop blocked for {lag_ms:.0f}ms")
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.record(max((time.perf_counter() - start - self.interval) * 1000, 0.0))
+
+    def stats(self) -> dict[str, Any]:
+        samples = sorted(self._samples)
+        count = len(samples)
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_sec": self.interval,
+            "samples": count,
+            "mean_ms": round(sum(samples) / count, 3) if count else 0.0,
+            "p99_ms": round(samples[min(int(count * 0.99), count - 1)], 3) if count else 0.0,
+            "window_max_ms": round(samples[-1], 3) if count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "stalls": self.stalls,
+        }
+
+
+loop_monitor = LoopLagMonitor(settings.loop_lag_interval)
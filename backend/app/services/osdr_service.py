@@ -1,35 +1,57 @@
+import asyncio
 import logging
+from datetime import datetime
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.database import async_session
 from app.repositories.osdr_repo import OSDRRepository
 from app.schemas.osdr import OSDRItemResponse, OSDRListResponse, OSDRSyncResponse
-from app.services.http_client import HttpClient
+from app.services.http_client import NOT_MODIFIED, HttpClient
+from app.services.rate_budget import nasa_credential
+from app.utils.content_hash import content_hash
 from app.utils.json_extract import extract_string, extract_timestamp
+from app.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Coalesces concurrent syncs triggered by /osdr/sync and the scheduler
+_sync_flight = SingleFlight(min_interval=settings.fetch_min_interval)
+
 
 class OSDRService:
     def __init__(self, session: AsyncSession):
         self.repo = OSDRRepository(session)
         self.client = HttpClient(timeout=30.0)
 
-    async def fetch_and_store(self) -> int:
-        """Fetch OSDR data from API and upsert into database."""
+    async def fetch_and_store(self) -> OSDRSyncResponse:
+        """Fetch OSDR data from API and bulk upsert into database."""
         url = settings.osdr_url
-        params = {}
-        if settings.nasa_api_key:
-            params["api_key"] = settings.nasa_api_key
+        params = {"api_key": settings.nasa_api_key} if settings.nasa_api_key else None
 
         try:
-            data = await self.client.get(url, params=params if params else None)
+            data = await self.client.get(
+                url, params=params, conditional=True, rate_key=nasa_credential()
+            )
         except Exception as e:
             logger.error(f"OSDR fetch error: {e}")
             raise
 
+        if data is NOT_MODIFIED:
+            logger.info("OSDR catalog not modified upstream, skipping sync")
+            return OSDRSyncResponse(written=0, not_modified=True)
+
+        try:
+            return await self._store(data)
+        except Exception:
+            # Without the rows stored, the next sync must download the body again
+            self.client.forget(url, params)
+            raise
+
+    async def _store(self, data: Any) -> OSDRSyncResponse:
+        """Parse an OSDR catalog response and upsert the changed datasets."""
         # Parse items from response - handle multiple formats
         items: list[dict[str, Any]] = []
         if isinstance(data, list):
@@ -42,7 +64,40 @@ class OSDRService:
             else:
                 items = [data]
 
-        written = 0
+        # Change detection: skip datasets whose upstream timestamp is not newer
+        # or whose content hash matches what is already stored
+        known, known_unkeyed = await self.repo.get_sync_index()
+        if len(items) >= settings.osdr_offload_min_items:
+            # Pure Python per item: in a thread the loop still gets its turns
+            rows, skipped = await asyncio.to_thread(
+                self._changed_rows, items, known, known_unkeyed
+            )
+        else:
+            rows, skipped = self._changed_rows(items, known, known_unkeyed)
+
+        inserted, updated, unchanged = await self.repo.upsert_many(
+            rows, chunk_size=settings.osdr_upsert_chunk_size
+        )
+        return OSDRSyncResponse(
+            written=inserted + updated,
+            inserted=inserted,
+            updated=updated,
+            unchanged=unchanged + skipped,
+        )
+
+    @staticmethod
+    def _changed_rows(
+        items: list[Any],
+        known: dict[str, tuple[str | None, datetime | None]],
+        known_unkeyed: set[str],
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Build upsert rows for new or changed datasets.
+
+        Returns:
+            Rows to upsert and the number of items skipped as unchanged
+        """
+        rows: list[dict[str, Any]] = []
+        skipped = 0
         for item in items:
             if not isinstance(item, dict):
                 continue
@@ -51,28 +106,52 @@ class OSDRService:
                 item,
                 ["dataset_id", "id", "uuid", "studyId", "accession", "osdr_id"],
             )
-            title = extract_string(item, ["title", "name", "label"])
-            status = extract_string(item, ["status", "state", "lifecycle"])
             updated_at = extract_timestamp(
                 item,
                 ["updated", "updated_at", "modified", "lastUpdated", "timestamp"],
             )
 
-            await self.repo.upsert(
-                dataset_id=dataset_id,
-                title=title,
-                status=status,
-                updated_at=updated_at,
-                raw=item,
+            stored = known.get(dataset_id) if dataset_id else None
+            if stored and stored[1] and updated_at and updated_at <= stored[1]:
+                skipped += 1
+                continue
+
+            row_hash = content_hash(item)
+            if dataset_id:
+                if stored and stored[0] == row_hash:
+                    skipped += 1
+                    continue
+            else:
+                if row_hash in known_unkeyed:
+                    skipped += 1
+                    continue
+                known_unkeyed.add(row_hash)
+
+            rows.append(
+                {
+                    "dataset_id": dataset_id,
+                    "title": extract_string(item, ["title", "name", "label"]),
+                    "status": extract_string(item, ["status", "state", "lifecycle"]),
+                    "updated_at": updated_at,
+                    "raw": item,
+                    "content_hash": row_hash,
+                }
             )
-            written += 1
 
-        return written
+        return rows, skipped
+
+    @classmethod
+    async def sync(cls) -> OSDRSyncResponse:
+        """Trigger sync and return counts of written items.
+
+        Concurrent callers share one in-flight sync and its result.
+        """
+
+        async def run() -> OSDRSyncResponse:
+            async with async_session() as session:
+                return await cls(session).fetch_and_store()
 
-    async def sync(self) -> OSDRSyncResponse:
-        """Trigger sync and return count of written items."""
-        written = await self.fetch_and_store()
-        return OSDRSyncResponse(written=written)
+        return await _sync_flight.do("osdr", run)
 
     async def get_list(self, limit: int = 20) -> OSDRListResponse:
         """Get list of OSDR items."""
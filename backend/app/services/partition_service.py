@@ -0,0 +1,161 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session
+from app.models.iss import ISSFetchLog
+from app.models.space_cache import SpaceCache
+from app.repositories.partition_repo import PartitionRepository
+from app.repositories.space_cache_repo import SpaceCacheRepository
+from app.schemas.admin import PartitionMaintenanceResponse, PartitionStatsResponse
+
+logger = logging.getLogger(__name__)
+
+# Tables partitioned by day on fetched_at
+PARTITIONED_TABLES = {
+    ISSFetchLog.__tablename__: ISSFetchLog.__table__,
+    SpaceCache.__tablename__: SpaceCache.__table__,
+}
+
+
+def _retention_days(table: str) -> int:
+    if table == ISSFetchLog.__tablename__:
+        return settings.iss_retention_days
+    return settings.space_cache_retention_days
+
+
+def _start_of_day(value: datetime) -> datetime:
+    return value.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class PartitionService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repo = PartitionRepository(session)
+
+    @classmethod
+    async def rename_legacy_tables(cls) -> list[str]:
+        """Rename plain (pre-partitioning) tables so ``create_all`` can replace them.
+
+        Returns:
+            Names of the managed tables that were renamed
+        """
+        renamed = []
+        async with async_session() as session:
+            repo = PartitionRepository(session)
+            await repo.lock()
+            for table in PARTITIONED_TABLES:
+                kind = await repo.table_kind(table)
+                if kind is not None and kind[0] == "r":
+                    await repo.rename_legacy(table)
+                    renamed.append(table)
+            await session.commit()
+        return renamed
+
+    @classmethod
+    async def attach_legacy_tables(cls) -> None:
+        """Attach renamed legacy tables as the oldest partition of their parents."""
+        async with async_session() as session:
+            repo = PartitionRepository(session)
+            await repo.lock()
+            for table, parent in PARTITIONED_TABLES.items():
+                legacy = f"{table}_legacy"
+                kind = await repo.table_kind(legacy)
+                if kind is None or kind[1]:
+                    continue
+                upper = await repo.attach_legacy(parent, legacy)
+                if upper is None:
+                    logger.info(f"Dropped empty legacy table {legacy}")
+                else:
+                    logger.info(f"Attached {legacy} as partition of {table} up to {upper}")
+            await session.commit()
+
+    async def maintain(self, now: datetime | None = None) -> PartitionMaintenanceResponse:
+        """Create upcoming daily partitions and drop expired ones.
+
+        Expired ISS partitions are rolled up into ``iss_hourly`` first (when
+        enabled). A ``space_cache`` partition holding the newest row of any
+        source is kept, so ``/space/{src}/latest`` never goes empty. Rows that
+        ended up in a default partition are expired with a DELETE. Payload
+        blobs no longer referenced by any ``space_cache`` row are removed last.
+        """
+        today = _start_of_day(now or datetime.now(timezone.utc))
+        result = PartitionMaintenanceResponse()
+        await self.repo.lock()
+
+        for table in PARTITIONED_TABLES:
+            await self.repo.create_default(table)
+            partitions = await self.repo.list_partitions(table)
+
+            for offset in range(settings.partition_premake_days + 1):
+                lower = today + timedelta(days=offset)
+                upper = lower + timedelta(days=1)
+                if any(p.overlaps(lower, upper) for p in partitions):
+                    continue
+                if await self.repo.default_has_rows(table, lower, upper):
+                    logger.warning(
+                        f"{table}_default holds rows for {lower:%Y-%m-%d}, partition not created"
+                    )
+                    continue
+                result.created.append(await self.repo.create_day(table, lower))
+
+            retention = _retention_days(table)
+            if retention <= 0:
+                continue
+            cutoff = today - timedelta(days=retention)
+            is_iss = table == ISSFetchLog.__tablename__
+            rollup = is_iss and settings.iss_rollup_enabled
+            protected = [] if is_iss else await self.repo.latest_per_source(table)
+
+            for partition in partitions:
+                if partition.is_default or partition.upper is None or partition.upper > cutoff:
+                    continue
+                if any(
+                    (partition.lower is None or partition.lower <= at) and at < partition.upper
+                    for at in protected
+                ):
+                    continue
+                if rollup:
+                    result.rolled_up_hours += await self.repo.rollup_iss(partition.name)
+                await self.repo.drop(partition.name)
+                result.dropped.append(partition.name)
+
+            if rollup:
+                result.rolled_up_hours += await self.repo.rollup_iss(f"{table}_default", cutoff)
+            result.default_rows_deleted += await self.repo.delete_default_before(
+                table, cutoff, keep_latest=not is_iss
+            )
+
+        result.payloads_deleted = await SpaceCacheRepository(
+            self.session
+        ).delete_unreferenced_payloads(timedelta(hours=1))
+
+        await self.session.commit()
+        return result
+
+    @classmethod
+    async def run_maintenance(cls) -> PartitionMaintenanceResponse:
+        async with async_session() as session:
+            return await cls(session).maintain()
+
+    async def get_stats(self) -> list[PartitionStatsResponse]:
+        """List partitions of all managed tables with their bounds and sizes."""
+        stats = []
+        for table in PARTITIONED_TABLES:
+            sizes = {row["name"]: row for row in await self.repo.sizes(table)}
+            for partition in await self.repo.list_partitions(table):
+                size = sizes.get(partition.name, {})
+                stats.append(
+                    PartitionStatsResponse(
+                        table=table,
+                        name=partition.name,
+                        lower=partition.lower,
+                        upper=partition.upper,
+                        is_default=partition.is_default,
+                        rows_estimate=max(size.get("rows_estimate", 0), 0),
+                        total_bytes=size.get("total_bytes", 0),
+                    )
+                )
+        return stats
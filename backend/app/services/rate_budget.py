@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_SCHEDULED = "scheduled"
+PRIORITY_MANUAL = "manual"
+
+# Priority of upstream calls made in the current context; scheduled jobs set it
+request_priority: ContextVar[str] = ContextVar("request_priority", default=PRIORITY_MANUAL)
+
+DEMO_KEY = "DEMO_KEY"
+
+
+def nasa_credential() -> str:
+    """Budget key for calls made with ``settings.nasa_api_key``."""
+    return settings.nasa_api_key or DEMO_KEY
+
+
+def mask_key(key: str) -> str:
+    """Shorten a credential so it can be shown without leaking it."""
+    if key == DEMO_KEY:
+        return key
+    if len(key) <= 8:
+        return "****"
+    return f"{key[:4]}...{key[-2:]}"
+
+
+class RateBudgetExceeded(Exception):
+    """A call was refused so the remaining quota is kept for higher priorities."""
+
+    def __init__(self, key: str, retry_after: float) -> None:
+        super().__init__(
+            f"rate budget for {mask_key(key)} exhausted, retry in {retry_after:.0f}s"
+        )
+        self.retry_after = retry_after
+
+
+class _Bucket:
+    """Token bucket mirroring an hourly quota, refilled continuously."""
+
+    def __init__(self, capacity: float) -> None:
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.upstream_limit: int | None = None
+        self.upstream_remaining: int | None = None
+        self.requests: dict[str, int] = {PRIORITY_SCHEDULED: 0, PRIORITY_MANUAL: 0}
+        self.deferred = 0
+        self.refused = 0
+        self.throttled = 0
+
+    @property
+    def refill_rate(self) -> float:
+        return self.capacity / 3600
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+        self.updated = now
+
+
+class RateBudget:
+    """Per-credential budget for upstream calls sharing an hourly quota.
+
+    Every call takes a token. Scheduled calls may spend the bucket down to
+    zero; manual ones only down to ``nasa_rate_reserve_ratio`` of capacity,
+    and wait up to ``nasa_rate_max_wait`` seconds for a refill before being
+    refused. The bucket is re-synced from ``X-RateLimit-Limit/Remaining`` on
+    every response, so quota spent by other workers is accounted for too.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, _Bucket] = {}
+
+    def _bucket(self, key: str) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            capacity = (
+                settings.nasa_demo_rate_limit_per_hour
+                if key == DEMO_KEY
+                else settings.nasa_rate_limit_per_hour
+            )
+            bucket = _Bucket(float(capacity))
+            self._buckets[key] = bucket
+        return bucket
+
+    async def acquire(self, key: str) -> None:
+        """Take a token for ``key``, deferring or refusing low-priority calls."""
+        priority = request_priority.get()
+        bucket = self._bucket(key)
+        scheduled = priority == PRIORITY_SCHEDULED
+        floor = 0.0 if scheduled else bucket.capacity * settings.nasa_rate_reserve_ratio
+        waited = 0.0
+        while True:
+            bucket.refill()
+            if bucket.tokens - 1 >= floor:
+                bucket.tokens -= 1
+                bucket.requests[priority] += 1
+                return
+
+            wait = (floor + 1 - bucket.tokens) / bucket.refill_rate
+            if scheduled or waited + wait > settings.nasa_rate_max_wait:
+                bucket.refused += 1
+                logger.warning(
+                    f"Rate budget for {mask_key(key)} refused a {priority} call "
+                    f"({bucket.tokens:.1f}/{bucket.capacity:.0f} tokens left)"
+                )
+                raise RateBudgetExceeded(key, wait)
+            if not waited:
+                bucket.deferred += 1
+            waited += wait
+            await asyncio.sleep(wait)
+
+    def observe(self, key: str, response: httpx.Response) -> None:
+        """Sync the bucket with the quota headers of an upstream response."""
+        bucket = self._bucket(key)
+        bucket.refill()
+        limit = response.headers.get("X-RateLimit-Limit")
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if limit is not None and limit.isdigit():
+            bucket.upstream_limit = int(limit)
+            bucket.capacity = float(bucket.upstream_limit)
+        if remaining is not None and remaining.isdigit():
+            bucket.upstream_remaining = int(remaining)
+            bucket.tokens = min(float(bucket.upstream_remaining), bucket.capacity)
+        if response.status_code == 429:
+            bucket.throttled += 1
+            bucket.tokens = 0.0
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Get usage per credential, keys masked."""
+        stats = []
+        for key, bucket in self._buckets.items():
+            bucket.refill()
+            stats.append(
+                {
+                    "key": mask_key(key),
+                    "capacity": bucket.capacity,
+                    "tokens": round(bucket.tokens, 2),
+                    "reserve": bucket.capacity * settings.nasa_rate_reserve_ratio,
+                    "upstream_limit": bucket.upstream_limit,
+                    "upstream_remaining": bucket.upstream_remaining,
+                    "scheduled_requests": bucket.requests[PRIORITY_SCHEDULED],
+                    "manual_requests": bucket.requests[PRIORITY_MANUAL],
+                    "deferred": bucket.deferred,
+                    "refused": bucket.refused,
+                    "throttled": bucket.throttled,
+                }
+            )
+        return stats
+
+
+rate_budget = RateBudget()
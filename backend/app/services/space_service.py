@@ -1,16 +1,40 @@
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.database import async_session
 from app.repositories.space_cache_repo import SpaceCacheRepository
-from app.schemas.space import SpaceLatestResponse, SpaceRefreshResponse, SpaceSummaryResponse
-from app.services.http_client import HttpClient
+from app.schemas.space import (
+    SpaceLatestResponse,
+    SpaceRefreshResponse,
+    SpaceRefreshResult,
+)
+from app.services.http_client import NOT_MODIFIED, HttpClient, retry_after_seconds
+from app.services.rate_budget import nasa_credential
+from app.utils.raw_json import RawJSON, render_object
+from app.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+SUMMARY_SOURCES = ["apod", "neo", "flr", "cme", "spacex"]
+
+# Source name -> SpaceService fetch method
+FETCHERS = {
+    "apod": "fetch_apod",
+    "neo": "fetch_neo",
+    "flr": "fetch_donki_flr",
+    "cme": "fetch_donki_cme",
+    "spacex": "fetch_spacex",
+}
+
+# Coalesces concurrent refreshes of the same source
+_refresh_flight = SingleFlight(min_interval=settings.fetch_min_interval)
+
 
 class SpaceService:
     def __init__(self, session: AsyncSession):
@@ -23,7 +47,35 @@ class SpaceService:
         start = today - timedelta(days=days)
         return str(start), str(today)
 
-    async def fetch_apod(self) -> None:
+    async def _fetch_and_store(
+        self,
+        source: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        rate_key: str | None = None,
+    ) -> bool:
+        """Conditionally fetch a source and store it in the cache.
+
+        Returns False when upstream answers 304 Not Modified or returns the
+        same payload as the latest row; then only its last-checked time moves.
+        """
+        data = await self.client.get(url, params=params, conditional=True, rate_key=rate_key)
+        if data is NOT_MODIFIED:
+            logger.info(f"{source} not modified upstream, skipping write")
+            await self.repo.touch_latest(source)
+            return False
+
+        try:
+            stored = await self.repo.store(source=source, payload=data)
+        except Exception:
+            # Without the row stored, the next fetch must download the body again
+            self.client.forget(url, params)
+            raise
+        if not stored:
+            logger.info(f"{source} payload unchanged, skipping write")
+        return stored
+
+    async def fetch_apod(self) -> bool:
         """Fetch Astronomy Picture of the Day."""
         url = settings.apod_url
         params = {"thumbs": "true"}
@@ -31,13 +83,12 @@ class SpaceService:
             params["api_key"] = settings.nasa_api_key
 
         try:
-            data = await self.client.get(url, params=params)
-            await self.repo.insert(source="apod", payload=data)
+            return await self._fetch_and_store("apod", url, params, nasa_credential())
         except Exception as e:
             logger.error(f"APOD fetch error: {e}")
             raise
 
-    async def fetch_neo(self) -> None:
+    async def fetch_neo(self) -> bool:
         """Fetch Near-Earth Objects data."""
         url = settings.neo_url
         start_date, end_date = self._get_date_range(2)
@@ -46,13 +97,12 @@ class SpaceService:
             params["api_key"] = settings.nasa_api_key
 
         try:
-            data = await self.client.get(url, params=params)
-            await self.repo.insert(source="neo", payload=data)
+            return await self._fetch_and_store("neo", url, params, nasa_credential())
         except Exception as e:
             logger.error(f"NEO fetch error: {e}")
             raise
 
-    async def fetch_donki_flr(self) -> None:
+    async def fetch_donki_flr(self) -> bool:
         """Fetch Solar Flare data from DONKI."""
         url = settings.donki_flr_url
         start_date, end_date = self._get_date_range(5)
@@ -61,13 +111,12 @@ class SpaceService:
             params["api_key"] = settings.nasa_api_key
 
         try:
-            data = await self.client.get(url, params=params)
-            await self.repo.insert(source="flr", payload=data)
+            return await self._fetch_and_store("flr", url, params, nasa_credential())
         except Exception as e:
             logger.error(f"DONKI FLR fetch error: {e}")
             raise
 
-    async def fetch_donki_cme(self) -> None:
+    async def fetch_donki_cme(self) -> bool:
         """Fetch Coronal Mass Ejection data from DONKI."""
         url = settings.donki_cme_url
         start_date, end_date = self._get_date_range(5)
@@ -76,76 +125,85 @@ class SpaceService:
             params["api_key"] = settings.nasa_api_key
 
         try:
-            data = await self.client.get(url, params=params)
-            await self.repo.insert(source="cme", payload=data)
+            return await self._fetch_and_store("cme", url, params, nasa_credential())
         except Exception as e:
             logger.error(f"DONKI CME fetch error: {e}")
             raise
 
-    async def fetch_spacex(self) -> None:
+    async def fetch_spacex(self) -> bool:
         """Fetch next SpaceX launch data."""
         url = settings.spacex_url
 
         try:
-            data = await self.client.get(url)
-            await self.repo.insert(source="spacex", payload=data)
+            return await self._fetch_and_store("spacex", url)
         except Exception as e:
             logger.error(f"SpaceX fetch error: {e}")
             raise
 
-    async def get_latest(self, source: str) -> SpaceLatestResponse:
-        """Get latest cached data for a specific source."""
-        cache = await self.repo.get_latest(source)
-        if cache:
-            return SpaceLatestResponse(
-                source=source,
-                fetched_at=cache.fetched_at,
-                payload=cache.payload,
+    async def render_latest(self, source: str) -> bytes:
+        """Render a source's latest cache row, passing the payload through from JSONB."""
+        row = await self.repo.get_latest_raw(source)
+        if row is None:
+            return SpaceLatestResponse(source=source, message="no data").model_dump_json().encode()
+        return render_object(
+            {
+                "source": source,
+                "fetched_at": row.at,
+                "changed_at": row.fetched_at,
+                "payload": RawJSON(row.payload),
+                "message": None,
+            }
+        )
+
+    @classmethod
+    async def refresh(cls, sources: list[str]) -> SpaceRefreshResponse:
+        """Refresh specified sources concurrently.
+
+        Each source runs on its own session under a shared concurrency cap and
+        a per-source timeout, so one slow upstream does not hold up the rest.
+        Concurrent refreshes of the same source share one upstream call.
+        """
+        semaphore = asyncio.Semaphore(settings.space_refresh_concurrency)
+
+        async def fetch(fetcher: str) -> bool:
+            async with async_session() as session:
+                return await getattr(cls(session), fetcher)()
+
+        async def refresh_one(src: str) -> SpaceRefreshResult:
+            fetcher = FETCHERS.get(src)
+            if fetcher is None:
+                return SpaceRefreshResult(source=src, ok=False, error="unknown source")
+
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    # The shared fetch keeps running for other callers if we time out
+                    stored = await asyncio.wait_for(
+                        _refresh_flight.do(src, lambda: fetch(fetcher)),
+                        timeout=settings.space_refresh_timeout,
+                    )
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+                    logger.error(f"Failed to refresh {src}: {error}")
+                    return SpaceRefreshResult(
+                        source=src,
+                        ok=False,
+                        error=error,
+                        retry_after=retry_after_seconds(e),
+                        duration_ms=(time.perf_counter() - start) * 1000,
+                    )
+
+            return SpaceRefreshResult(
+                source=src,
+                ok=True,
+                not_modified=not stored,
+                duration_ms=(time.perf_counter() - start) * 1000,
             )
-        return SpaceLatestResponse(source=source, message="no data")
-
-    async def refresh(self, sources: list[str]) -> SpaceRefreshResponse:
-        """Refresh specified sources."""
-        refreshed = []
-        for src in sources:
-            src_lower = src.strip().lower()
-            try:
-                if src_lower == "apod":
-                    await self.fetch_apod()
-                    refreshed.append("apod")
-                elif src_lower == "neo":
-                    await self.fetch_neo()
-                    refreshed.append("neo")
-                elif src_lower == "flr":
-                    await self.fetch_donki_flr()
-                    refreshed.append("flr")
-                elif src_lower == "cme":
-                    await self.fetch_donki_cme()
-                    refreshed.append("cme")
-                elif src_lower == "spacex":
-                    await self.fetch_spacex()
-                    refreshed.append("spacex")
-            except Exception as e:
-                logger.error(f"Failed to refresh {src}: {e}")
-
-        return SpaceRefreshResponse(refreshed=refreshed)
-
-    async def get_summary(
-        self, iss_data: dict[str, Any], osdr_count: int
-    ) -> SpaceSummaryResponse:
-        """Get summary of all cached data sources."""
-        apod = await self.repo.get_latest_dict("apod")
-        neo = await self.repo.get_latest_dict("neo")
-        flr = await self.repo.get_latest_dict("flr")
-        cme = await self.repo.get_latest_dict("cme")
-        spacex = await self.repo.get_latest_dict("spacex")
-
-        return SpaceSummaryResponse(
-            apod=apod,
-            neo=neo,
-            flr=flr,
-            cme=cme,
-            spacex=spacex,
-            iss=iss_data,
-            osdr_count=osdr_count,
+
+        unique_sources = list(dict.fromkeys(src.strip().lower() for src in sources))
+        results = await asyncio.gather(*(refresh_one(src) for src in unique_sources))
+
+        return SpaceRefreshResponse(
+            refreshed=[result.source for result in results if result.ok],
+            results=list(results),
         )
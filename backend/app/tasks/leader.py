@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import asyncpg
+
+from app.config import settings
+from app.database import asyncpg_dsn
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulerLeader:
+    """Elects one worker to run scheduled jobs via a Postgres advisory lock.
+
+    Every worker polls ``pg_try_advisory_lock`` on its own dedicated
+    connection. The lock is tied to that connection, so when the leader dies
+    Postgres releases it and another worker takes over on its next poll.
+    A leader that loses its connection steps down at once.
+    """
+
+    def __init__(
+        self,
+        lock_key: int,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None],
+    ) -> None:
+        self.lock_key = lock_key
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.is_leader = False
+        self.leader_since: datetime | None = None
+        self.elections = 0
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        self._conn: asyncpg.Connection | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop campaigning and release the lock so another worker takes over now."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        self._demote()
+        if self._conn is not None and not self._conn.is_closed():
+            try:
+                await self._conn.close(timeout=5)
+            except Exception:
+                self._conn.terminate()
+        self._conn = None
+
+    def _promote(self) -> None:
+        self.is_leader = True
+        self.leader_since = datetime.now(timezone.utc)
+        self.elections += 1
+        logger.info(f"Worker {self.worker_id} elected scheduler leader")
+        self._on_elected()
+
+    def _demote(self) -> None:
+        if self.is_leader:
+            self.is_leader = False
+            self.leader_since = None
+            logger.warning(f"Worker {self.worker_id} is no longer scheduler leader")
+            self._on_demoted()
+
+    def _on_connection_lost(self, conn: asyncpg.Connection) -> None:
+        self._demote()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self._conn is None or self._conn.is_closed():
+                    self._demote()
+                    self._conn = await asyncpg.connect(
+                        asyncpg_dsn(),
+                        server_settings={"application_name": f"scheduler {self.worker_id}"},
+                    )
+                    self._conn.add_termination_listener(self._on_connection_lost)
+
+                if self.is_leader:
+                    # Still holding the lock as long as this connection is alive
+                    await self._conn.fetchval("SELECT 1")
+                elif await self._conn.fetchval(
+                    "SELECT pg_try_advisory_lock($1)", self.lock_key
+                ):
+                    self._promote()
+            except Exception as e:
+                logger.warning(f"Scheduler leader election error: {e}")
+                self._demote()
+                if self._conn is not None:
+                    self._conn.terminate()
+                self._conn = None
+
+            await asyncio.sleep(settings.scheduler_leader_poll_interval)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "is_leader": self.is_leader,
+            "leader_since": self.leader_since,
+            "elections": self.elections,
+        }
@@ -1,148 +1,290 @@
 import logging
-from contextlib import asynccontextmanager
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.config import settings
 from app.database import async_session
+from app.services.http_client import retry_after_seconds
 from app.services.iss_service import ISSService
 from app.services.osdr_service import OSDRService
+from app.services.partition_service import PartitionService
+from app.services.rate_budget import PRIORITY_SCHEDULED, request_priority
 from app.services.space_service import SpaceService
+from app.tasks.leader import SchedulerLeader
 
 logger = logging.getLogger(__name__)
 
-scheduler = AsyncIOScheduler()
+# Runs due jobs once (not once per missed interval) when a paused scheduler
+# is resumed, e.g. right after this worker becomes leader
+scheduler = AsyncIOScheduler(job_defaults={"coalesce": True, "misfire_grace_time": None})
 
+leader = SchedulerLeader(
+    settings.scheduler_lock_key,
+    on_elected=scheduler.resume,
+    on_demoted=scheduler.pause,
+)
 
-async def fetch_iss_task() -> None:
-    """Background task to fetch ISS data."""
+
+class JobFailed(Exception):
+    """A task failed without raising, e.g. one source of a batch refresh."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class JobState:
+    """Run history of a scheduled job, kept by ``_run_job``."""
+
+    def __init__(self, job_id: str, name: str, interval: float | None) -> None:
+        self.job_id = job_id
+        self.name = name
+        self.interval = interval
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+        self.failure_streak = 0
+        self.last_started_at: datetime | None = None
+        self.last_duration_ms: float | None = None
+        self.last_success_at: datetime | None = None
+        self.last_error: str | None = None
+        self.retry_delay: float | None = None
+
+
+job_states: dict[str, JobState] = {}
+
+
+def _policy(job_id: str, name: str, default: float) -> float:
+    override = settings.job_policies.get(job_id)
+    value = getattr(override, name) if override is not None else None
+    return default if value is None else value
+
+
+def retry_delay(job_id: str, streak: int, retry_after: float | None = None) -> float:
+    """Delay before the next attempt after ``streak`` consecutive failures.
+
+    The first retry is a quick recovery probe (``retry_base``); each further
+    failure multiplies the delay by ``backoff_factor`` up to ``backoff_max``.
+    A Retry-After from upstream is never undercut.
+    """
+    base = _policy(job_id, "retry_base", settings.job_retry_base)
+    factor = _policy(job_id, "backoff_factor", settings.job_backoff_factor)
+    cap = _policy(job_id, "backoff_max", settings.job_backoff_max)
+    delay = min(base * factor ** max(streak - 1, 0), cap)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+async def _run_job(job_id: str, task: Callable[[], Awaitable[None]]) -> None:
+    """Run a task, record its outcome and reschedule it with backoff on failure."""
+    state = job_states[job_id]
+    state.running = True
+    state.runs += 1
+    state.last_started_at = datetime.now(timezone.utc)
+    start = time.perf_counter()
+    # Scheduled fetches may spend the rate budget reserved from manual refreshes
+    priority = request_priority.set(PRIORITY_SCHEDULED)
     try:
-        async with async_session() as session:
-            service = ISSService(session)
-            await service.fetch_and_store()
-            logger.info("ISS data fetched successfully")
+        await task()
     except Exception as e:
-        logger.error(f"ISS fetch error: {e}")
+        state.failures += 1
+        state.failure_streak += 1
+        state.last_error = str(e) or type(e).__name__
+        retry_after = e.retry_after if isinstance(e, JobFailed) else retry_after_seconds(e)
+        state.retry_delay = retry_delay(job_id, state.failure_streak, retry_after)
+        logger.error(
+            f"{state.name} failed ({state.failure_streak} in a row): {state.last_error}; "
+            f"retrying in {state.retry_delay:.0f}s"
+        )
+        # One-off jobs are gone once fired, only interval jobs are retried
+        if scheduler.get_job(job_id) is not None:
+            scheduler.modify_job(
+                job_id,
+                next_run_time=datetime.now(timezone.utc) + timedelta(seconds=state.retry_delay),
+            )
+    else:
+        if state.failure_streak:
+            logger.info(f"{state.name} recovered after {state.failure_streak} failures")
+        state.failure_streak = 0
+        state.last_error = None
+        state.retry_delay = None
+        state.last_success_at = datetime.now(timezone.utc)
+    finally:
+        request_priority.reset(priority)
+        state.running = False
+        state.last_duration_ms = (time.perf_counter() - start) * 1000
+
+
+def _add_job(
+    task: Callable[[], Awaitable[None]],
+    job_id: str,
+    name: str,
+    interval: float | None = None,
+) -> None:
+    """Register a task; interval jobs get jitter and never overlap themselves."""
+    job_states[job_id] = JobState(job_id, name, interval)
+    trigger = None
+    if interval is not None:
+        jitter = _policy(job_id, "jitter", interval * settings.job_jitter_ratio)
+        trigger = IntervalTrigger(seconds=interval, jitter=int(jitter) or None)
+    scheduler.add_job(
+        _run_job,
+        trigger=trigger,
+        args=[job_id, task],
+        id=job_id,
+        name=name,
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True,
+    )
+
+
+def job_statuses() -> list[dict[str, Any]]:
+    """Get run history and next run time of all registered jobs."""
+    statuses = []
+    for job_id, state in job_states.items():
+        job = scheduler.get_job(job_id) if scheduler.running else None
+        statuses.append(
+            {
+                "id": job_id,
+                "name": state.name,
+                "interval_sec": state.interval,
+                "next_run_time": job.next_run_time if job is not None else None,
+                "running": state.running,
+                "runs": state.runs,
+                "failures": state.failures,
+                "failure_streak": state.failure_streak,
+                "last_started_at": state.last_started_at,
+                "last_duration_ms": state.last_duration_ms,
+                "last_success_at": state.last_success_at,
+                "last_error": state.last_error,
+                "retry_delay_sec": state.retry_delay,
+            }
+        )
+    return statuses
+
+
+async def fetch_iss_task() -> None:
+    """Background task to fetch ISS data."""
+    await ISSService.fetch_now()
+    logger.info("ISS data fetched successfully")
+
+
+async def backfill_iss_task() -> None:
+    """One-off task filling typed ISS telemetry columns for legacy rows."""
+    updated = await ISSService.backfill_telemetry()
+    if updated:
+        logger.info(f"ISS telemetry backfilled for {updated} rows")
+
+
+async def maintain_partitions_task() -> None:
+    """Background task creating upcoming partitions and dropping expired ones."""
+    result = await PartitionService.run_maintenance()
+    if result.created or result.dropped:
+        logger.info(
+            f"Partitions maintained: {len(result.created)} created, "
+            f"{len(result.dropped)} dropped, {result.rolled_up_hours} hours rolled up"
+        )
 
 
 async def fetch_osdr_task() -> None:
     """Background task to fetch OSDR data."""
-    try:
-        async with async_session() as session:
-            service = OSDRService(session)
-            written = await service.fetch_and_store()
-            logger.info(f"OSDR data fetched: {written} items written")
-    except Exception as e:
-        logger.error(f"OSDR fetch error: {e}")
+    result = await OSDRService.sync()
+    logger.info(
+        f"OSDR data fetched: {result.inserted} inserted, "
+        f"{result.updated} updated, {result.unchanged} unchanged"
+    )
 
 
 async def fetch_apod_task() -> None:
     """Background task to fetch APOD data."""
-    try:
-        async with async_session() as session:
-            service = SpaceService(session)
-            await service.fetch_apod()
-            logger.info("APOD data fetched successfully")
-    except Exception as e:
-        logger.error(f"APOD fetch error: {e}")
+    async with async_session() as session:
+        service = SpaceService(session)
+        await service.fetch_apod()
+        logger.info("APOD data fetched successfully")
 
 
 async def fetch_neo_task() -> None:
     """Background task to fetch NeoWs data."""
-    try:
-        async with async_session() as session:
-            service = SpaceService(session)
-            await service.fetch_neo()
-            logger.info("NEO data fetched successfully")
-    except Exception as e:
-        logger.error(f"NEO fetch error: {e}")
+    async with async_session() as session:
+        service = SpaceService(session)
+        await service.fetch_neo()
+        logger.info("NEO data fetched successfully")
 
 
 async def fetch_donki_task() -> None:
-    """Background task to fetch DONKI data (FLR and CME)."""
-    try:
-        async with async_session() as session:
-            service = SpaceService(session)
-            await service.fetch_donki_flr()
-            await service.fetch_donki_cme()
-            logger.info("DONKI data fetched successfully")
-    except Exception as e:
-        logger.error(f"DONKI fetch error: {e}")
+    """Background task to fetch DONKI data (FLR and CME concurrently)."""
+    result = await SpaceService.refresh(["flr", "cme"])
+    failed = [item for item in result.results if not item.ok]
+    for item in result.results:
+        if item.ok:
+            logger.info(f"DONKI {item.source} fetched in {item.duration_ms:.0f}ms")
+    if failed:
+        retry_after = [item.retry_after for item in failed if item.retry_after is not None]
+        raise JobFailed(
+            "; ".join(f"DONKI {item.source}: {item.error}" for item in failed),
+            retry_after=max(retry_after) if retry_after else None,
+        )
 
 
 async def fetch_spacex_task() -> None:
     """Background task to fetch SpaceX data."""
-    try:
-        async with async_session() as session:
-            service = SpaceService(session)
-            await service.fetch_spacex()
-            logger.info("SpaceX data fetched successfully")
-    except Exception as e:
-        logger.error(f"SpaceX fetch error: {e}")
+    async with async_session() as session:
+        service = SpaceService(session)
+        await service.fetch_spacex()
+        logger.info("SpaceX data fetched successfully")
 
 
 def start_scheduler() -> None:
     """Start the background scheduler with all tasks."""
     # ISS - every 2 minutes by default
-    scheduler.add_job(
-        fetch_iss_task,
-        trigger=IntervalTrigger(seconds=settings.iss_fetch_interval),
-        id="fetch_iss",
-        name="Fetch ISS Position",
-        replace_existing=True,
-    )
+    _add_job(fetch_iss_task, "fetch_iss", "Fetch ISS Position", settings.iss_fetch_interval)
 
     # OSDR - every 10 minutes by default
-    scheduler.add_job(
-        fetch_osdr_task,
-        trigger=IntervalTrigger(seconds=settings.osdr_fetch_interval),
-        id="fetch_osdr",
-        name="Fetch OSDR Data",
-        replace_existing=True,
-    )
+    _add_job(fetch_osdr_task, "fetch_osdr", "Fetch OSDR Data", settings.osdr_fetch_interval)
 
     # APOD - every 12 hours by default
-    scheduler.add_job(
-        fetch_apod_task,
-        trigger=IntervalTrigger(seconds=settings.apod_fetch_interval),
-        id="fetch_apod",
-        name="Fetch APOD",
-        replace_existing=True,
-    )
+    _add_job(fetch_apod_task, "fetch_apod", "Fetch APOD", settings.apod_fetch_interval)
 
     # NeoWs - every 2 hours by default
-    scheduler.add_job(
-        fetch_neo_task,
-        trigger=IntervalTrigger(seconds=settings.neo_fetch_interval),
-        id="fetch_neo",
-        name="Fetch NEO Data",
-        replace_existing=True,
-    )
+    _add_job(fetch_neo_task, "fetch_neo", "Fetch NEO Data", settings.neo_fetch_interval)
 
     # DONKI - every 1 hour by default
-    scheduler.add_job(
-        fetch_donki_task,
-        trigger=IntervalTrigger(seconds=settings.donki_fetch_interval),
-        id="fetch_donki",
-        name="Fetch DONKI Data",
-        replace_existing=True,
-    )
+    _add_job(fetch_donki_task, "fetch_donki", "Fetch DONKI Data", settings.donki_fetch_interval)
 
     # SpaceX - every 1 hour by default
-    scheduler.add_job(
-        fetch_spacex_task,
-        trigger=IntervalTrigger(seconds=settings.spacex_fetch_interval),
-        id="fetch_spacex",
-        name="Fetch SpaceX Data",
-        replace_existing=True,
+    _add_job(
+        fetch_spacex_task, "fetch_spacex", "Fetch SpaceX Data", settings.spacex_fetch_interval
     )
 
-    scheduler.start()
-    logger.info("Background scheduler started")
+    # Partition maintenance - every hour by default
+    _add_job(
+        maintain_partitions_task,
+        "maintain_partitions",
+        "Maintain Partitions",
+        settings.partition_maintenance_interval,
+    )
+
+    # One-off backfill of ISS telemetry columns, runs right after startup
+    _add_job(backfill_iss_task, "backfill_iss", "Backfill ISS Telemetry")
+
+    if settings.scheduler_leader_election:
+        # Jobs only run while this worker holds the leader lock
+        scheduler.start(paused=True)
+        leader.start()
+        logger.info(f"Background scheduler started, worker {leader.worker_id} awaiting leadership")
+    else:
+        scheduler.start()
+        logger.info("Background scheduler started")
 
 
-def shutdown_scheduler() -> None:
-    """Shutdown the background scheduler."""
+async def shutdown_scheduler() -> None:
+    """Shutdown the background scheduler and hand leadership over."""
+    await leader.stop()
     scheduler.shutdown()
     logger.info("Background scheduler stopped")
@@ -1,4 +1,19 @@
-from app.utils.haversine import haversine_km
+from app.utils.content_hash import content_hash
+from app.utils.haversine import haversine_km, haversine_km_np
 from app.utils.json_extract import extract_string, extract_timestamp, extract_number
+from app.utils.orbit import propagate
+from app.utils.raw_json import RawJSON, render_object
+from app.utils.single_flight import SingleFlight
 
-__all__ = ["haversine_km", "extract_string", "extract_timestamp", "extract_number"]
+__all__ = [
+    "content_hash",
+    "haversine_km",
+    "haversine_km_np",
+    "extract_string",
+    "extract_timestamp",
+    "extract_number",
+    "propagate",
+    "RawJSON",
+    "render_object",
+    "SingleFlight",
+]
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from app.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# All caches by name, for diagnostics and invalidation
+cache_registry: dict[str, "SWRCache"] = {}
+
+
+class _Entry:
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, fresh_until: float, stale_until: float) -> None:
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class SWRCache:
+    """In-process LRU cache with TTL and stale-while-revalidate.
+
+    A fresh entry is returned as is. An entry past its TTL but within
+    ``stale_ttl`` is returned immediately while a background task reloads it.
+    Anything older is a miss and is loaded inline. Concurrent loads of the
+    same key are coalesced.
+    """
+
+    def __init__(self, name: str, max_size: int, ttl: float, stale_ttl: float = 0.0) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._flight = SingleFlight()
+        self._background: set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refresh_errors = 0
+        cache_registry[name] = self
+
+    def get(
+        self,
+        key: Hashable,
+        allow_stale: bool = False,
+        accept: Callable[[Any], bool] | None = None,
+    ) -> Any | None:
+        """Get a cached value without loading.
+
+        Stale values are returned only if allowed; ``accept`` can reject a
+        cached value that does not satisfy the caller (counted as a miss).
+        """
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and (accept is None or accept(entry.value)):
+            if now < entry.fresh_until:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if allow_stale and now < entry.stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store a value; ``ttl`` overrides the cache default for this entry."""
+        now = time.monotonic()
+        fresh_until = now + (self.ttl if ttl is None else ttl)
+        self._entries[key] = _Entry(value, fresh_until, fresh_until + self.stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop one key, or everything when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Get a value, serving stale data while revalidating in the background."""
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry is not None and now < entry.fresh_until:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry.value
+
+        if entry is not None and now < entry.stale_until:
+            self.stale_hits += 1
+            self._entries.move_to_end(key)
+            task = asyncio.ensure_future(self._revalidate(key, loader))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+            return entry.value
+
+        self.misses += 1
+        return await self._flight.do(key, lambda: self._load(key, loader))
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        self.set(key, value)
+        return value
+
+    async def _revalidate(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await self._flight.do(key, lambda: self._load(key, loader))
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.warning(f"Cache {self.name}: background refresh failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "refresh_errors": self.refresh_errors,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,21 @@
+import hashlib
+import json
+from typing import Any
+
+
+def content_hash(data: Any) -> str:
+    """Calculate a stable SHA-256 hex digest of JSON-compatible data.
+
+    Keys are sorted and whitespace is stripped, so logically equal
+    payloads hash the same regardless of key order.
+
+    Args:
+        data: JSON-compatible value (dict, list, str, number, ...)
+
+    Returns:
+        64-character hex digest
+    """
+    encoded = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
@@ -0,0 +1,29 @@
+import json
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def loads(body: bytes | str) -> Any:
+    """Decode JSON with orjson, several times faster than ``json.loads``.
+
+    Falls back to the stdlib for the few inputs orjson rejects but Python
+    accepts (e.g. ``NaN``), so decoding never gets stricter.
+    """
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return json.loads(body)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, for routes returning plain dicts.
+
+    Routes with a ``response_model`` should keep FastAPI's default class:
+    they are serialized straight to bytes by Pydantic, which a custom
+    response class would turn off.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
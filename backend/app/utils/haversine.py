@@ -1,5 +1,9 @@
 import math
 
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
 
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate great-circle distance between two points using Haversine formula.
@@ -13,7 +17,7 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     Returns:
         Distance in kilometers
     """
-    r = 6371.0  # Earth radius in km
+    r = EARTH_RADIUS_KM
 
     rlat1 = math.radians(lat1)
     rlat2 = math.radians(lat2)
@@ -24,3 +28,23 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
     return r * c
+
+
+def haversine_km_np(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """Vectorized Haversine distance over arrays of points (degrees).
+
+    Arguments broadcast against each other, e.g. ``haversine_km_np(lat[:-1],
+    lon[:-1], lat[1:], lon[1:])`` gives the length of every track segment.
+
+    Returns:
+        Array of distances in kilometers
+    """
+    rlat1 = np.radians(lat1)
+    rlat2 = np.radians(lat2)
+    dlat = rlat2 - rlat1
+    dlon = np.radians(np.asarray(lon2) - np.asarray(lon1))
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(rlat1) * np.cos(rlat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
 
@@ -35,7 +35,7 @@ def extract_timestamp(data: dict[str, Any], keys: list[str]) -> datetime | None:
         keys: List of possible key names to try
 
     Returns:
-        Parsed datetime (UTC) or None
+        Parsed timezone-aware datetime (naive values are assumed UTC) or None
     """
     for key in keys:
         value = data.get(key)
@@ -45,26 +45,33 @@ def extract_timestamp(data: dict[str, Any], keys: list[str]) -> datetime | None:
         if isinstance(value, str):
             # Try ISO 8601
             try:
-                return datetime.fromisoformat(value.replace("Z", "+00:00"))
+                return _as_utc(datetime.fromisoformat(value.replace("Z", "+00:00")))
             except ValueError:
                 pass
 
             # Try YYYY-MM-DD HH:MM:SS
             try:
-                return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+                return _as_utc(datetime.strptime(value, "%Y-%m-%d %H:%M:%S"))
             except ValueError:
                 pass
 
         elif isinstance(value, int):
             # Unix timestamp
             try:
-                return datetime.utcfromtimestamp(value)
-            except (ValueError, OSError):
+                return datetime.fromtimestamp(value, tz=timezone.utc)
+            except (ValueError, OSError, OverflowError):
                 pass
 
     return None
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Attach UTC to naive datetimes so they compare with DB timestamps."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
 def extract_number(data: dict[str, Any], key: str) -> float | None:
     """Extract numeric value from dict, supporting both float and string representations.
 
@@ -0,0 +1,48 @@
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> list[int]:
+    """Downsample a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, for every bucket in between, the point
+    forming the largest triangle with the previously kept point and the
+    average of the next bucket, which preserves the visual shape of the series.
+
+    Args:
+        x: Monotonically increasing x values (e.g. epoch seconds)
+        y: Values to preserve the shape of
+        threshold: Maximum number of points to keep
+
+    Returns:
+        Sorted indices of the kept points
+    """
+    n = len(x)
+    if threshold >= n:
+        return list(range(n))
+    if threshold <= 2:
+        return [0, n - 1][:threshold]
+
+    kept = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average point of the next bucket
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        count = next_end - next_start
+        avg_x = x[next_start:next_end].sum() / count
+        avg_y = y[next_start:next_end].sum() / count
+
+        # Point of the current bucket with the largest triangle area
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = x[a], y[a]
+        areas = np.abs((ax - avg_x) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y - ay))
+        best = start + int(areas.argmax())
+
+        kept.append(best)
+        a = best
+
+    kept.append(n - 1)
+    return kept
@@ -0,0 +1,88 @@
+import math
+
+from app.utils.haversine import EARTH_RADIUS_KM
+
+# Sidereal rotation rate of the Earth
+EARTH_ROTATION_DEG_PER_SEC = 360.0 / 86164.0905
+
+Vector = tuple[float, float, float]
+
+
+def _to_vector(lat: float, lon: float) -> Vector:
+    rlat, rlon = math.radians(lat), math.radians(lon)
+    return (math.cos(rlat) * math.cos(rlon), math.cos(rlat) * math.sin(rlon), math.sin(rlat))
+
+
+def _from_vector(v: Vector) -> tuple[float, float]:
+    x, y, z = v
+    lat = math.degrees(math.asin(max(-1.0, min(1.0, z))))
+    lon = math.degrees(math.atan2(y, x))
+    return lat, lon
+
+
+def _cross(a: Vector, b: Vector) -> Vector:
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def _rotate(v: Vector, axis: Vector, angle: float) -> Vector:
+    """Rotate ``v`` (perpendicular to unit ``axis``) by ``angle`` radians."""
+    c, s = math.cos(angle), math.sin(angle)
+    k = _cross(axis, v)
+    return (v[0] * c + k[0] * s, v[1] * c + k[1] * s, v[2] * c + k[2] * s)
+
+
+def _wrap_lon(lon: float) -> float:
+    return (lon + 180.0) % 360.0 - 180.0
+
+
+def propagate(
+    t0: float,
+    lat0: float,
+    lon0: float,
+    t1: float,
+    lat1: float,
+    lon1: float,
+    t: float,
+    velocity_kmh: float | None = None,
+    altitude_km: float | None = None,
+) -> tuple[float, float] | None:
+    """Estimate the sub-satellite point at time ``t`` from two samples.
+
+    Both samples are moved into an Earth-fixed-at-``t0`` frame (undoing Earth
+    rotation), where the orbit is a great circle. Between the samples the
+    point is interpolated along that circle (slerp). Beyond ``t1`` it is
+    extrapolated at the angular rate implied by ``velocity_kmh`` and
+    ``altitude_km`` when known, otherwise at the observed rate. The result
+    is moved back to the rotating Earth.
+
+    Args:
+        t0, lat0, lon0: Older sample (epoch seconds, degrees)
+        t1, lat1, lon1: Newer sample, ``t1 > t0``
+        t: Target time in epoch seconds, ``t >= t0``
+        velocity_kmh: Orbital velocity at the newer sample
+        altitude_km: Altitude at the newer sample
+
+    Returns:
+        (latitude, longitude) in degrees, or None if the samples are degenerate
+    """
+    a = _to_vector(lat0, lon0)
+    b = _to_vector(lat1, lon1 + EARTH_ROTATION_DEG_PER_SEC * (t1 - t0))
+
+    normal = _cross(a, b)
+    norm = math.sqrt(sum(c * c for c in normal))
+    if norm < 1e-12 or t1 <= t0:
+        return None
+    normal = (normal[0] / norm, normal[1] / norm, normal[2] / norm)
+    arc = math.atan2(norm, sum(x * y for x, y in zip(a, b)))
+
+    if t <= t1:
+        point = _rotate(a, normal, arc * (t - t0) / (t1 - t0))
+    else:
+        if velocity_kmh and altitude_km is not None:
+            rate = velocity_kmh / 3600.0 / (EARTH_RADIUS_KM + altitude_km)
+        else:
+            rate = arc / (t1 - t0)
+        point = _rotate(b, normal, rate * (t - t1))
+
+    lat, lon = _from_vector(point)
+    return lat, _wrap_lon(lon - EARTH_ROTATION_DEG_PER_SEC * (t - t0))
@@ -0,0 +1,40 @@
+from typing import Any
+
+import pydantic_core
+
+
+class RawJSON:
+    """JSON text that is spliced into a rendered document verbatim.
+
+    Used for JSONB columns selected as ``::text``, so large payloads are never
+    decoded into Python objects just to be serialized again.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str | bytes | None) -> None:
+        if text is None:
+            self.text = b"null"
+        else:
+            self.text = text.encode("utf-8") if isinstance(text, str) else text
+
+
+def _encode(value: Any) -> bytes:
+    if isinstance(value, RawJSON):
+        return value.text
+    if isinstance(value, dict):
+        return render_object(value)
+    return pydantic_core.to_json(value)
+
+
+def render_object(fields: dict[str, Any]) -> bytes:
+    """Render a JSON object, keeping field order.
+
+    ``RawJSON`` values are inserted as is, nested dicts may contain them too.
+    Everything else is serialized the way Pydantic serializes response models
+    (e.g. datetimes as ISO 8601 with ``Z``), so the output matches what the
+    equivalent ``response_model`` would produce.
+    """
+    return b"{" + b",".join(
+        pydantic_core.to_json(key) + b":" + _encode(value) for key, value in fields.items()
+    ) + b"}"
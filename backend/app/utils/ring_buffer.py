@@ -0,0 +1,48 @@
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class RingBuffer(Generic[T]):
+    """Fixed-size FIFO over a preallocated list with O(1) append and lookup.
+
+    Once full, every append overwrites the oldest item.
+    """
+
+    __slots__ = ("_items", "_capacity", "_next", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._items: list[T | None] = [None] * capacity
+        self._capacity = capacity
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, item: T) -> None:
+        self._items[self._next] = item
+        self._next = (self._next + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+
+    def latest(self, offset: int = 0) -> T | None:
+        """Get the newest item (offset 0), the one before it (offset 1), ..."""
+        if offset >= self._size:
+            return None
+        return self._items[(self._next - 1 - offset) % self._capacity]
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate oldest to newest."""
+        for offset in range(self._size - 1, -1, -1):
+            yield self._items[(self._next - 1 - offset) % self._capacity]
+
+    def clear(self) -> None:
+        self._items = [None] * self._capacity
+        self._next = 0
+        self._size = 0
@@ -0,0 +1,50 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first caller starts the work as a task; everyone arriving while it is
+    in flight awaits the same task and gets the same result (or exception).
+    Callers that go away do not cancel the shared work. With ``min_interval``
+    set, a result younger than that many seconds is returned without running
+    the work again; otherwise nothing is retained once the work finishes.
+    """
+
+    def __init__(self, min_interval: float = 0.0) -> None:
+        self.min_interval = min_interval
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._recent: dict[Hashable, tuple[float, Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` for ``key`` unless a call is in flight or fresh enough."""
+        if self._recent:
+            self._prune(time.monotonic())
+            if key in self._recent:
+                return self._recent[key][1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _prune(self, now: float) -> None:
+        """Drop results older than ``min_interval``, oldest first."""
+        while self._recent:
+            key = next(iter(self._recent))
+            if now - self._recent[key][0] < self.min_interval:
+                break
+            del self._recent[key]
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if self.min_interval > 0 and not task.cancelled() and task.exception() is None:
+            # Re-insert so the dict stays ordered by finish time for _prune
+            self._recent.pop(key, None)
+            self._recent[key] = (time.monotonic(), task.result())
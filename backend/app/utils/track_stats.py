@@ -0,0 +1,79 @@
+from typing import Any
+
+import numpy as np
+
+from app.utils.haversine import haversine_km_np
+
+
+def track_stats(
+    epochs: np.ndarray,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    velocities: np.ndarray,
+    gap_seconds: float,
+    max_speed_kmh: float,
+    max_gaps: int = 100,
+) -> dict[str, Any]:
+    """Compute ground-track statistics over time-ordered samples.
+
+    Segments longer than ``gap_seconds`` are reported as gaps, and segments
+    implying a ground speed above ``max_speed_kmh`` as outliers. Neither counts
+    towards distance or segment speed.
+
+    Args:
+        epochs: Sample times in epoch seconds, ascending
+        lats: Latitudes in degrees
+        lons: Longitudes in degrees
+        velocities: Reported velocities in km/h (NaN where missing)
+        gap_seconds: Minimum interval treated as a data gap
+        max_speed_kmh: Ground speed above which a segment is an outlier
+        max_gaps: Maximum number of gaps listed individually
+
+    Returns:
+        Dict of aggregate statistics
+    """
+    n = len(epochs)
+    stats: dict[str, Any] = {
+        "samples": n,
+        "segments": max(n - 1, 0),
+        "duration_sec": float(epochs[-1] - epochs[0]) if n else 0.0,
+        "covered_sec": 0.0,
+        "total_distance_km": 0.0,
+        "mean_segment_speed_kmh": None,
+        "max_segment_speed_kmh": None,
+        "mean_velocity_kmh": None,
+        "max_velocity_kmh": None,
+        "outlier_count": 0,
+        "gap_count": 0,
+        "gaps": [],
+    }
+
+    if n and not np.all(np.isnan(velocities)):
+        stats["mean_velocity_kmh"] = float(np.nanmean(velocities))
+        stats["max_velocity_kmh"] = float(np.nanmax(velocities))
+
+    if n < 2:
+        return stats
+
+    distances = haversine_km_np(lats[:-1], lons[:-1], lats[1:], lons[1:])
+    dt = np.diff(epochs)
+
+    gap = dt > gap_seconds
+    speeds = np.divide(distances * 3600.0, dt, out=np.full_like(distances, np.nan), where=dt > 0)
+    outlier = ~gap & (np.isnan(speeds) | (speeds > max_speed_kmh))
+    valid = ~gap & ~outlier
+
+    stats["covered_sec"] = float(dt[valid].sum())
+    stats["total_distance_km"] = float(distances[valid].sum())
+    if valid.any():
+        stats["mean_segment_speed_kmh"] = float(speeds[valid].mean())
+        stats["max_segment_speed_kmh"] = float(speeds[valid].max())
+    stats["outlier_count"] = int(outlier.sum())
+    stats["gap_count"] = int(gap.sum())
+
+    gap_index = np.flatnonzero(gap)[:max_gaps]
+    stats["gaps"] = [
+        {"start": float(epochs[i]), "end": float(epochs[i + 1]), "seconds": float(dt[i])}
+        for i in gap_index
+    ]
+    return stats
@@ -0,0 +1,48 @@
+"""Microbenchmark: scalar haversine loop vs. vectorized NumPy version.
+
+Usage (from backend/):
+    python -m benchmarks.bench_haversine --samples 300000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.utils.haversine import haversine_km, haversine_km_np
+
+
+def main(samples: int, repeat: int) -> None:
+    rng = np.random.default_rng(42)
+    lats = rng.uniform(-51.6, 51.6, samples)
+    lons = rng.uniform(-180.0, 180.0, samples)
+    lat_list, lon_list = lats.tolist(), lons.tolist()
+
+    def scalar() -> float:
+        return sum(
+            haversine_km(lat_list[i], lon_list[i], lat_list[i + 1], lon_list[i + 1])
+            for i in range(samples - 1)
+        )
+
+    def vectorized() -> float:
+        return float(haversine_km_np(lats[:-1], lons[:-1], lats[1:], lons[1:]).sum())
+
+    results = {}
+    for name, fn in (("scalar", scalar), ("numpy", vectorized)):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            total = fn()
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+        print(f"{name:<8} {best * 1000:9.2f}ms  total={total:,.1f}km")
+
+    print(f"speedup: {results['scalar'] / results['numpy']:.1f}x over {samples - 1:,} segments")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=300_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.samples, args.repeat)
@@ -0,0 +1,116 @@
+"""Benchmark event loop lag while an OSDR-sized catalog is decoded and diffed.
+
+A probe task sleeps 1 ms in a loop and records how late it wakes up, while
+the sync work for a synthetic catalog runs on the same loop:
+
+    stdlib inline     json.loads + change detection on the loop (previous)
+    orjson inline     orjson decode + change detection on the loop
+    orjson + thread   orjson decode, change detection in a worker thread (current)
+    parse in thread   orjson decode in a worker thread, for comparison
+
+Decoders hold the GIL for the whole parse, so moving the parse to a thread
+does not shorten the stall; the per-item Python work does yield the loop.
+
+Usage (from backend/):
+    python -m benchmarks.bench_loop_lag --items 20000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+
+from app.services.osdr_service import OSDRService
+from app.utils.fast_json import loads
+
+
+def synthetic_catalog(items: int) -> bytes:
+    """Generate an OSDR-like dataset catalog with ``items`` entries."""
+    return json.dumps(
+        {
+            "results": [
+                {
+                    "dataset_id": f"OSD-{i}",
+                    "title": f"Spaceflight study {i} " + "x" * 80,
+                    "status": "public",
+                    "updated": "2024-05-01T12:30:00Z",
+                    "factors": [{"name": "Spaceflight", "values": ["Ground", "Flight"]}] * 3,
+                    "organisms": ["Mus musculus"],
+                    "files": [{"name": f"file_{j}.csv", "size": j * 1024} for j in range(5)],
+                }
+                for i in range(items)
+            ]
+        }
+    ).encode()
+
+
+def diff(data: Any) -> int:
+    rows, _ = OSDRService._changed_rows(data["results"], {}, set())
+    return len(rows)
+
+
+async def stdlib_inline(body: bytes) -> int:
+    return diff(json.loads(body))
+
+
+async def orjson_inline(body: bytes) -> int:
+    return diff(loads(body))
+
+
+async def orjson_thread(body: bytes) -> int:
+    data = loads(body)
+    return await asyncio.to_thread(diff, data)
+
+
+async def parse_in_thread(body: bytes) -> int:
+    data = await asyncio.to_thread(loads, body)
+    return diff(data)
+
+
+async def probe(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(max((time.perf_counter() - start - 0.001) * 1000, 0.0))
+
+
+async def measure(
+    name: str, fn: Callable[[bytes], Awaitable[int]], body: bytes, rounds: int
+) -> None:
+    durations, worst, p99s = [], [], []
+    for _ in range(rounds):
+        stop = asyncio.Event()
+        lags: list[float] = []
+        task = asyncio.create_task(probe(stop, lags))
+        await asyncio.sleep(0.01)
+        start = time.perf_counter()
+        await fn(body)
+        durations.append((time.perf_counter() - start) * 1000)
+        stop.set()
+        await task
+        lags.sort()
+        worst.append(lags[-1])
+        p99s.append(lags[int(len(lags) * 0.99) - 1] if len(lags) > 1 else lags[-1])
+    print(
+        f"{name:<16} duration={statistics.median(durations):8.1f}ms "
+        f"max lag={statistics.median(worst):8.1f}ms p99 lag={statistics.median(p99s):8.1f}ms"
+    )
+
+
+async def main(items: int, rounds: int) -> None:
+    body = synthetic_catalog(items)
+    print(f"catalog: {items} items, {len(body) / 1024 / 1024:.1f} MB")
+    await measure("stdlib inline", stdlib_inline, body, rounds)
+    await measure("orjson inline", orjson_inline, body, rounds)
+    await measure("orjson + thread", orjson_thread, body, rounds)
+    await measure("parse in thread", parse_in_thread, body, rounds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.rounds))
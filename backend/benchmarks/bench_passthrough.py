@@ -0,0 +1,205 @@
+"""Benchmark raw-JSONB passthrough against decode + Pydantic re-serialization.
+
+Against the configured database, compares building the /space/{src}/latest
+and /space/summary bodies the previous way (payload decoded by asyncpg,
+wrapped in the response model, serialized again) with the passthrough path
+(payload selected as ``::text`` and spliced into the body).
+
+With ``--synthetic`` no database is needed: a generated NEO-like payload of
+roughly ``--payload-kb`` is used to isolate the Python-side CPU cost.
+
+Usage (from backend/):
+    python -m benchmarks.bench_passthrough --source neo --iterations 200
+    python -m benchmarks.bench_passthrough --synthetic --payload-kb 500
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import select
+
+from app.database import async_session, engine
+from app.models.space_cache import SpaceCache
+from app.repositories.space_cache_repo import SpaceCacheRepository
+from app.schemas.space import SpaceLatestResponse, SpaceSummaryResponse
+from app.services.space_service import SUMMARY_SOURCES, SpaceService
+from app.utils.raw_json import RawJSON, render_object
+
+
+async def decoded_latest(source: str) -> bytes:
+    """Previous path: ORM row with decoded payload, response model, re-serialized."""
+    async with async_session() as session:
+        cache = await SpaceCacheRepository(session).get_latest(source)
+    if cache is None:
+        response = SpaceLatestResponse(source=source, message="no data")
+    else:
+        response = SpaceLatestResponse(
+            source=source,
+            fetched_at=cache.last_checked_at,
+            changed_at=cache.fetched_at,
+            payload=cache.payload,
+        )
+    return response.model_dump_json().encode()
+
+
+async def passthrough_latest(source: str) -> bytes:
+    async with async_session() as session:
+        return await SpaceService(session).render_latest(source)
+
+
+async def decoded_summary() -> bytes:
+    """Previous path: ORM rows via DISTINCT ON, payloads decoded by asyncpg."""
+    stmt = (
+        select(SpaceCache)
+        .where(SpaceCache.source.in_(SUMMARY_SOURCES))
+        .distinct(SpaceCache.source)
+        .order_by(SpaceCache.source, SpaceCache.fetched_at.desc())
+    )
+    async with async_session() as session:
+        rows = {cache.source: cache for cache in (await session.execute(stmt)).scalars()}
+        latest = {
+            source: (
+                {"at": rows[source].last_checked_at, "payload": rows[source].payload}
+                if source in rows
+                else {}
+            )
+            for source in SUMMARY_SOURCES
+        }
+    return SpaceSummaryResponse(**latest, iss={}, osdr_count=0).model_dump_json().encode()
+
+
+async def passthrough_summary() -> bytes:
+    async with async_session() as session:
+        latest = await SpaceCacheRepository(session).get_latest_many_raw(SUMMARY_SOURCES)
+    return render_object({**latest, "iss": {}, "osdr_count": 0})
+
+
+def synthetic_payload(size_kb: int) -> str:
+    """Generate a NeoWs-shaped feed of about ``size_kb`` kilobytes as JSONB-style text."""
+    neo = {
+        "id": "3542519",
+        "name": "(2010 PK9)",
+        "absolute_magnitude_h": 21.88,
+        "estimated_diameter": {
+            "kilometers": {"estimated_diameter_min": 0.1, "estimated_diameter_max": 0.23}
+        },
+        "is_potentially_hazardous_asteroid": False,
+        "close_approach_data": [
+            {
+                "close_approach_date_full": "2024-May-01 12:30",
+                "relative_velocity": {
+                    "kilometers_per_second": "16.1",
+                    "kilometers_per_hour": "58054.7",
+                },
+                "miss_distance": {"astronomical": "0.2", "kilometers": "29901234.5"},
+                "orbiting_body": "Earth",
+            }
+        ],
+    }
+    one = len(json.dumps(neo, separators=(", ", ": ")))
+    count = max(size_kb * 1024 // one, 1)
+    payload = {"element_count": count, "near_earth_objects": {"2024-05-01": [neo] * count}}
+    # Postgres renders jsonb::text with ", " and ": " separators
+    return json.dumps(payload, separators=(", ", ": "))
+
+
+def measure(name: str, fn: Callable[[], Any], iterations: int) -> tuple[float, float]:
+    fn()
+    wall, cpu = [], []
+    for _ in range(iterations):
+        w0, c0 = time.perf_counter(), time.process_time()
+        fn()
+        wall.append((time.perf_counter() - w0) * 1000)
+        cpu.append((time.process_time() - c0) * 1000)
+    return report(name, wall, cpu)
+
+
+async def measure_async(
+    name: str, fn: Callable[[], Awaitable[Any]], iterations: int
+) -> tuple[float, float]:
+    await fn()  # warm up pool and statement cache
+    wall, cpu = [], []
+    for _ in range(iterations):
+        w0, c0 = time.perf_counter(), time.process_time()
+        await fn()
+        wall.append((time.perf_counter() - w0) * 1000)
+        cpu.append((time.process_time() - c0) * 1000)
+    return report(name, wall, cpu)
+
+
+def report(name: str, wall: list[float], cpu: list[float]) -> tuple[float, float]:
+    wall.sort()
+    p95 = wall[int(len(wall) * 0.95) - 1]
+    print(
+        f"{name:<22} p50={statistics.median(wall):8.3f}ms p95={p95:8.3f}ms "
+        f"cpu={statistics.mean(cpu):8.3f}ms"
+    )
+    return statistics.median(wall), statistics.mean(cpu)
+
+
+def compare(old: tuple[float, float], new: tuple[float, float]) -> None:
+    cpu = old[1] / max(new[1], 1e-6)
+    print(f"  latency speedup (p50): {old[0] / new[0]:.2f}x, cpu: {cpu:.2f}x")
+
+
+def run_synthetic(size_kb: int, iterations: int) -> None:
+    text = synthetic_payload(size_kb)
+    now = datetime.now(timezone.utc)
+    print(f"payload: {len(text) / 1024:.0f} KB")
+
+    def decoded() -> bytes:
+        # asyncpg decodes JSONB with json.loads, then the model walks the dict
+        payload = json.loads(text)
+        response = SpaceLatestResponse(
+            source="neo", fetched_at=now, changed_at=now, payload=payload
+        )
+        return response.model_dump_json().encode()
+
+    def passthrough() -> bytes:
+        return render_object(
+            {
+                "source": "neo",
+                "fetched_at": now,
+                "changed_at": now,
+                "payload": RawJSON(text),
+                "message": None,
+            }
+        )
+
+    assert json.loads(decoded()) == json.loads(passthrough())
+    compare(
+        measure("decoded", decoded, iterations),
+        measure("passthrough", passthrough, iterations),
+    )
+
+
+async def run_database(source: str, iterations: int) -> None:
+    print(f"/space/{source}/latest")
+    compare(
+        await measure_async("  decoded", lambda: decoded_latest(source), iterations),
+        await measure_async("  passthrough", lambda: passthrough_latest(source), iterations),
+    )
+    print("/space/summary (cache rows only)")
+    compare(
+        await measure_async("  decoded", decoded_summary, iterations),
+        await measure_async("  passthrough", passthrough_summary, iterations),
+    )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--source", default="neo")
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--payload-kb", type=int, default=300)
+    args = parser.parse_args()
+    if args.synthetic:
+        run_synthetic(args.payload_kb, args.iterations)
+    else:
+        asyncio.run(run_database(args.source, args.iterations))
@@ -0,0 +1,73 @@
+"""Benchmark /space/summary read paths against the configured database.
+
+Compares the previous path (seven sequential queries on one session) with
+the current one (one DISTINCT ON query plus concurrent ISS/OSDR reads).
+
+Usage (from backend/):
+    python -m benchmarks.bench_space_summary --iterations 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+
+from app.api.space import space_summary
+from app.database import async_session, engine
+from app.repositories.iss_repo import ISSRepository
+from app.repositories.osdr_repo import OSDRRepository
+from app.repositories.space_cache_repo import SpaceCacheRepository
+from app.schemas.space import SpaceSummaryResponse
+from app.services.space_service import SUMMARY_SOURCES
+
+
+async def sequential_summary() -> SpaceSummaryResponse:
+    """Previous implementation: one await after another on a single session."""
+    async with async_session() as session:
+        iss_log = await ISSRepository(session).get_latest()
+        iss_data: dict[str, Any] = {}
+        if iss_log:
+            iss_data = {"at": iss_log.fetched_at, "payload": iss_log.payload}
+        osdr_count = await OSDRRepository(session).count()
+        repo = SpaceCacheRepository(session)
+        latest: dict[str, dict[str, Any]] = {}
+        for source in SUMMARY_SOURCES:
+            cache = await repo.get_latest(source)
+            latest[source] = (
+                {"at": cache.last_checked_at, "payload": cache.payload} if cache else {}
+            )
+        return SpaceSummaryResponse(**latest, iss=iss_data, osdr_count=osdr_count)
+
+
+async def measure(
+    name: str, fn: Callable[[], Awaitable[Any]], iterations: int
+) -> list[float]:
+    await fn()  # warm up pool and statement cache
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"{name:<12} mean={statistics.mean(timings):7.2f}ms "
+        f"p50={statistics.median(timings):7.2f}ms p95={p95:7.2f}ms"
+    )
+    return timings
+
+
+async def main(iterations: int) -> None:
+    old = await measure("sequential", sequential_summary, iterations)
+    new = await measure("concurrent", space_summary, iterations)
+    print(f"speedup (p50): {statistics.median(old) / statistics.median(new):.2f}x")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
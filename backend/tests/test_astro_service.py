@@ -0,0 +1,25 @@
+import asyncio
+
+from app.config import settings
+from app.services import astro_service
+from app.services.astro_service import AstroService
+
+
+def test_fetches_do_not_retain_payloads(monkeypatch):
+    monkeypatch.setattr(settings, "astro_app_id", "id")
+    monkeypatch.setattr(settings, "astro_app_secret", "secret")
+
+    async def fetch(self, latitude, longitude, now, days):
+        return {"data": {"rows": [], "latitude": latitude}}
+
+    monkeypatch.setattr(AstroService, "_fetch", fetch)
+
+    async def main() -> None:
+        service = AstroService()
+        for i in range(50):
+            await service.get_events(latitude=i, longitude=i, days=3)
+
+    asyncio.run(main())
+    assert astro_service._fetch_flight._recent == {}
+    assert astro_service._fetch_flight._inflight == {}
+    assert len(astro_service.events_cache._entries) <= settings.astro_cache_max_size
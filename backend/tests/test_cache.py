@@ -0,0 +1,76 @@
+import asyncio
+
+from app.utils.cache import SWRCache
+
+
+def test_memory_bounded_by_max_size():
+    async def main() -> SWRCache:
+        cache = SWRCache("test_bounded", max_size=2, ttl=60)
+        for key in range(100):
+            await cache.get_or_load(key, lambda key=key: asyncio.sleep(0, result=[key] * 100))
+        return cache
+
+    cache = asyncio.run(main())
+    assert len(cache._entries) == 2
+    assert cache.evictions == 98
+    assert cache._flight._recent == {}
+    assert cache._flight._inflight == {}
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = SWRCache("test_lru", max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_stale_entry_served_while_revalidating():
+    async def main() -> tuple[list, SWRCache]:
+        cache = SWRCache("test_swr", max_size=10, ttl=0.05, stale_ttl=60)
+        loads = []
+
+        async def load() -> int:
+            loads.append(1)
+            return len(loads)
+
+        first = await cache.get_or_load("k", load)
+        await asyncio.sleep(0.06)
+        stale = await cache.get_or_load("k", load)
+        await asyncio.sleep(0.01)  # let the background refresh finish
+        fresh = await cache.get_or_load("k", load)
+        return [first, stale, fresh], cache
+
+    values, cache = asyncio.run(main())
+    assert values == [1, 1, 2]
+    assert cache.stale_hits == 1
+    assert cache.hits == 1
+
+
+def test_get_allow_stale():
+    cache = SWRCache("test_allow_stale", max_size=10, ttl=-1, stale_ttl=60)
+    cache.set("k", "v")
+    assert cache.get("k") is None
+    assert cache.get("k", allow_stale=True) == "v"
+
+
+def test_failed_background_refresh_keeps_stale_value():
+    async def main() -> tuple[int, SWRCache]:
+        cache = SWRCache("test_refresh_error", max_size=10, ttl=0.01, stale_ttl=60)
+        await cache.get_or_load("k", lambda: asyncio.sleep(0, result=1))
+        await asyncio.sleep(0.02)
+
+        async def fail() -> int:
+            raise RuntimeError("down")
+
+        value = await cache.get_or_load("k", fail)
+        await asyncio.sleep(0.01)
+        return value, cache
+
+    value, cache = asyncio.run(main())
+    assert value == 1
+    assert cache.refresh_errors == 1
+    assert cache.get("k", allow_stale=True) == 1
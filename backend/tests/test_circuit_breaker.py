@@ -0,0 +1,88 @@
+import pytest
+
+from app.config import settings
+from app.services.http_client import CircuitBreaker, CircuitOpenError
+
+
+@pytest.fixture(autouse=True)
+def breaker_settings(monkeypatch):
+    monkeypatch.setattr(settings, "http_breaker_threshold", 3)
+    monkeypatch.setattr(settings, "http_breaker_reset_timeout", 30.0)
+
+
+def open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker("api.example.com")
+    for _ in range(settings.http_breaker_threshold):
+        breaker.allow()
+        breaker.record(False)
+    return breaker
+
+
+def expire(breaker: CircuitBreaker) -> None:
+    breaker.opened_at -= settings.http_breaker_reset_timeout
+
+
+def test_opens_after_threshold_consecutive_failures():
+    breaker = CircuitBreaker("api.example.com")
+    breaker.record(False)
+    breaker.record(False)
+    breaker.record(True)  # a success resets the count
+    breaker.record(False)
+    breaker.record(False)
+    assert breaker.state == "closed"
+
+    breaker.record(False)
+    assert breaker.state == "open"
+    assert breaker.is_open
+    assert breaker.times_opened == 1
+
+
+def test_open_breaker_rejects_until_reset_timeout():
+    breaker = open_breaker()
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.allow()
+    assert exc_info.value.retry_after > 0
+    assert breaker.rejected == 1
+
+
+def test_half_open_admits_a_single_probe():
+    breaker = open_breaker()
+    expire(breaker)
+    assert not breaker.is_open
+    assert breaker.stats()["state"] == "half_open"
+
+    breaker.allow()
+    assert breaker.state == "half_open"
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_successful_probe_closes():
+    breaker = open_breaker()
+    expire(breaker)
+    breaker.allow()
+    breaker.record(True)
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+    assert breaker.stats()["retry_in_sec"] is None
+    breaker.allow()
+
+
+def test_failed_probe_reopens_for_a_full_timeout():
+    breaker = open_breaker()
+    expire(breaker)
+    breaker.allow()
+    breaker.record(False)
+    assert breaker.state == "open"
+    assert breaker.retry_in() > settings.http_breaker_reset_timeout - 1
+    assert breaker.times_opened == 1
+
+
+def test_released_probe_lets_the_next_request_probe():
+    breaker = open_breaker()
+    expire(breaker)
+    breaker.allow()
+    breaker.release()
+    breaker.allow()
+    assert breaker.state == "half_open"
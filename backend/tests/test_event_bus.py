@@ -0,0 +1,49 @@
+import asyncio
+
+from app.services.event_bus import EventBus
+
+
+async def first_messages(bus: EventBus, last_event_id: str | None, count: int) -> list[str]:
+    stream = bus.stream({"iss", "space"}, last_event_id)
+    messages = [await stream.__anext__() for _ in range(count)]
+    await stream.aclose()
+    return messages
+
+
+def test_replays_events_after_own_id():
+    bus = EventBus(replay_size=10, max_queue=10)
+    first = bus.publish("iss", {"n": 1})
+    bus.publish("space", {"n": 2})
+    bus.publish("osdr", {"n": 3})
+
+    messages = asyncio.run(first_messages(bus, first.id, 2))
+    assert messages[1].startswith(f"id: {bus.epoch}-2\nevent: space\n")
+
+
+def test_id_from_another_worker_triggers_resync():
+    bus = EventBus(replay_size=10, max_queue=10)
+    for n in range(5):
+        bus.publish("iss", {"n": n})
+    other = EventBus(replay_size=10, max_queue=10)
+
+    # Lower sequence than the local counter, but issued by another process
+    messages = asyncio.run(first_messages(bus, f"{other.epoch}-2", 2))
+    assert "event: resync" in messages[1]
+
+
+def test_malformed_or_legacy_id_triggers_resync():
+    bus = EventBus(replay_size=10, max_queue=10)
+    bus.publish("iss", {"n": 1})
+    for last_event_id in ("1", "garbage", f"{bus.epoch}-x"):
+        messages = asyncio.run(first_messages(bus, last_event_id, 2))
+        assert "event: resync" in messages[1]
+
+
+def test_too_old_id_triggers_resync():
+    bus = EventBus(replay_size=2, max_queue=10)
+    first = bus.publish("iss", {"n": 0})
+    for n in range(1, 5):
+        bus.publish("iss", {"n": n})
+
+    messages = asyncio.run(first_messages(bus, first.id, 2))
+    assert "event: resync" in messages[1]
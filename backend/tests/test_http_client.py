@@ -0,0 +1,35 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import http_client
+from app.services.http_client import NOT_MODIFIED, HttpClient, ValidatorCache
+
+
+@pytest.fixture
+def validator_cache(monkeypatch):
+    cache = ValidatorCache()
+    monkeypatch.setattr(http_client, "validator_cache", cache)
+    return cache
+
+
+def get(monkeypatch, status_code: int, **kwargs):
+    async def send(self, method, url, rate_key=None, **_):
+        return httpx.Response(status_code, request=httpx.Request(method, url), **kwargs)
+
+    monkeypatch.setattr(HttpClient, "_send", send)
+    return asyncio.run(HttpClient().get("https://api.example.com/feed", conditional=True))
+
+
+def test_counts_304_as_hit_and_200_as_miss(monkeypatch, validator_cache):
+    assert get(monkeypatch, 200, json={"ok": True}, headers={"ETag": '"v1"'}) == {"ok": True}
+    assert get(monkeypatch, 304) is NOT_MODIFIED
+    assert (validator_cache.hits, validator_cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("status_code", [404, 429, 500])
+def test_error_responses_are_not_counted(monkeypatch, validator_cache, status_code):
+    with pytest.raises(httpx.HTTPStatusError):
+        get(monkeypatch, status_code)
+    assert (validator_cache.hits, validator_cache.misses) == (0, 0)
@@ -0,0 +1,27 @@
+import asyncio
+from datetime import datetime, timezone
+
+from app.services import iss_service
+from app.services.iss_service import ISSSample, ISSService, iss_buffer
+
+
+def sample(id: int, latitude: float | None) -> ISSSample:
+    return ISSSample.from_dict(
+        {"id": id, "fetched_at": datetime.now(timezone.utc), "payload": {}, "latitude": latitude}
+    )
+
+
+def test_reload_notification_replaces_buffered_rows(monkeypatch):
+    iss_buffer.clear()
+    iss_service.remember_sample(sample(1, None))
+
+    async def warm_buffer(cls) -> int:
+        iss_service.remember_sample(sample(1, 51.5))
+        return 1
+
+    monkeypatch.setattr(ISSService, "warm_buffer", classmethod(warm_buffer))
+
+    assert asyncio.run(ISSService.apply_change({"reload": True})) is None
+    assert len(iss_buffer) == 1
+    assert iss_buffer.latest().latitude == 51.5
+    iss_buffer.clear()
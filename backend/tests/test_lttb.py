@@ -0,0 +1,43 @@
+import numpy as np
+
+from app.utils.lttb import lttb
+
+
+def test_keeps_everything_below_threshold():
+    x = np.arange(5, dtype=float)
+    assert lttb(x, x, 10) == [0, 1, 2, 3, 4]
+
+
+def test_keeps_endpoints_and_threshold_points():
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50)
+    indices = lttb(x, y, 100)
+    assert len(indices) == 100
+    assert indices[0] == 0
+    assert indices[-1] == 999
+    assert indices == sorted(set(indices))
+
+
+def test_preserves_extrema():
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[337] = 80.0
+    y[712] = -80.0
+    indices = lttb(x, y, 20)
+    assert 337 in indices
+    assert 712 in indices
+
+
+def test_keeps_orbit_turning_points():
+    # Latitude of a ground track oscillates between +-51.6 degrees
+    x = np.arange(2000, dtype=float) * 10
+    y = 51.6 * np.sin(x / 925)
+    indices = lttb(x, y, 200)
+    assert y[indices].max() > 51.5
+    assert y[indices].min() < -51.5
+
+
+def test_tiny_thresholds():
+    x = np.arange(10, dtype=float)
+    assert lttb(x, x, 2) == [0, 9]
+    assert lttb(x, x, 1) == [0]
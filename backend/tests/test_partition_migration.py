@@ -0,0 +1,55 @@
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app import database
+from app.services import partition_service
+
+LEGACY_SPACE_CACHE = """
+    CREATE TABLE space_cache (
+        id BIGSERIAL PRIMARY KEY,
+        source TEXT NOT NULL,
+        fetched_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+        payload JSONB NOT NULL
+    )
+"""
+
+
+def test_upgraded_legacy_space_cache_accepts_deduplicated_rows(database_url, monkeypatch):
+    async def main() -> tuple[int, bool]:
+        engine = create_async_engine(database_url, poolclass=NullPool)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        monkeypatch.setattr(database, "engine", engine)
+        monkeypatch.setattr(partition_service, "async_session", session_factory)
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text("DROP SCHEMA public CASCADE"))
+                await conn.execute(text("CREATE SCHEMA public"))
+                await conn.execute(text(LEGACY_SPACE_CACHE))
+                await conn.execute(
+                    text("INSERT INTO space_cache (source, payload) VALUES ('apod', '{}')")
+                )
+
+            await database.init_db()
+
+            async with engine.begin() as conn:
+                # Lands in the attached legacy partition, which covers today
+                await conn.execute(
+                    text("INSERT INTO space_cache (source, payload_hash) VALUES ('apod', 'h')")
+                )
+                count = (await conn.execute(text("SELECT count(*) FROM space_cache"))).scalar()
+                attached = (
+                    await conn.execute(
+                        text(
+                            "SELECT relispartition FROM pg_class"
+                            " WHERE oid = to_regclass('space_cache_legacy')"
+                        )
+                    )
+                ).scalar()
+            return count, attached
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(main()) == (2, True)
@@ -0,0 +1,94 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.services.rate_budget import (
+    PRIORITY_SCHEDULED,
+    RateBudget,
+    RateBudgetExceeded,
+    request_priority,
+)
+
+KEY = "test-key-123456"
+
+
+@pytest.fixture(autouse=True)
+def budget_settings(monkeypatch):
+    monkeypatch.setattr(settings, "nasa_rate_limit_per_hour", 3600)
+    monkeypatch.setattr(settings, "nasa_rate_reserve_ratio", 0.25)
+    monkeypatch.setattr(settings, "nasa_rate_max_wait", 0.5)
+
+
+def acquire(budget: RateBudget, priority: str | None = None) -> None:
+    async def main() -> None:
+        if priority is not None:
+            request_priority.set(priority)
+        await budget.acquire(KEY)
+
+    asyncio.run(main())
+
+
+def test_refill_is_continuous_and_capped():
+    budget = RateBudget()
+    bucket = budget._bucket(KEY)
+    bucket.tokens = 100.0
+    bucket.updated -= 60  # 3600/hour refills one token per second
+    bucket.refill()
+    assert bucket.tokens == pytest.approx(160.0, abs=0.1)
+
+    bucket.updated -= 3600 * 2
+    bucket.refill()
+    assert bucket.tokens == bucket.capacity
+
+
+def test_manual_calls_keep_the_reserve():
+    budget = RateBudget()
+    bucket = budget._bucket(KEY)
+    reserve = bucket.capacity * settings.nasa_rate_reserve_ratio
+    bucket.tokens = reserve + 1.2
+    acquire(budget)
+    assert bucket.tokens == pytest.approx(reserve + 0.2, abs=0.05)
+
+    with pytest.raises(RateBudgetExceeded) as exc_info:
+        acquire(budget)
+    assert exc_info.value.retry_after > settings.nasa_rate_max_wait
+    assert bucket.refused == 1
+
+
+def test_scheduled_calls_may_spend_the_reserve():
+    budget = RateBudget()
+    bucket = budget._bucket(KEY)
+    bucket.tokens = 1.5
+    acquire(budget, PRIORITY_SCHEDULED)
+    assert bucket.requests[PRIORITY_SCHEDULED] == 1
+
+    # Scheduled calls are refused at once rather than deferred
+    with pytest.raises(RateBudgetExceeded):
+        acquire(budget, PRIORITY_SCHEDULED)
+    assert bucket.deferred == 0
+
+
+def test_manual_call_waits_for_a_short_refill():
+    budget = RateBudget()
+    bucket = budget._bucket(KEY)
+    bucket.tokens = bucket.capacity * settings.nasa_rate_reserve_ratio + 0.9
+    acquire(budget)
+    assert bucket.deferred == 1
+    assert bucket.refused == 0
+
+
+def test_observe_syncs_with_upstream_headers():
+    budget = RateBudget()
+    bucket = budget._bucket(KEY)
+    budget.observe(
+        KEY,
+        httpx.Response(200, headers={"X-RateLimit-Limit": "2000", "X-RateLimit-Remaining": "42"}),
+    )
+    assert bucket.capacity == 2000
+    assert bucket.tokens == 42
+
+    budget.observe(KEY, httpx.Response(429))
+    assert bucket.tokens == 0
+    assert bucket.throttled == 1
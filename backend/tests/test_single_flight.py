@@ -0,0 +1,89 @@
+import asyncio
+
+from app.utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    async def main() -> list[int]:
+        flight = SingleFlight()
+        return await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+    assert asyncio.run(main()) == [1] * 5
+    assert calls == 1
+
+
+def test_exception_is_shared_and_not_retained():
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main() -> tuple[list, SingleFlight]:
+        flight = SingleFlight(min_interval=60)
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+        return results, flight
+
+    results, flight = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight._recent == {}
+
+
+def test_cancelled_caller_does_not_cancel_shared_work():
+    async def main() -> tuple[int, int]:
+        flight = SingleFlight()
+        started = asyncio.Event()
+
+        async def work() -> int:
+            started.set()
+            await asyncio.sleep(0.02)
+            return 42
+
+        first = asyncio.create_task(flight.do("k", work))
+        await started.wait()
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, len(flight._inflight)
+
+    assert asyncio.run(main()) == (42, 0)
+
+
+def test_results_not_retained_without_min_interval():
+    async def main() -> SingleFlight:
+        flight = SingleFlight()
+        for i in range(100):
+            await flight.do(i, lambda: asyncio.sleep(0, result=i))
+        return flight
+
+    flight = asyncio.run(main())
+    assert flight._recent == {}
+    assert flight._inflight == {}
+
+
+def test_min_interval_reuses_and_prunes_results():
+    async def main() -> tuple[list[int], SingleFlight]:
+        flight = SingleFlight(min_interval=0.05)
+        calls = []
+
+        async def work(key: int) -> int:
+            calls.append(key)
+            return key
+
+        await flight.do(1, lambda: work(1))
+        await flight.do(1, lambda: work(1))  # fresh, reused
+        await asyncio.sleep(0.06)
+        await flight.do(2, lambda: work(2))  # prunes the expired result of 1
+        return calls, flight
+
+    calls, flight = asyncio.run(main())
+    assert calls == [1, 2]
+    assert list(flight._recent) == [2]
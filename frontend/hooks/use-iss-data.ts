@@ -1,7 +1,7 @@
 "use client";
 
 import { useCallback, useEffect, useRef, useState } from "react";
-import { fetchAPI } from "@/lib/api";
+import { fetchAPI, subscribeEvents } from "@/lib/api";
 import type { ISSResponse, TrendResponse } from "@/lib/types";
 
 type ISSPosition = {
@@ -32,68 +32,82 @@ export function useISSData(): UseISSDataReturn {
   const [error, setError] = useState<string | null>(null);
   const lastTimestampRef = useRef<number | null>(null);
 
+  const applyLast = useCallback((lastPosition: ISSResponse): void => {
+    if (!lastPosition?.payload) {
+      return;
+    }
+
+    const payload = lastPosition.payload;
+    const newPosition: ISSPosition = {
+      latitude: payload.latitude,
+      longitude: payload.longitude,
+      altitude: payload.altitude,
+      velocity: payload.velocity,
+      timestamp: payload.timestamp
+        ? new Date(payload.timestamp * 1000).toISOString()
+        : new Date().toISOString(),
+      visibility: payload.visibility,
+    };
+
+    setPosition(newPosition);
+
+    // Add to history if timestamp is different
+    const currentTimestamp = payload.timestamp;
+    if (currentTimestamp && currentTimestamp !== lastTimestampRef.current) {
+      lastTimestampRef.current = currentTimestamp;
+      setHistory((prev) => {
+        const updated = [...prev, newPosition];
+        // Keep only last N points
+        if (updated.length > MAX_HISTORY_POINTS) {
+          return updated.slice(-MAX_HISTORY_POINTS);
+        }
+        return updated;
+      });
+    }
+  }, []);
+
+  const fetchTrend = useCallback(async (): Promise<void> => {
+    const trendData = await fetchAPI<TrendResponse>("/iss/trend");
+    setTrend(trendData);
+  }, []);
+
   const refetch = useCallback(async (): Promise<void> => {
     setLoading(true);
     setError(null);
 
     try {
       // Fetch ISS last position
-      const lastPosition = await fetchAPI<ISSResponse>("/last");
-
-      if (lastPosition?.payload) {
-        const payload = lastPosition.payload;
-        const newPosition: ISSPosition = {
-          latitude: payload.latitude,
-          longitude: payload.longitude,
-          altitude: payload.altitude,
-          velocity: payload.velocity,
-          timestamp: payload.timestamp
-            ? new Date(payload.timestamp * 1000).toISOString()
-            : new Date().toISOString(),
-          visibility: payload.visibility,
-        };
-
-        setPosition(newPosition);
-
-        // Add to history if timestamp is different
-        const currentTimestamp = payload.timestamp;
-        if (currentTimestamp && currentTimestamp !== lastTimestampRef.current) {
-          lastTimestampRef.current = currentTimestamp;
-          setHistory((prev) => {
-            const updated = [...prev, newPosition];
-            // Keep only last N points
-            if (updated.length > MAX_HISTORY_POINTS) {
-              return updated.slice(-MAX_HISTORY_POINTS);
-            }
-            return updated;
-          });
-        }
-      }
+      applyLast(await fetchAPI<ISSResponse>("/last"));
 
       // Fetch ISS trend
-      const trendData = await fetchAPI<TrendResponse>("/iss/trend");
-      setTrend(trendData);
+      await fetchTrend();
     } catch (err) {
       setError(err instanceof Error ? err.message : "Ошибка загрузки данных МКС");
     } finally {
       setLoading(false);
     }
-  }, []);
+  }, [applyLast, fetchTrend]);
 
   useEffect(() => {
     // Initial fetch
     refetch();
 
-    // Set up polling interval (15 seconds)
-    const interval = setInterval(() => {
-      refetch();
-    }, 15_000);
+    // New samples are pushed by the server instead of polling
+    const unsubscribe = subscribeEvents(["iss"], {
+      iss: (data) => {
+        applyLast(data as ISSResponse);
+        fetchTrend().catch((err) => {
+          setError(err instanceof Error ? err.message : "Ошибка загрузки данных МКС");
+        });
+      },
+      resync: () => {
+        refetch();
+      },
+    });
 
     // Cleanup on unmount
-    return () => {
-      clearInterval(interval);
-    };
-  }, [refetch]);
+    return unsubscribe;
+  }, [refetch, applyLast, fetchTrend]);
 
   return {
     position,
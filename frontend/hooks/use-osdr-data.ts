@@ -1,7 +1,7 @@
 "use client";
 
-import { useCallback, useState } from "react";
-import { fetchAPI } from "@/lib/api";
+import { useCallback, useEffect, useRef, useState } from "react";
+import { fetchAPI, subscribeEvents } from "@/lib/api";
 import type { OSDRListResponse } from "@/lib/types";
 
 type UseOSDRDataReturn = {
@@ -16,9 +16,11 @@ export function useOSDRData(): UseOSDRDataReturn {
   const [items, setItems] = useState<OSDRListResponse | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const lastQueryRef = useRef<{ page: number; pageSize: number } | null>(null);
 
   const refetch = useCallback(
     async (page = 1, pageSize = 10): Promise<void> => {
+      lastQueryRef.current = { page, pageSize };
       setLoading(true);
       setError(null);
 
@@ -52,6 +54,17 @@ export function useOSDRData(): UseOSDRDataReturn {
     }
   }, [refetch]);
 
+  useEffect(() => {
+    // Reload the current page when a sync wrote items, once it was loaded
+    const reload = () => {
+      const query = lastQueryRef.current;
+      if (query) {
+        refetch(query.page, query.pageSize);
+      }
+    };
+    return subscribeEvents(["osdr"], { osdr: reload, resync: reload });
+  }, [refetch]);
+
   return {
     items,
     loading,
@@ -1,7 +1,7 @@
 "use client";
 
 import { useCallback, useEffect, useState } from "react";
-import { fetchAPI } from "@/lib/api";
+import { fetchAPI, subscribeEvents } from "@/lib/api";
 import type { SpaceSummaryResponse } from "@/lib/types";
 
 type UseSpaceDataReturn = {
@@ -46,6 +46,16 @@ export function useSpaceData(): UseSpaceDataReturn {
 
   useEffect(() => {
     refetch();
+
+    // Reload the summary only when the server reports a new cache row
+    return subscribeEvents(["space"], {
+      space: () => {
+        refetch();
+      },
+      resync: () => {
+        refetch();
+      },
+    });
   }, [refetch]);
 
   return {
@@ -18,3 +18,37 @@ export async function fetchAPI<T>(
 
   return res.json();
 }
+
+export type EventTopic = "iss" | "space" | "osdr";
+
+type EventHandlers = Partial<
+  Record<EventTopic | "resync", (data: unknown) => void>
+>;
+
+/**
+ * Subscribe to server-sent data updates from `/events`.
+ * EventSource reconnects on its own and resumes from the last event id;
+ * `resync` means updates were missed and data should be reloaded.
+ * Returns a function that closes the stream.
+ */
+export function subscribeEvents(
+  topics: EventTopic[],
+  handlers: EventHandlers
+): () => void {
+  const source = new EventSource(
+    `${API_URL}/events?topics=${topics.join(",")}`
+  );
+
+  for (const [name, handler] of Object.entries(handlers)) {
+    if (!handler) {
+      continue;
+    }
+    source.addEventListener(name, (event) => {
+      handler(JSON.parse((event as MessageEvent<string>).data));
+    });
+  }
+
+  return () => {
+    source.close();
+  };
+}